@@ -103,6 +103,7 @@ async function showDashboard() {
     loginScreen.style.display = 'none';
     dashboard.style.display = 'block';
     await renderAdminProjects();
+    openChangeStream();
     await loadResumeStatus();
 }
 
@@ -124,6 +125,7 @@ document.getElementById('logout-btn').addEventListener('click', async () => {
             console.error('Logout error:', error);
         }
     }
+    closeChangeStream();
     sessionToken = null;
     sessionStorage.removeItem('portfolio_admin_token');
     location.reload();
@@ -134,26 +136,56 @@ const projectForm = document.getElementById('project-form');
 const projectsListContainer = document.getElementById('projects-list-container');
 const submitBtn = document.getElementById('submit-project');
 const cancelBtn = document.getElementById('cancel-edit');
+const saveOrderBtn = document.getElementById('save-order');
 
+// Version of the list as loaded; writes send it so a stale tab gets a 409
+// instead of overwriting someone else's changes
+let projectsVersion = null;
+let projectOrder = [];
+
+// The list only shows titles and descriptions, so fetch just those, page by page
 async function getProjects() {
+    const projects = [];
+    let cursor = null;
     try {
-        const response = await fetch(`${API_URL}/projects`);
-        const data = await response.json();
-        if (data.success) {
-            return data.projects;
-        }
-        return [];
+        do {
+            const params = new URLSearchParams({ fields: 'id,title,desc,position', limit: '100' });
+            if (cursor) params.set('cursor', cursor);
+            const response = await fetch(`${API_URL}/projects?${params}`);
+            const data = await response.json();
+            if (!data.success) break;
+            if (!cursor) projectsVersion = data.version;
+            projects.push(...data.projects);
+            cursor = data.next_cursor;
+        } while (cursor);
     } catch (error) {
         console.error('Error fetching projects:', error);
-        return [];
+    }
+    return projects;
+}
+
+async function getProject(id) {
+    try {
+        const response = await fetch(`${API_URL}/projects/${id}`);
+        const data = await response.json();
+        return data.success ? data.project : null;
+    } catch (error) {
+        console.error('Error fetching project:', error);
+        return null;
     }
 }
 
 async function renderAdminProjects() {
     const projects = await getProjects();
+    projectOrder = projects;
+    saveOrderBtn.style.display = 'none';
+    drawProjectList();
+}
+
+function drawProjectList() {
     projectsListContainer.innerHTML = '';
 
-    projects.forEach(project => {
+    projectOrder.forEach((project, index) => {
         const item = document.createElement('div');
         item.className = 'admin-project-item';
         item.innerHTML = `
@@ -162,12 +194,144 @@ async function renderAdminProjects() {
             <div class="admin-actions">
                 <button class="action-btn edit-btn" onclick="editProject(${project.id})">Edit</button>
                 <button class="action-btn delete-btn" onclick="deleteProject(${project.id})">Delete</button>
+                <button class="action-btn move-btn" onclick="moveProject(${index}, -1)" ${index === 0 ? 'disabled' : ''}>&uarr;</button>
+                <button class="action-btn move-btn" onclick="moveProject(${index}, 1)" ${index === projectOrder.length - 1 ? 'disabled' : ''}>&darr;</button>
             </div>
         `;
         projectsListContainer.appendChild(item);
     });
 }
 
+// Delta sync: apply what changed since projectsVersion instead of reloading
+// the list. Deltas come from the SSE stream (edits in other tabs) and from
+// syncProjects() after this tab's own writes; old or repeated ones are no-ops.
+function applyChanges(delta) {
+    if (delta.reset) return renderAdminProjects();
+    if (projectsVersion !== null && delta.version <= projectsVersion) return;
+    const replaced = new Set([...delta.deleted, ...delta.changed.map(p => p.id)]);
+    projectOrder = projectOrder
+        .filter(p => !replaced.has(p.id))
+        .concat(delta.changed)
+        .sort((a, b) => a.position - b.position || a.id - b.id);
+    projectsVersion = delta.version;
+    saveOrderBtn.style.display = 'none';
+    drawProjectList();
+}
+
+async function syncProjects() {
+    try {
+        const response = await fetch(`${API_URL}/projects/changes?since=${projectsVersion}`);
+        if (!response.ok) throw new Error('Sync failed');
+        await applyChanges(await response.json());
+    } catch (error) {
+        console.error('Error syncing projects:', error);
+        await renderAdminProjects();
+    }
+}
+
+// The stream needs the session header, which EventSource cannot send, so it
+// is read with fetch. At most one is open; opening another closes the first.
+let changeStream = null;
+
+function openChangeStream() {
+    closeChangeStream();
+    if (!sessionToken || projectsVersion === null || !window.TextDecoderStream) return;
+    changeStream = new AbortController();
+    readChangeStream(changeStream.signal);
+}
+
+function closeChangeStream() {
+    if (changeStream) changeStream.abort();
+    changeStream = null;
+}
+
+function parseServerSentEvent(block) {
+    const event = { type: 'message', id: null, data: '' };
+    for (const line of block.split('\n')) {
+        const colon = line.indexOf(':');
+        if (colon === 0) continue;  // Comment (keepalive)
+        const field = colon === -1 ? line : line.slice(0, colon);
+        const value = colon === -1 ? '' : line.slice(colon + 1).replace(/^ /, '');
+        if (field === 'event') event.type = value;
+        else if (field === 'id') event.id = value;
+        else if (field === 'data') event.data += value;
+    }
+    return event;
+}
+
+async function readChangeStream(signal) {
+    let since = projectsVersion;
+    while (!signal.aborted) {
+        try {
+            const response = await fetch(`${API_URL}/projects/changes/stream?since=${since}`, {
+                headers: { 'X-Session-Token': sessionToken },
+                signal
+            });
+            if (response.status === 401) return;  // Session expired
+            if (!response.ok) throw new Error(`Change stream failed: ${response.status}`);
+            const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+            let buffer = '';
+            for (;;) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffer += value;
+                let end;
+                while ((end = buffer.indexOf('\n\n')) !== -1) {
+                    const event = parseServerSentEvent(buffer.slice(0, end));
+                    buffer = buffer.slice(end + 2);
+                    if (event.id) since = event.id;
+                    if (event.type === 'changes') applyChanges(JSON.parse(event.data));
+                    else if (event.type === 'reset') await renderAdminProjects();
+                }
+            }
+        } catch (error) {
+            if (signal.aborted) return;
+            console.error('Change stream error:', error);
+        }
+        // The server ends streams after SSE_MAX_STREAM_SECONDS; resume from the last event
+        await new Promise(resolve => setTimeout(resolve, 3000));
+    }
+}
+
+// Every admin write goes through /projects/batch: one request, one transaction
+async function sendBatch(batch) {
+    const response = await fetch(`${API_URL}/projects/batch`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'X-Session-Token': sessionToken
+        },
+        body: JSON.stringify({ ...batch, expected_version: projectsVersion })
+    });
+    if (response.status === 409) {
+        alert('Projects were changed elsewhere. The list has been reloaded; please try again.');
+        await renderAdminProjects();
+        return null;
+    }
+    if (!response.ok) throw new Error('Batch failed');
+    return response.json();
+}
+
+// Reordering is local until "Save order" sends it as one batch
+window.moveProject = (index, step) => {
+    const target = index + step;
+    if (target < 0 || target >= projectOrder.length) return;
+    [projectOrder[index], projectOrder[target]] = [projectOrder[target], projectOrder[index]];
+    saveOrderBtn.style.display = 'inline-block';
+    drawProjectList();
+};
+
+saveOrderBtn.addEventListener('click', async () => {
+    try {
+        if (await sendBatch({ order: projectOrder.map(p => p.id) })) {
+            await syncProjects();
+        }
+    } catch (error) {
+        console.error('Error saving order:', error);
+        alert('Failed to save order. Please try again.');
+    }
+});
+
 // Project Image Handling Removed
 
 
@@ -188,30 +352,11 @@ projectForm.addEventListener('submit', async (e) => {
     };
 
     try {
-        if (id) {
-            // Update
-            const response = await fetch(`${API_URL}/projects/${id}`, {
-                method: 'PUT',
-                headers: {
-                    'Content-Type': 'application/json',
-                    'X-Session-Token': sessionToken
-                },
-                body: JSON.stringify(projectData)
-            });
-            if (!response.ok) throw new Error('Update failed');
-        } else {
-            // Add
-            const response = await fetch(`${API_URL}/projects`, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                    'X-Session-Token': sessionToken
-                },
-                body: JSON.stringify(projectData)
-            });
-            if (!response.ok) throw new Error('Create failed');
-        }
-        await renderAdminProjects();
+        const operation = id
+            ? { op: 'update', id: Number(id), project: projectData }
+            : { op: 'create', project: projectData };
+        if (!await sendBatch({ operations: [operation] })) return;
+        await syncProjects();
         projectForm.reset();
         resetFormState();
     } catch (error) {
@@ -221,8 +366,7 @@ projectForm.addEventListener('submit', async (e) => {
 });
 
 window.editProject = async (id) => {
-    const projects = await getProjects();
-    const project = projects.find(p => p.id == id);
+    const project = await getProject(id);
 
     if (!project) {
         alert('Project not found');
@@ -244,16 +388,8 @@ window.deleteProject = async (id) => {
     if (!confirm('Are you sure you want to delete this project?')) return;
     
     try {
-        const response = await fetch(`${API_URL}/projects/${id}`, {
-            method: 'DELETE',
-            headers: {
-                'X-Session-Token': sessionToken
-            }
-        });
-        if (response.ok) {
-            await renderAdminProjects();
-        } else {
-            throw new Error('Delete failed');
+        if (await sendBatch({ operations: [{ op: 'delete', id }] })) {
+            await syncProjects();
         }
     } catch (error) {
         console.error('Error deleting project:', error);
@@ -305,36 +441,29 @@ async function handleResumeUpload(file) {
         return;
     }
 
-    const reader = new FileReader();
-    reader.onload = async (e) => {
-        const base64Resume = e.target.result;
-        try {
-            const response = await fetch(`${API_URL}/resume`, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                    'X-Session-Token': sessionToken
-                },
-                body: JSON.stringify({
-                    success: true,
-                    message: 'Resume upload',
-                    data: base64Resume
-                })
-            });
-            const data = await response.json();
-            if (response.ok && data.success) {
-                resumeStatus.textContent = `Resume uploaded successfully: ${file.name}`;
-                resumeStatus.className = 'status-text status-success';
-            } else {
-                throw new Error('Upload failed');
-            }
-        } catch (error) {
-            console.error('Error uploading resume:', error);
-            resumeStatus.textContent = 'Failed to upload resume. Please try again.';
-            resumeStatus.className = 'status-text error-text';
+    // Sent as multipart/form-data; the browser streams the file and sets the boundary
+    const formData = new FormData();
+    formData.append('file', file);
+    try {
+        const response = await fetch(`${API_URL}/resume`, {
+            method: 'POST',
+            headers: {
+                'X-Session-Token': sessionToken
+            },
+            body: formData
+        });
+        const data = await response.json();
+        if (response.ok && data.success) {
+            resumeStatus.textContent = `Resume uploaded successfully: ${file.name}`;
+            resumeStatus.className = 'status-text status-success';
+        } else {
+            throw new Error(data.detail || 'Upload failed');
         }
-    };
-    reader.readAsDataURL(file);
+    } catch (error) {
+        console.error('Error uploading resume:', error);
+        resumeStatus.textContent = 'Failed to upload resume. Please try again.';
+        resumeStatus.className = 'status-text error-text';
+    }
 }
 
 async function loadResumeStatus() {
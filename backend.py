@@ -1,25 +1,70 @@
-from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Header, Query
+from fastapi import FastAPI, HTTPException, Header, Query, Request, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware import Middleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, HTMLResponse, Response
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response, StreamingResponse
+from starlette.datastructures import Headers, MutableHeaders
 from pydantic import BaseModel, EmailStr
-from typing import Optional, List
+from python_multipart import MultipartParser
+from python_multipart.multipart import parse_options_header
+from typing import Optional, List, NamedTuple, Literal, Union
 import os
-import resend
+import sys
 import json
+import re
+import html
 import base64
+import hashlib
+import gzip
 from pathlib import Path
 from dotenv import load_dotenv
 import secrets
-from sqlalchemy import create_engine, Column, Integer, String, Text, select, text
+import math
+import tempfile
+from sqlalchemy import create_engine, event, Column, Integer, Float, String, Text, LargeBinary, DateTime, ForeignKey, Index, select, text, bindparam, func, cast, case, or_, and_, inspect
+from sqlalchemy import insert as insert_stmt, update as update_stmt, delete as delete_stmt
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
-import subprocess
-from datetime import datetime
+from sqlalchemy.pool import QueuePool
+import threading
+import asyncio
+import random
+from contextlib import asynccontextmanager, contextmanager
+import time
+from collections import OrderedDict, defaultdict, deque
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone, timedelta
+from email.utils import formatdate, parsedate_to_datetime
+
+IMPORT_STARTED = time.perf_counter()
 
 # Load environment variables
 load_dotenv()
 
-app = FastAPI(title="Portfolio API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run startup work and background workers for the lifetime of the app"""
+    # Schema/migration work runs in the background so health checks are
+    # answered immediately; DB-backed routes wait for it (see ensure_database_ready)
+    startup = asyncio.create_task(run_startup_tasks())
+    email_worker = asyncio.create_task(run_email_worker())
+    session_evictor = asyncio.create_task(run_session_evictor())
+    try:
+        yield
+    finally:
+        change_feed.close()
+        for task in (session_evictor, email_worker, startup):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        # Closing every pooled connection also checkpoints SQLite's WAL back into the main file
+        engine.dispose()
+
+app = FastAPI(title="Portfolio API", lifespan=lifespan)
 
 # Get the directory where this script is located
 BASE_DIR = Path(__file__).parent
@@ -33,6 +78,214 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# On-the-fly compression for JSON API responses only; static text assets are
+# precompressed at startup (see precompress_static_assets) instead
+API_GZIP_MIN_SIZE = int(os.getenv("API_GZIP_MIN_SIZE", "1024"))
+API_GZIP_LEVEL = int(os.getenv("API_GZIP_LEVEL", "5"))  # Bounded CPU per response
+API_COMPRESSION_EXCLUDED_PATHS = {"/api/resume/AtharvaZ"}
+
+# Bodies that are compressed already (backup downloads, images) pass through as is
+API_PRECOMPRESSED_TYPES = ("application/gzip", "application/x-gzip", "application/zip", "image/", "audio/", "video/")
+
+def gzip_etag(etag: str) -> str:
+    """The gzip representation's own strong validator, as serve_bodies names it"""
+    return f'{etag[:-1]}-gzip"' if etag.endswith('"') else etag
+
+class APICompressionMiddleware:
+    """
+    Route /api/* requests through GZipMiddleware, everything else straight
+    through. Compressed responses get a `-gzip` ETag, and If-None-Match
+    carrying that ETag is translated back for the route, which only knows
+    the identity ETag.
+    """
+    def __init__(self, app, minimum_size: int, compresslevel: int):
+        self.app = app
+        self.gzip_app = GZipMiddleware(self.inspect_response, minimum_size=minimum_size, compresslevel=compresslevel)
+
+    async def inspect_response(self, scope, receive, send):
+        """Runs inside GZipMiddleware: note responses it must leave alone"""
+        state = scope["api_compression"]
+
+        async def send_inspected(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+                if "content-encoding" in headers:
+                    state["encoded_upstream"] = True
+                elif media_type.startswith(API_PRECOMPRESSED_TYPES):
+                    # GZipMiddleware skips encoded bodies; the marker is removed again on the way out
+                    headers["content-encoding"] = "identity"
+                    state["marked"] = True
+            await send(message)
+
+        await self.app(scope, receive, send_inspected)
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if scope["type"] != "http" or not path.startswith("/api/") or path in API_COMPRESSION_EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        state = {"gzip_tags": set()}
+        request_headers = Headers(scope=scope)
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match and "gzip" in request_headers.get("accept-encoding", ""):
+            tags = []
+            for tag in if_none_match.split(","):
+                tag = tag.strip()
+                if tag.endswith('-gzip"'):
+                    tag = tag[:-len('-gzip"')] + '"'
+                    state["gzip_tags"].add(tag.removeprefix("W/"))
+                tags.append(tag)
+            raw = [(k, v) for k, v in scope["headers"] if k != b"if-none-match"]
+            raw.append((b"if-none-match", ", ".join(tags).encode("latin-1")))
+            scope = {**scope, "headers": raw}
+        scope = {**scope, "api_compression": state}
+
+        async def send_tagged(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                if state.get("marked"):
+                    del headers["content-encoding"]
+                etag = headers.get("etag")
+                if etag and not state.get("encoded_upstream"):
+                    not_modified_gzip = message["status"] == 304 and etag.removeprefix("W/") in state["gzip_tags"]
+                    if headers.get("content-encoding") == "gzip" or not_modified_gzip:
+                        headers["etag"] = gzip_etag(etag)
+            await send(message)
+
+        await self.gzip_app(scope, receive, send_tagged)
+
+app.add_middleware(APICompressionMiddleware, minimum_size=API_GZIP_MIN_SIZE, compresslevel=API_GZIP_LEVEL)
+
+# ============================================
+# METRICS
+# ============================================
+
+# Request, DB query and email send metrics in Prometheus text format, served
+# at /api/admin/metrics. Counters are per process: with WEB_CONCURRENCY > 1
+# each scrape sees the worker that answered it.
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SQL_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "PRAGMA", "BEGIN", "COMMIT", "ROLLBACK", "CREATE"}
+
+class Histogram:
+    """Cumulative-bucket histogram (bucket i counts observations <= LATENCY_BUCKETS[i])"""
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+def escape_label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{escape_label_value(v)}"' for k, v in labels.items()) + "}"
+
+class MetricsRegistry:
+    """Thread-safe counters and histograms keyed by label tuples"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.requests = defaultdict(int)                  # (method, route, status) -> count
+        self.request_latency = defaultdict(Histogram)     # (method, route) -> Histogram
+        self.db_queries = defaultdict(int)                # operation -> count
+        self.db_latency = defaultdict(Histogram)          # operation -> Histogram
+        self.email_sends = defaultdict(int)               # (transport, outcome) -> count
+        self.email_latency = defaultdict(Histogram)       # transport -> Histogram
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float):
+        with self._lock:
+            self.requests[(method, route, str(status))] += 1
+            self.request_latency[(method, route)].observe(seconds)
+
+    def observe_query(self, operation: str, seconds: float):
+        with self._lock:
+            self.db_queries[operation] += 1
+            self.db_latency[operation].observe(seconds)
+
+    def observe_email(self, transport: str, outcome: str, seconds: float):
+        with self._lock:
+            self.email_sends[(transport, outcome)] += 1
+            self.email_latency[transport].observe(seconds)
+
+    @staticmethod
+    def _histogram_lines(name: str, histograms: dict, label_names: tuple) -> List[str]:
+        lines = [f"# TYPE {name} histogram"]
+        for key, hist in sorted(histograms.items()):
+            labels = dict(zip(label_names, key if isinstance(key, tuple) else (key,)))
+            cumulative = 0
+            for bound, count in zip(hist.buckets + ("+Inf",), hist.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{format_labels({**labels, 'le': bound})} {cumulative}")
+            lines.append(f"{name}_sum{format_labels(labels)} {hist.sum:.6f}")
+            lines.append(f"{name}_count{format_labels(labels)} {hist.count}")
+        return lines
+
+    def render(self, extra: dict) -> str:
+        """Prometheus text exposition; `extra` adds process-level values (names ending in _total are counters)"""
+        with self._lock:
+            lines = [
+                "# TYPE http_requests_in_flight gauge",
+                f"http_requests_in_flight {self.in_flight}",
+                "# TYPE http_requests_total counter",
+            ]
+            for (method, route, status), count in sorted(self.requests.items()):
+                lines.append(f"http_requests_total{format_labels({'method': method, 'route': route, 'status': status})} {count}")
+            lines += self._histogram_lines("http_request_duration_seconds", self.request_latency, ("method", "route"))
+            lines.append("# TYPE db_queries_total counter")
+            for operation, count in sorted(self.db_queries.items()):
+                lines.append(f"db_queries_total{format_labels({'operation': operation})} {count}")
+            lines += self._histogram_lines("db_query_duration_seconds", self.db_latency, ("operation",))
+            lines.append("# TYPE email_sends_total counter")
+            for (transport, outcome), count in sorted(self.email_sends.items()):
+                lines.append(f"email_sends_total{format_labels({'transport': transport, 'outcome': outcome})} {count}")
+            lines += self._histogram_lines("email_send_duration_seconds", self.email_latency, ("transport",))
+        for name, value in extra.items():
+            if value is not None:
+                lines.append(f"# TYPE {name} {'counter' if name.endswith('_total') else 'gauge'}")
+                lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry()
+
+class MetricsMiddleware:
+    """Record in-flight count, status and latency per route template (not raw path, to bound cardinality)"""
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        metrics.in_flight += 1  # Only touched on the event loop thread
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.in_flight -= 1
+            # Requests rejected before routing (rate limits) label themselves
+            route = getattr(scope.get("route"), "path", None) or scope.get("metrics_route", "unmatched")
+            metrics.observe_request(scope["method"], route, status, time.perf_counter() - started)
+
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Database Configuration
 DB_PATH = os.getenv("DB_PATH", "portfolio.db")
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -44,11 +297,127 @@ if not DATABASE_URL:
     # Fallback to SQLite
     DATABASE_URL = f"sqlite:///{DB_PATH}"
 
+# Engine tuning (all optional)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # Seconds; -1 disables
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(64 * 1024 * 1024)))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+class PoolMetrics:
+    """Connection pool counters, including how long checkouts waited for a free connection"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def increment(self, counter: str):
+        """Bump connects/checkouts/checkins; pool events fire on many threads"""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+                "checked_out": engine.pool.checkedout() if isinstance(engine.pool, QueuePool) else None,
+                "pool_size": engine.pool.size() if isinstance(engine.pool, QueuePool) else None
+            }
+
+pool_metrics = PoolMetrics()
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times how long each checkout waits for a connection"""
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except Exception:
+            timed_out = True
+            raise
+        finally:
+            pool_metrics.record_wait(time.perf_counter() - start, timed_out)
+
+def build_engine(url: str):
+    pool_args = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+    if not url.startswith("sqlite"):
+        return create_engine(url, **pool_args)
+
+    if ":memory:" in url or url in ("sqlite://", "sqlite:///"):
+        # In-memory databases live in a single connection; keep SQLAlchemy's default pool
+        return create_engine(url, connect_args={"check_same_thread": False})
+
+    sqlite_engine = create_engine(url, connect_args={"check_same_thread": False}, **pool_args)
+
+    @event.listens_for(sqlite_engine, "connect")
+    def apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+            cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+            cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+            cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        finally:
+            cursor.close()
+
+    return sqlite_engine
+
 # SQLAlchemy Setup
-if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-else:
-    engine = create_engine(DATABASE_URL)
+engine = build_engine(DATABASE_URL)
+
+@event.listens_for(engine, "connect")
+def count_connect(dbapi_connection, connection_record):
+    pool_metrics.increment("connects")
+
+@event.listens_for(engine, "checkout")
+def count_checkout(dbapi_connection, connection_record, connection_proxy):
+    pool_metrics.increment("checkouts")
+
+@event.listens_for(engine, "checkin")
+def count_checkin(dbapi_connection, connection_record):
+    pool_metrics.increment("checkins")
+
+if METRICS_ENABLED:
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def record_query(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_metrics_started", None)
+        if started is None:
+            return
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+        metrics.observe_query(operation if operation in SQL_OPERATIONS else "OTHER", time.perf_counter() - started)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
@@ -61,14 +430,277 @@ class ProjectModel(Base):
     desc = Column(Text, nullable=False)
     tech = Column(Text, nullable=False)  # Stored as JSON string
     links = Column(Text, nullable=False) # Stored as JSON string
+    position = Column(Integer, nullable=False, default=0, server_default="0", index=True)  # Display order, 1-based; 0 = not yet assigned
+    updated_version = Column(Integer, nullable=False, default=0, server_default="0", index=True)  # projects_version of the row's last change
+
+class ProjectTechModel(Base):
+    """One row per technology of a project, so projects can be filtered by tech in SQL"""
+    __tablename__ = "project_tech"
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    position = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    name_key = Column(String, nullable=False)  # Lower-cased name, what filters match on
+    __table_args__ = (Index("ix_project_tech_name_key", "name_key", "project_id"),)
+
+def replace_project_tech(db: Session, project_id: int, tech: List[str]):
+    """Rewrite a project's project_tech rows (caller commits)"""
+    db.query(ProjectTechModel).filter(ProjectTechModel.project_id == project_id).delete(synchronize_session=False)
+    for position, name in enumerate(tech):
+        db.add(ProjectTechModel(project_id=project_id, position=position, name=name, name_key=name.strip().lower()))
+
+class ProjectTombstoneModel(Base):
+    """Ids of deleted projects, so the change feed can report deletions"""
+    __tablename__ = "project_tombstones"
+    project_id = Column(Integer, primary_key=True)
+    deleted_version = Column(Integer, nullable=False, index=True)
+
+def record_project_deletions(db: Session, project_ids: List[int], version: int):
+    """
+    Tombstone deleted projects at `version` and drop tombstones that fell
+    out of the change feed's retention window (caller commits)
+    """
+    if not project_ids:
+        return
+    db.execute(delete_stmt(ProjectTombstoneModel).where(or_(
+        ProjectTombstoneModel.project_id.in_(project_ids),
+        ProjectTombstoneModel.deleted_version <= version - CHANGES_RETENTION_VERSIONS
+    )))
+    db.execute(insert_stmt(ProjectTombstoneModel), [{"project_id": pid, "deleted_version": version} for pid in project_ids])
+
+def next_project_position(db: Session) -> int:
+    return (db.execute(select(func.max(ProjectModel.position))).scalar() or 0) + 1
+
+def rows_fingerprint(rows) -> str:
+    """Digest of an ordered row stream, to tell whether a derived index matches its source"""
+    digest = hashlib.sha256()
+    for row in rows:
+        digest.update(json.dumps(list(row), ensure_ascii=False).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+def sync_project_tech():
+    """
+    Backfill project_tech from the JSON tech column when the two disagree
+    (first run after upgrading, rows copied by the SQLite migration, or
+    tech edited outside the app).
+    """
+    db = SessionLocal()
+    try:
+        indexed = rows_fingerprint(
+            db.query(ProjectTechModel.project_id, ProjectTechModel.name)
+            .order_by(ProjectTechModel.project_id, ProjectTechModel.position)
+            .yield_per(1000)
+        )
+        expected = rows_fingerprint(
+            (project_id, name)
+            for project_id, tech in db.query(ProjectModel.id, ProjectModel.tech).order_by(ProjectModel.id).yield_per(1000)
+            for name in json.loads(tech)
+        )
+        if indexed == expected:
+            return
+        db.query(ProjectTechModel).delete(synchronize_session=False)
+        rebuilt = 0
+        for project_id, tech in db.query(ProjectModel.id, ProjectModel.tech).yield_per(500):
+            replace_project_tech(db, project_id, json.loads(tech))
+            rebuilt += 1
+        db.commit()
+        print(f"Project tech index: rebuilt for {rebuilt} projects")
+    except Exception as e:
+        db.rollback()
+        print(f"Project tech index error: {e}")
+    finally:
+        db.close()
+
+# Full-text search index over title, tech and desc. SQLite keeps it in an
+# FTS5 table (rowid = project id) that write paths refresh through
+# index_project_search(); Postgres uses a GIN expression index that the
+# database maintains itself. Both tokenize without stemming so prefix
+# queries behave the same on either backend. SQLite builds without FTS5
+# fall back to LIKE matching (see search_projects).
+SEARCH_FTS_TABLE = "projects_fts"
+SEARCH_PG_INDEX = "ix_projects_search"
+SEARCH_PG_DOCUMENT = (
+    "setweight(to_tsvector('simple', title), 'A') || "
+    "setweight(to_tsvector('simple', tech), 'B') || "
+    "setweight(to_tsvector('simple', \"desc\"), 'C')"
+)
+
+search_fts_available = False  # Set by detect_project_search() in every process
+
+def detect_project_search():
+    """Record whether this process can use the FTS5 table (it may be missing or unsupported)"""
+    global search_fts_available
+    if engine.dialect.name == "postgresql":
+        return
+    try:
+        with engine.connect() as conn:
+            conn.execute(text(f"SELECT rowid FROM {SEARCH_FTS_TABLE} LIMIT 0"))
+        search_fts_available = True
+    except Exception as e:
+        search_fts_available = False
+        print(f"Project search: full-text index unavailable, using LIKE matching ({e})")
+
+def index_project_search(db: Session, project_ids: List[int]):
+    """Re-index the given projects (deleted ones drop out); caller commits"""
+    if not search_fts_available or not project_ids:
+        return
+    db.flush()
+    ids = {"ids": list(project_ids)}
+    db.execute(text(f"DELETE FROM {SEARCH_FTS_TABLE} WHERE rowid IN :ids").bindparams(bindparam("ids", expanding=True)), ids)
+    db.execute(text(
+        f'INSERT INTO {SEARCH_FTS_TABLE} (rowid, title, tech, "desc") '
+        'SELECT id, title, tech, "desc" FROM projects WHERE id IN :ids'
+    ).bindparams(bindparam("ids", expanding=True)), ids)
+
+def sync_project_search():
+    """Create the search index if missing and rebuild it when it is out of step with projects"""
+    try:
+        with engine.begin() as conn:
+            if engine.dialect.name == "postgresql":
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS {SEARCH_PG_INDEX} ON projects USING GIN (({SEARCH_PG_DOCUMENT}))"))
+                return
+            conn.execute(text(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_FTS_TABLE} USING fts5('
+                'title, tech, "desc", tokenize="unicode61 remove_diacritics 2", prefix="2 3")'
+            ))
+            # Writes made while the index was unavailable, or edits outside the app, leave it stale
+            indexed = rows_fingerprint(conn.execute(text(f'SELECT rowid, title, tech, "desc" FROM {SEARCH_FTS_TABLE} ORDER BY rowid')))
+            expected = rows_fingerprint(conn.execute(text('SELECT id, title, tech, "desc" FROM projects ORDER BY id')))
+            if indexed == expected:
+                return
+            conn.execute(text(f"DELETE FROM {SEARCH_FTS_TABLE}"))
+            result = conn.execute(text(f'INSERT INTO {SEARCH_FTS_TABLE} (rowid, title, tech, "desc") SELECT id, title, tech, "desc" FROM projects'))
+            print(f"Project search index: rebuilt for {result.rowcount} projects")
+    except Exception as e:
+        # e.g. SQLite built without FTS5; detect_project_search() switches to LIKE matching
+        print(f"Project search index error: {e}")
 
 class SiteConfigModel(Base):
     __tablename__ = "site_config"
     key = Column(String, primary_key=True, index=True)
     value = Column(Text, nullable=True)
 
-# Initialize Tables
-Base.metadata.create_all(bind=engine)
+PROJECTS_VERSION_KEY = "projects_version"
+
+def bump_projects_version(db: Session) -> int:
+    """Atomically increment the persisted project list version (caller commits)"""
+    row = db.execute(
+        update_stmt(SiteConfigModel)
+        .where(SiteConfigModel.key == PROJECTS_VERSION_KEY)
+        .values(value=cast(cast(SiteConfigModel.value, Integer) + 1, Text))
+        .returning(SiteConfigModel.value)
+    ).first()
+    if row is not None:
+        return int(row[0])
+    db.add(SiteConfigModel(key=PROJECTS_VERSION_KEY, value="1"))
+    db.flush()
+    return 1
+
+def read_projects_version(db: Session) -> int:
+    value = db.execute(select(SiteConfigModel.value).where(SiteConfigModel.key == PROJECTS_VERSION_KEY)).scalar()
+    return int(value) if value else 0
+
+def upgrade_schema():
+    """
+    Add columns introduced after a table was first created (create_all
+    only creates missing tables). Runs before the auto-migration, which
+    queries and fills these columns.
+    """
+    columns = {c["name"] for c in inspect(engine).get_columns("projects")}
+    with engine.begin() as conn:
+        for name in ("position", "updated_version"):
+            if name not in columns:
+                conn.execute(text(f'ALTER TABLE projects ADD COLUMN "{name}" INTEGER NOT NULL DEFAULT 0'))
+                conn.execute(text(f'CREATE INDEX IF NOT EXISTS ix_projects_{name} ON projects ("{name}")'))
+                print(f"Schema upgrade: added projects.{name}")
+
+def backfill_project_positions():
+    """Rows created before ordering existed (or copied by the migration) keep id order"""
+    with engine.begin() as conn:
+        conn.execute(text('UPDATE projects SET "position" = id WHERE "position" = 0'))
+
+class ResumeModel(Base):
+    __tablename__ = "resume"
+    id = Column(Integer, primary_key=True)  # Single row, see RESUME_ROW_ID
+    filename = Column(String, nullable=False)
+    content_type = Column(String, nullable=False)
+    data = Column(LargeBinary, nullable=False)  # Raw PDF bytes, no base64
+    size = Column(Integer, nullable=False)
+    sha256 = Column(String(64), nullable=False)
+    uploaded_at = Column(DateTime(timezone=True), nullable=False)
+
+RESUME_ROW_ID = 1
+
+class AdminSessionModel(Base):
+    __tablename__ = "admin_sessions"
+    token_hash = Column(String(64), primary_key=True)  # SHA-256 of the token; raw tokens are never stored
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+
+class RateLimitModel(Base):
+    """Token buckets shared between workers (RATE_LIMIT_BACKEND=database)"""
+    __tablename__ = "rate_limits"
+    key = Column(String(128), primary_key=True)
+    tokens = Column(Float, nullable=False)
+    updated_at = Column(Float, nullable=False, index=True)  # Unix timestamp
+
+class EmailOutboxModel(Base):
+    __tablename__ = "email_outbox"
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    email = Column(String, nullable=False)
+    message = Column(Text, nullable=False)
+    status = Column(String, nullable=False, default="pending", index=True)  # pending | sent | failed
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    locked_until = Column(DateTime(timezone=True), nullable=True)  # Lease held by a sending worker
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+def decode_resume_data_uri(resume_data: str) -> bytes:
+    """Decode a base64 resume payload, with or without a data URI prefix"""
+    pdf_b64 = resume_data
+    if "base64," in resume_data:
+        pdf_b64 = resume_data.split("base64,", 1)[1]
+    return base64.b64decode(pdf_b64)
+
+def store_resume(db: Session, pdf_bytes: bytes, filename: str = "AtharvaZ.pdf", uploaded_at: Optional[datetime] = None,
+                 sha256: Optional[str] = None) -> ResumeModel:
+    """Write the resume row with its size and hash precomputed (caller commits)"""
+    resume = db.get(ResumeModel, RESUME_ROW_ID)
+    if resume is None:
+        resume = ResumeModel(id=RESUME_ROW_ID)
+        db.add(resume)
+    resume.filename = filename
+    resume.content_type = "application/pdf"
+    resume.data = pdf_bytes
+    resume.size = len(pdf_bytes)
+    resume.sha256 = sha256 or hashlib.sha256(pdf_bytes).hexdigest()
+    resume.uploaded_at = uploaded_at or datetime.now(timezone.utc)
+    return resume
+
+def convert_legacy_resume():
+    """
+    One-shot conversion of the old base64 `resume_pdf` row in site_config
+    into the binary resume table. Safe to run repeatedly: the legacy row is
+    removed once converted, so later runs are a single primary-key lookup.
+    """
+    db = SessionLocal()
+    try:
+        legacy = db.get(SiteConfigModel, "resume_pdf")
+        if legacy is None:
+            return
+        if legacy.value and db.get(ResumeModel, RESUME_ROW_ID) is None:
+            store_resume(db, decode_resume_data_uri(legacy.value))
+            print("Resume conversion: moved base64 resume_pdf into the resume table")
+        db.delete(legacy)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"Resume conversion error: {e}")
+    finally:
+        db.close()
 
 def attempt_auto_migration():
     """
@@ -85,50 +717,129 @@ def attempt_auto_migration():
         return
         
     try:
-        # 3. Check if destination database is empty
+        # 3. Check if destination database is empty (or an earlier run was interrupted)
         db = SessionLocal()
         try:
             count = db.query(ProjectModel).count()
+            try:
+                unfinished = db.execute(text("SELECT COUNT(*) FROM migration_checkpoints WHERE NOT completed")).scalar()
+            except Exception:
+                db.rollback()
+                unfinished = 0  # No checkpoint table: never migrated
         finally:
             db.close()
         
-        if count > 0:
+        if count > 0 and not unfinished:
             print(f"Auto-migration: Database already has {count} projects. Skipping.")
             return
             
-        print("Auto-migration: Database empty. Starting migration from SQLite...")
+        if unfinished:
+            print("Auto-migration: Resuming interrupted migration from SQLite...")
+        else:
+            print("Auto-migration: Database empty. Starting migration from SQLite...")
         
-        # 4. Run migration script
-        migration_script = BASE_DIR / "migrate_sqlite_to_postgres.py"
-        if not migration_script.exists():
-            print(f"Auto-migration: Script {migration_script} not found!")
-            return
+        # 4. Run the migration in-process (streams rows in chunks and
+        # resumes from checkpoints if a previous attempt was interrupted)
+        import migrate_sqlite_to_postgres
 
-        # Execute migration script
-        # passing os.environ to ensure DATABASE_URL is available to the subprocess
-        result = subprocess.run(
-            ["python3", str(migration_script)],
-            capture_output=True,
-            text=True,
-            env=os.environ.copy()
-        )
-        
-        if result.returncode == 0:
+        if migrate_sqlite_to_postgres.migrate(DB_PATH, DATABASE_URL):
             print("Auto-migration: SUCCESS")
-            print("------------------------------------------")
-            print(result.stdout)
-            print("------------------------------------------")
         else:
             print("Auto-migration: FAILED")
-            print("------------------------------------------")
-            print(result.stderr)
-            print("------------------------------------------")
             
     except Exception as e:
         print(f"Auto-migration error: {e}")
 
-# Run auto-migration check on startup
-attempt_auto_migration()
+class StartupState:
+    """Readiness of the database (schema, auto-migration, resume conversion)"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.ready = False
+        self.phase = "pending"
+        self.error: Optional[str] = None
+        self.ready_after_seconds: Optional[float] = None
+
+startup_state = StartupState()
+
+# Backoff between background retries of a failed database setup
+STARTUP_RETRY_SECONDS = float(os.getenv("STARTUP_RETRY_SECONDS", "2"))
+STARTUP_RETRY_MAX_SECONDS = float(os.getenv("STARTUP_RETRY_MAX_SECONDS", "60"))
+
+# Multi-worker deployments: schema/migration work is serialized across
+# processes (advisory lock on Postgres, a lock file next to the SQLite DB),
+# and a supervisor that already did it tells its workers via the environment
+SETUP_DONE_ENV = "PORTFOLIO_DB_SETUP_DONE"
+SETUP_LOCK_PATH = os.getenv("SETUP_LOCK_PATH", f"{DB_PATH}.setup.lock")
+SETUP_ADVISORY_LOCK_ID = 7234501
+
+@contextmanager
+def database_setup_lock():
+    """Hold a cross-process lock while creating tables and migrating"""
+    if engine.dialect.name == "postgresql":
+        with engine.connect() as conn:
+            conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": SETUP_ADVISORY_LOCK_ID})
+            conn.commit()
+            try:
+                yield
+            finally:
+                conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": SETUP_ADVISORY_LOCK_ID})
+                conn.commit()
+        return
+
+    try:
+        import fcntl
+    except ImportError:  # Windows: single-process development only
+        yield
+        return
+    with open(SETUP_LOCK_PATH, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def ensure_database_ready(retry: bool = False):
+    """
+    Create tables, run the auto-migration check and convert the legacy
+    resume exactly once. Called from the startup task and lazily before
+    any session is used, so callers never see a missing table. Skipped in
+    workers whose supervisor already ran it (see serve()).
+
+    Once setup has failed, callers get the recorded error straight away
+    instead of rerunning it on their request; only the startup task
+    retries (retry=True), with backoff.
+    """
+    if startup_state.ready:
+        return
+    if startup_state.error is not None and not retry:
+        raise RuntimeError(f"Database setup failed: {startup_state.error}")
+    with startup_state.lock:
+        if startup_state.ready:
+            return
+        if startup_state.error is not None and not retry:
+            raise RuntimeError(f"Database setup failed: {startup_state.error}")
+        try:
+            if os.getenv(SETUP_DONE_ENV) != "1":
+                startup_state.phase = "setup-lock"
+                with database_setup_lock():
+                    startup_state.phase = "schema"
+                    Base.metadata.create_all(bind=engine)
+                    startup_state.phase = "migration"
+                    upgrade_schema()
+                    attempt_auto_migration()
+                    backfill_project_positions()
+                    convert_legacy_resume()
+                    sync_project_tech()
+                    sync_project_search()
+            detect_project_search()
+        except Exception as e:
+            startup_state.phase = "failed"
+            startup_state.error = str(e)
+            raise
+        startup_state.error = None
+        startup_state.phase = "ready"
+        startup_state.ready_after_seconds = round(time.perf_counter() - IMPORT_STARTED, 3)
+        startup_state.ready = True
 
 # Admin credentials (should be in .env in production)
 ADMIN_USERNAME = os.getenv("ADMIN_USERNAME")
@@ -139,8 +850,390 @@ if not ADMIN_USERNAME or not ADMIN_PASSWORD:
     print("WARNING: ADMIN_USERNAME or ADMIN_PASSWORD not set in .env file!")
     print("Please set these values in your .env file for security.")
 
-# Simple session management (in production, use proper JWT tokens)
-active_sessions = set()
+# Session management
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "database")  # database | memory (single process only)
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", str(8 * 3600)))
+SESSION_TOUCH_SECONDS = int(os.getenv("SESSION_TOUCH_SECONDS", "300"))  # Min interval between expiry extensions
+SESSION_CACHE_SECONDS = float(os.getenv("SESSION_CACHE_SECONDS", "30"))  # How long a worker trusts its local copy
+SESSION_EVICT_SECONDS = float(os.getenv("SESSION_EVICT_SECONDS", "600"))
+SESSION_CACHE_MAX = 1024
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+class MemorySessionStore:
+    """Process-local store; sessions do not survive restarts or span workers"""
+    blocking = False
+
+    def __init__(self):
+        self._expiry = {}
+
+    def create(self, token_hash: str, expires_at: float):
+        self._expiry[token_hash] = expires_at
+
+    def get(self, token_hash: str) -> Optional[float]:
+        return self._expiry.get(token_hash)
+
+    def touch(self, token_hash: str, expires_at: float):
+        if token_hash in self._expiry:
+            self._expiry[token_hash] = expires_at
+
+    def delete(self, token_hash: str):
+        self._expiry.pop(token_hash, None)
+
+    def evict_expired(self, now: float) -> int:
+        expired = [h for h, exp in self._expiry.items() if exp <= now]
+        for h in expired:
+            del self._expiry[h]
+        return len(expired)
+
+class DatabaseSessionStore:
+    """admin_sessions table shared by every worker and node using the same database"""
+    blocking = True
+
+    def create(self, token_hash: str, expires_at: float):
+        def insert(db: Session):
+            now = datetime.now(timezone.utc)
+            db.add(AdminSessionModel(
+                token_hash=token_hash,
+                created_at=now,
+                expires_at=datetime.fromtimestamp(expires_at, timezone.utc)
+            ))
+            db.commit()
+        with_session(insert)
+
+    def get(self, token_hash: str) -> Optional[float]:
+        def lookup(db: Session):
+            row = db.get(AdminSessionModel, token_hash)
+            return to_timestamp(row.expires_at) if row else None
+        return with_session(lookup)
+
+    def touch(self, token_hash: str, expires_at: float):
+        def extend(db: Session):
+            db.query(AdminSessionModel).filter(AdminSessionModel.token_hash == token_hash).update(
+                {AdminSessionModel.expires_at: datetime.fromtimestamp(expires_at, timezone.utc)},
+                synchronize_session=False
+            )
+            db.commit()
+        with_session(extend)
+
+    def delete(self, token_hash: str):
+        def remove(db: Session):
+            db.query(AdminSessionModel).filter(AdminSessionModel.token_hash == token_hash).delete(synchronize_session=False)
+            db.commit()
+        with_session(remove)
+
+    def evict_expired(self, now: float) -> int:
+        def evict(db: Session):
+            count = db.query(AdminSessionModel).filter(
+                AdminSessionModel.expires_at <= datetime.fromtimestamp(now, timezone.utc)
+            ).delete(synchronize_session=False)
+            db.commit()
+            return count
+        return with_session(evict)
+
+class SessionManager:
+    """
+    Admin sessions with a TTL and sliding expiry. Verification is a hash
+    plus a dict lookup while the worker's local copy is fresh
+    (SESSION_CACHE_SECONDS); otherwise one primary-key read from the store.
+    A logout on another worker is therefore honoured within that window.
+    """
+    def __init__(self, store, ttl: int, touch_interval: int, cache_seconds: float):
+        self.store = store
+        self.ttl = ttl
+        self.touch_interval = touch_interval
+        self.cache_seconds = cache_seconds
+        self._local: "OrderedDict[str, list]" = OrderedDict()  # token_hash -> [expires_at, checked_at]
+
+    async def _call(self, fn, *args):
+        if self.store.blocking:
+            return await run_blocking(fn, *args)
+        return fn(*args)
+
+    def _remember(self, token_hash: str, expires_at: float):
+        self._local[token_hash] = [expires_at, time.monotonic()]
+        self._local.move_to_end(token_hash)
+        while len(self._local) > SESSION_CACHE_MAX:
+            self._local.popitem(last=False)
+
+    async def create(self) -> str:
+        token = secrets.token_urlsafe(32)
+        token_hash = hash_token(token)
+        expires_at = time.time() + self.ttl
+        await self._call(self.store.create, token_hash, expires_at)
+        self._remember(token_hash, expires_at)
+        return token
+
+    async def verify(self, token: str) -> bool:
+        token_hash = hash_token(token)
+        now = time.time()
+        local = self._local.get(token_hash)
+        if local is not None and time.monotonic() - local[1] < self.cache_seconds:
+            expires_at = local[0]
+        else:
+            expires_at = await self._call(self.store.get, token_hash)
+        if expires_at is None or expires_at <= now:
+            self._local.pop(token_hash, None)
+            return False
+
+        # Sliding expiry, written at most once per touch interval
+        if now + self.ttl - expires_at >= self.touch_interval:
+            expires_at = now + self.ttl
+            await self._call(self.store.touch, token_hash, expires_at)
+        if local is None or local[0] != expires_at or time.monotonic() - local[1] >= self.cache_seconds:
+            self._remember(token_hash, expires_at)
+        return True
+
+    async def revoke(self, token: str):
+        token_hash = hash_token(token)
+        self._local.pop(token_hash, None)
+        await self._call(self.store.delete, token_hash)
+
+    def clear_local(self):
+        """Forget locally cached verifications (e.g. after a restore)"""
+        self._local.clear()
+
+    async def evict_expired(self) -> int:
+        now = time.time()
+        for token_hash in [h for h, (exp, _) in self._local.items() if exp <= now]:
+            del self._local[token_hash]
+        return await self._call(self.store.evict_expired, now)
+
+sessions = SessionManager(
+    MemorySessionStore() if SESSION_BACKEND == "memory" else DatabaseSessionStore(),
+    SESSION_TTL_SECONDS,
+    SESSION_TOUCH_SECONDS,
+    SESSION_CACHE_SECONDS
+)
+
+async def run_session_evictor():
+    """Periodically delete expired sessions"""
+    while True:
+        await asyncio.sleep(SESSION_EVICT_SECONDS)
+        try:
+            evicted = await sessions.evict_expired()
+            if evicted:
+                print(f"Sessions: evicted {evicted} expired session(s)")
+        except Exception as e:
+            print(f"Session eviction error: {e}")
+
+# ============================================
+# RATE LIMITING
+# ============================================
+
+# Token buckets per client IP and per route group, checked in middleware
+# before the body is read. Rates are "N/S": bursts of N, refilled at N per S seconds.
+class Rate(NamedTuple):
+    capacity: float
+    per_second: float
+
+def parse_rate(spec: str) -> Rate:
+    count, _, seconds = spec.partition("/")
+    try:
+        capacity, period = float(count), float(seconds)
+    except ValueError:
+        capacity = period = 0.0
+    if not (capacity > 0 and period > 0 and math.isfinite(capacity) and math.isfinite(period)):
+        raise ValueError(f"Invalid rate {spec!r}: expected N/S with N > 0 requests per S > 0 seconds")
+    return Rate(capacity, capacity / period)
+
+def rate_setting(name: str, default: str) -> Rate:
+    """Read a rate from the environment, naming the variable when it is malformed"""
+    try:
+        return parse_rate(os.getenv(name, default))
+    except ValueError as e:
+        raise RuntimeError(f"{name}: {e}") from None
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() in ("1", "true", "yes")
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")  # memory | database (shared by all workers)
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "10000"))
+TRUSTED_PROXY_COUNT = int(os.getenv("TRUSTED_PROXY_COUNT", "0"))  # Proxies appending to X-Forwarded-For
+RATE_LIMITS = {
+    "contact": {
+        "ip": rate_setting("RATE_LIMIT_CONTACT_PER_IP", "5/600"),
+        "global": rate_setting("RATE_LIMIT_CONTACT_GLOBAL", "60/60"),
+    },
+    "login": {
+        "ip": rate_setting("RATE_LIMIT_LOGIN_PER_IP", "10/300"),
+        "global": rate_setting("RATE_LIMIT_LOGIN_GLOBAL", "100/60"),
+    },
+}
+RATE_LIMITED_ROUTES = {
+    ("POST", "/api/contact"): "contact",
+    ("POST", "/api/admin/login"): "login",
+}
+
+def refill(tokens: float, updated_at: float, rate: Rate, now: float) -> float:
+    """Bucket level at `now`"""
+    return min(rate.capacity, tokens + max(now - updated_at, 0.0) * rate.per_second)
+
+def token_wait(tokens: float, rate: Rate) -> float:
+    """Seconds until a bucket at this level holds a whole token"""
+    return 0.0 if tokens >= 1.0 else (1.0 - tokens) / rate.per_second
+
+class MemoryRateLimitBackend:
+    """
+    Buckets as (tokens, updated_at) tuples in an LRU-ordered dict capped at
+    max_keys; evicting the least recently seen key just refills its bucket.
+    """
+    blocking = False
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._buckets: "OrderedDict[str, tuple]" = OrderedDict()
+        self.evictions = 0
+
+    def take(self, buckets, now: float) -> float:
+        """Take a token from every (key, rate) bucket, or from none if any is empty"""
+        with self._lock:
+            levels = []
+            for key, rate in buckets:
+                state = self._buckets.pop(key, None)
+                levels.append(refill(*(state or (rate.capacity, now)), rate, now))
+            wait = max(token_wait(tokens, rate) for tokens, (_, rate) in zip(levels, buckets))
+            for tokens, (key, _) in zip(levels, buckets):
+                self._buckets[key] = (tokens if wait else tokens - 1.0, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+                self.evictions += 1
+            return wait
+
+    def give_back(self, buckets):
+        """Return the tokens of a request that a later check rejected"""
+        with self._lock:
+            for key, rate in buckets:
+                state = self._buckets.get(key)
+                if state is not None:
+                    self._buckets[key] = (min(rate.capacity, state[0] + 1.0), state[1])
+
+class DatabaseRateLimitBackend:
+    """
+    Buckets in the rate_limits table, so limits hold across workers and
+    nodes. Each token is taken by one conditional UPDATE, which the
+    database applies atomically (SQLite has no SELECT ... FOR UPDATE), and
+    the buckets of one request share a transaction that is rolled back if
+    any of them is empty.
+    """
+    blocking = True
+    EVICT_EVERY = 1000
+    IDLE_SECONDS = 3600
+
+    def __init__(self):
+        self._calls = 0
+
+    @staticmethod
+    def take_one(db: Session, key: str, rate: Rate, now: float) -> float:
+        elapsed = case((RateLimitModel.updated_at < now, now - RateLimitModel.updated_at), else_=0.0)
+        level = RateLimitModel.tokens + elapsed * rate.per_second
+        level = case((level > rate.capacity, rate.capacity), else_=level)
+        taken = db.execute(
+            update_stmt(RateLimitModel)
+            .where(RateLimitModel.key == key, level >= 1.0)
+            .values(tokens=level - 1.0, updated_at=now)
+        ).rowcount
+        if taken:
+            return 0.0
+        row = db.get(RateLimitModel, key)
+        if row is None:
+            db.add(RateLimitModel(key=key, tokens=rate.capacity - 1.0, updated_at=now))
+            db.flush()  # IntegrityError if another worker created it first
+            return 0.0
+        return token_wait(refill(row.tokens, row.updated_at, rate, now), rate)
+
+    def take(self, buckets, now: float) -> float:
+        """Take a token from every (key, rate) bucket, or from none if any is empty"""
+        def update(db: Session) -> float:
+            for key, rate in buckets:
+                wait = self.take_one(db, key, rate, now)
+                if wait:
+                    db.rollback()
+                    return wait
+            self._calls += 1
+            if self._calls % self.EVICT_EVERY == 0:
+                db.query(RateLimitModel).filter(RateLimitModel.updated_at < now - self.IDLE_SECONDS).delete(synchronize_session=False)
+            db.commit()
+            return 0.0
+
+        try:
+            return with_session(update)
+        except IntegrityError:
+            # Another worker created a bucket first
+            return with_session(update)
+
+class RateLimiter:
+    """
+    Checks the per-IP and global buckets of a route group. The in-memory
+    buckets always run first, so a flood is turned away without touching
+    the shared backend. A request is charged to its buckets only when all
+    of them allow it.
+    """
+    def __init__(self, local: MemoryRateLimitBackend, shared=None):
+        self.local = local
+        self.shared = shared
+        self.rejections = 0
+
+    async def check(self, group: str, client_ip: str) -> float:
+        """Seconds the client must wait, or 0 when the request may proceed"""
+        limits = RATE_LIMITS[group]
+        buckets = ((f"{group}:ip:{client_ip}", limits["ip"]), (f"{group}:global", limits["global"]))
+        now = time.time()
+        wait = self.local.take(buckets, now)
+        if not wait and self.shared is not None:
+            try:
+                wait = await run_blocking(self.shared.take, buckets, now)
+            except Exception as e:
+                print(f"Rate limit backend error (allowing request): {e}")
+                return 0.0
+            if wait:
+                self.local.give_back(buckets)
+        if wait:
+            self.rejections += 1
+        return wait
+
+rate_limiter = RateLimiter(
+    MemoryRateLimitBackend(RATE_LIMIT_MAX_KEYS),
+    DatabaseRateLimitBackend() if RATE_LIMIT_BACKEND == "database" else None
+)
+
+def client_ip(scope) -> str:
+    """Peer address, or the address TRUSTED_PROXY_COUNT proxies reported in X-Forwarded-For"""
+    if TRUSTED_PROXY_COUNT > 0:
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-for":
+                hops = [h.strip() for h in value.decode("latin-1").split(",") if h.strip()]
+                if len(hops) >= TRUSTED_PROXY_COUNT:
+                    return hops[-TRUSTED_PROXY_COUNT]
+                break
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+class RateLimitMiddleware:
+    """Answer 429 for rate-limited routes before the app (and body parsing) runs; other routes pay one dict lookup"""
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            group = RATE_LIMITED_ROUTES.get((scope["method"], scope["path"]))
+            if group is not None:
+                wait = await rate_limiter.check(group, client_ip(scope))
+                if wait:
+                    scope["metrics_route"] = scope["path"]  # One of RATE_LIMITED_ROUTES, so bounded
+                    response = JSONResponse(
+                        {"detail": "Too many requests. Please try again later."},
+                        status_code=429,
+                        headers={"Retry-After": str(math.ceil(wait))}
+                    )
+                    await response(scope, receive, send)
+                    return
+        await self.app(scope, receive, send)
+
+if RATE_LIMIT_ENABLED:
+    # Innermost (add_middleware would make it outermost), so 429s still pass
+    # through CORS, compression and the request metrics
+    app.user_middleware.append(Middleware(RateLimitMiddleware))
 
 # Pydantic Models for API
 class ContactForm(BaseModel):
@@ -159,58 +1252,941 @@ class Project(BaseModel):
     tech: List[str]
     links: dict
 
-class ResumeResponse(BaseModel):
-    success: bool
-    message: str
-    data: Optional[str] = None
+class ProjectOperation(BaseModel):
+    op: Literal["create", "update", "delete"]
+    id: Optional[int] = None           # update / delete
+    ref: Optional[str] = None          # create: client label usable in `order`
+    project: Optional[Project] = None  # create / update
+
+class ProjectBatch(BaseModel):
+    operations: List[ProjectOperation] = []
+    order: Optional[List[Union[int, str]]] = None  # Project ids (or create refs) in display order
+    expected_version: Optional[int] = None         # Reject with 409 if the list changed since
 
 # Helper functions
-def get_db():
+
+# Sync SQLAlchemy work runs on a bounded pool so queries never block the
+# event loop. DB_THREADPOOL_SIZE=0 runs it inline (the old behaviour, kept
+# for benchmarking).
+DB_THREADPOOL_SIZE = int(os.getenv("DB_THREADPOOL_SIZE", "8"))
+db_executor = ThreadPoolExecutor(max_workers=DB_THREADPOOL_SIZE, thread_name_prefix="db") if DB_THREADPOOL_SIZE > 0 else None
+
+def reset_after_fork():
+    """
+    Give a forked worker (e.g. gunicorn --preload) its own connection pool
+    and DB threads. Parent connections are dropped without being closed so
+    the parent's sockets are left alone.
+    """
+    global db_executor
+    engine.dispose(close=False)
+    if DB_THREADPOOL_SIZE > 0:
+        db_executor = ThreadPoolExecutor(max_workers=DB_THREADPOOL_SIZE, thread_name_prefix="db")
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_after_fork)
+
+def with_session(fn, *args):
+    """Call fn(db, *args) with a fresh session that is always closed"""
+    ensure_database_ready()
     db = SessionLocal()
     try:
-        yield db
+        return fn(db, *args)
     finally:
         db.close()
 
+async def run_blocking(fn, *args):
+    """Run a blocking fn(*args) on the DB thread pool and await the result"""
+    if db_executor is None:
+        return fn(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(db_executor, fn, *args)
+
+async def run_db(fn, *args):
+    """Run fn(db, *args) on the DB thread pool and await the result"""
+    return await run_blocking(with_session, fn, *args)
+
+class ResumeCache:
+    """
+    In-process copy of the current resume bytes and metadata, loaded once
+    from the resume table and replaced on upload.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+        self.data: Optional[bytes] = None
+        self.meta: Optional[dict] = None
+
+    def set(self, resume: Optional[ResumeModel]):
+        with self._lock:
+            self._loaded = True
+            if resume is None:
+                self.data = None
+                self.meta = None
+                return
+            self.data = resume.data
+            self.meta = {
+                "filename": resume.filename,
+                "content_type": resume.content_type,
+                "size": resume.size,
+                "sha256": resume.sha256,
+                "uploaded_at": resume.uploaded_at.isoformat(),
+                "etag": f'"{resume.sha256[:32]}"',
+                "last_modified": to_timestamp(resume.uploaded_at)
+            }
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def current(self):
+        with self._lock:
+            return self.data, self.meta
+
+    def load_from(self, db: Session):
+        """Return (bytes, metadata), reading the database only on first use"""
+        if not self._loaded:
+            self.set(db.get(ResumeModel, RESUME_ROW_ID))
+        return self.current()
+
+    def load(self):
+        if self._loaded:
+            return self.current()
+        return with_session(self.load_from)
+
+    def invalidate(self):
+        with self._lock:
+            self._loaded = False
+            self.data = None
+            self.meta = None
+
+resume_cache = ResumeCache()
+
 def get_resume_from_db():
-    """Load resume from DB (helper for non-dependency contexts if needed, though dependency is better)"""
-    db = SessionLocal()
+    """Load resume bytes and metadata (helper for non-dependency contexts)"""
     try:
-        config = db.query(SiteConfigModel).filter(SiteConfigModel.key == "resume_pdf").first()
-        return config.value if config else None
+        return resume_cache.load()
     except Exception as e:
         print(f"Error fetching resume: {e}")
-        return None
-    finally:
-        db.close()
+        return None, None
 
-def verify_session(session_token: str):
-    """Verify admin session token"""
-    if session_token in active_sessions:
-        return True
-    raise HTTPException(status_code=401, detail="Invalid or expired session")
+# HTTP caching: Cache-Control policy per route family, overridable via env
+CACHE_CONTROL_POLICIES = {
+    "html": os.getenv("CACHE_CONTROL_HTML", "no-cache"),
+    "api": os.getenv("CACHE_CONTROL_API", "no-cache"),
+    "resume": os.getenv("CACHE_CONTROL_RESUME", "public, max-age=300, must-revalidate"),
+    "static": os.getenv("CACHE_CONTROL_STATIC", "public, max-age=86400"),
+    "immutable": os.getenv("CACHE_CONTROL_IMMUTABLE", "public, max-age=31536000, immutable"),
+}
 
-# Email configuration from environment variables
-RESEND_API_KEY = os.getenv("EMAIL_SECRET_KEY", "")
-RECIPIENT_EMAIL = os.getenv("RECIPIENT_EMAIL", "")
-RESEND_FROM_EMAIL = os.getenv("RESEND_FROM_EMAIL", "onboarding@resend.dev")  # Your verified domain email
+def make_etag(data: bytes) -> str:
+    """Strong ETag from a SHA-256 of the content"""
+    return f'"{hashlib.sha256(data).hexdigest()[:32]}"'
 
-# Initialize Resend
-if RESEND_API_KEY:
-    resend.api_key = RESEND_API_KEY
+def to_timestamp(value: datetime) -> float:
+    """Timestamp for a datetime, treating naive values (SQLite) as UTC"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
 
-# ============================================
-# API ROUTES (must come before catch-all routes)
-# ============================================
-#health check
-@app.api_route("/api/health", methods=["GET", "HEAD"])
-async def health_check():
-    """Health check endpoint for monitoring services (supports GET and HEAD)"""
-    return {
-        "status": "healthy",
+def is_not_modified(request: Request, etag: str, last_modified: Optional[float]) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since (If-None-Match wins when present)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison, as RFC 9110 requires for If-None-Match
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return etag.removeprefix("W/") in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified) <= int(to_timestamp(since))
+    return False
+
+def validator_headers(etag: str, last_modified: Optional[float], cache_policy: str) -> dict:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL_POLICIES[cache_policy]}
+    if last_modified is not None:
+        headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+    return headers
+
+def conditional_response(request: Request, body: bytes, media_type: str, etag: str,
+                         last_modified: Optional[float], cache_policy: str,
+                         headers: Optional[dict] = None) -> Response:
+    """Build a 200 response with validators, or a bodiless 304 if the client copy is fresh"""
+    all_headers = validator_headers(etag, last_modified, cache_policy)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=all_headers)
+    if headers:
+        all_headers.update(headers)
+    return Response(content=body, media_type=media_type, headers=all_headers)
+
+STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", str(64 * 1024)))
+
+def parse_byte_range(range_header: str, size: int):
+    """
+    Parse a single-range `bytes=` header into an inclusive (start, end).
+    Returns None when the header should be ignored (malformed, other unit
+    or several ranges) and raises ValueError when it cannot be satisfied.
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    first, last = first.strip(), last.strip()
+    if not sep or not (first + last).isdigit():
+        return None
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError("empty suffix range")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError("range not satisfiable")
+    return start, min(end, size - 1)
+
+def if_range_matches(request: Request, etag: str, last_modified: Optional[float]) -> bool:
+    """If-Range: honour Range only while the client's copy is still current (strong comparison)"""
+    if_range = request.headers.get("if-range")
+    if if_range is None:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith(('"', 'W/"')):
+        return not if_range.startswith("W/") and if_range == etag
+    try:
+        return last_modified is not None and int(to_timestamp(parsedate_to_datetime(if_range))) == int(last_modified)
+    except (TypeError, ValueError):
+        return False
+
+async def iter_chunks(body: memoryview):
+    """Yield zero-copy slices so each response only holds one chunk at a time"""
+    for offset in range(0, len(body), STREAM_CHUNK_SIZE):
+        yield body[offset:offset + STREAM_CHUNK_SIZE]
+
+def ranged_response(request: Request, body: bytes, media_type: str, etag: str,
+                    last_modified: Optional[float], cache_policy: str,
+                    headers: Optional[dict] = None) -> Response:
+    """
+    Like conditional_response, but streams the body in chunks and honours
+    single byte ranges (206 / 416) and HEAD. The body is shared, not copied,
+    so memory per request is bounded by STREAM_CHUNK_SIZE.
+    """
+    all_headers = validator_headers(etag, last_modified, cache_policy)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=all_headers)
+    all_headers["Accept-Ranges"] = "bytes"
+    if headers:
+        all_headers.update(headers)
+
+    size = len(body)
+    status_code = 200
+    start, end = 0, size - 1
+    range_header = request.headers.get("range")
+    if range_header and size and if_range_matches(request, etag, last_modified):
+        try:
+            byte_range = parse_byte_range(range_header, size)
+        except ValueError:
+            return Response(status_code=416, headers={**all_headers, "Content-Range": f"bytes */{size}"})
+        if byte_range is not None:
+            start, end = byte_range
+            status_code = 206
+            all_headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    all_headers["Content-Length"] = str(end - start + 1 if size else 0)
+    if request.method == "HEAD":
+        return Response(status_code=status_code, media_type=media_type, headers=all_headers)
+    return StreamingResponse(
+        iter_chunks(memoryview(body)[start:end + 1]),
+        status_code=status_code,
+        media_type=media_type,
+        headers=all_headers
+    )
+
+class FileValidators(NamedTuple):
+    mtime_ns: int
+    size: int
+    etag: str
+    last_modified: float
+
+class FileETagCache:
+    """
+    Content-hash ETags for files on disk. Each file is hashed once per
+    (mtime, size) pair; later requests only pay for a stat().
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict = {}
+
+    def get(self, path: Path) -> FileValidators:
+        st = path.stat()
+        key = str(path)
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached and cached.mtime_ns == st.st_mtime_ns and cached.size == st.st_size:
+            return cached
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b""):
+                digest.update(chunk)
+        entry = FileValidators(st.st_mtime_ns, st.st_size, f'"{digest.hexdigest()[:32]}"', st.st_mtime)
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+file_etags = FileETagCache()
+
+def project_to_dict(p: ProjectModel) -> dict:
+    """Convert a ProjectModel row into the API representation"""
+    return {
+        "id": p.id,
+        "title": p.title,
+        "desc": p.desc,
+        "tech": json.loads(p.tech),
+        "links": json.loads(p.links)
+    }
+
+class CachedBody(NamedTuple):
+    """A pre-serialized response body together with its validators"""
+    body: bytes
+    etag: str
+    last_modified: float  # Unix timestamp
+
+class ProjectsCache:
+    """
+    In-process cache of the serialized GET /api/projects response.
+    The body is rebuilt only after a project write commits, so the read path
+    never touches the database once the cache is warm.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.entry: Optional[CachedBody] = None
+        self.db_version: Optional[int] = None  # projects_version the entry was built from
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.rebuilds = 0
+
+    def rebuild(self, db: Session) -> CachedBody:
+        """Re-serialize the project list from the database and bump the version"""
+        projects_orm = db.query(ProjectModel).order_by(ProjectModel.position.asc(), ProjectModel.id.asc()).all()
+        projects = [project_to_dict(p) for p in projects_orm]
+        db_version = read_projects_version(db)
+        # Same encoding FastAPI's JSONResponse uses, so clients see identical bytes
+        body = json.dumps(
+            {"success": True, "projects": projects, "version": db_version},
+            ensure_ascii=False,
+            separators=(",", ":")
+        ).encode("utf-8")
+        entry = CachedBody(body, make_etag(body), datetime.now(timezone.utc).timestamp())
+        with self._lock:
+            self.entry = entry
+            self.db_version = db_version
+            self.version += 1
+            self.rebuilds += 1
+        return entry
+
+    def invalidate(self):
+        """Drop the cached body so the next read rebuilds it"""
+        with self._lock:
+            self.entry = None
+            self.db_version = None
+
+    def get(self) -> Optional[CachedBody]:
+        """Return the cached entry (or None on a miss) and record the lookup"""
+        with self._lock:
+            if self.entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return self.entry
+
+    def current(self) -> CachedBody:
+        """Return the cached entry, building it from the database on a miss"""
+        entry = self.get()
+        if entry is not None:
+            return entry
+        return with_session(self.rebuild)
+
+    def refresh_after_write(self, db: Session):
+        """Write-through hook called by the project write paths after commit"""
+        try:
+            self.rebuild(db)
+        except Exception as e:
+            print(f"Error rebuilding projects cache: {e}")
+            self.invalidate()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "version": self.version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "rebuilds": self.rebuilds,
+                "cached_bytes": len(self.entry.body) if self.entry is not None else 0
+            }
+
+projects_cache = ProjectsCache()
+
+# Caches are per process and write-through only for writes made by that
+# process. Other workers' writes (and restores) are noticed by comparing
+# the stored projects_version and resume sha256/uploaded_at, read at most
+# once per CACHE_VALIDATE_SECONDS; a negative value turns the check off.
+CACHE_VALIDATE_SECONDS = float(os.getenv("CACHE_VALIDATE_SECONDS", "1"))
+
+def read_content_state(db: Session) -> tuple:
+    resume = db.execute(
+        select(ResumeModel.sha256, ResumeModel.uploaded_at).where(ResumeModel.id == RESUME_ROW_ID)
+    ).first()
+    return read_projects_version(db), (resume.sha256, resume.uploaded_at.isoformat()) if resume else None
+
+class CacheValidator:
+    """Drops cached projects/resume when the database has moved on without this process"""
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.checked_at = float("-inf")
+        self.invalidations = 0
+
+    async def check(self):
+        if self.interval < 0 or time.monotonic() - self.checked_at < self.interval:
+            return
+        self.checked_at = time.monotonic()  # Set before awaiting: concurrent requests skip the read
+        try:
+            version, resume = await run_db(read_content_state)
+        except Exception as e:
+            print(f"Cache validation error: {e}")
+            return
+        if projects_cache.db_version is not None and projects_cache.db_version != version:
+            projects_cache.invalidate()
+            self.invalidations += 1
+        if resume_cache.loaded:
+            _, meta = resume_cache.current()
+            cached = (meta["sha256"], meta["uploaded_at"]) if meta else None
+            if cached != resume:
+                resume_cache.invalidate()
+                self.invalidations += 1
+
+cache_validator = CacheValidator(CACHE_VALIDATE_SECONDS)
+
+# Paginated / projected / filtered project queries (GET /api/projects with parameters)
+PROJECT_FIELDS = ("id", "title", "desc", "tech", "links", "position")
+PROJECTS_DEFAULT_LIMIT = 50
+PROJECTS_MAX_LIMIT = 200
+
+def encode_cursor(position: int, last_id: int) -> str:
+    return base64.urlsafe_b64encode(f"pos:{position}:{last_id}".encode("ascii")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple:
+    """(position, id) after which the next page starts; raises ValueError for anything encode_cursor did not produce"""
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+    prefix, position, last_id = raw.split(":")
+    if prefix != "pos":
+        raise ValueError("bad cursor")
+    return int(position), int(last_id)
+
+def query_projects(db: Session, fields: List[str], techs: List[str], after: Optional[tuple], limit: int) -> dict:
+    """
+    One page of projects in display order, selecting only the requested
+    columns. Keyset pagination on (position, id) and tech filters (all
+    must match) backed by the project_tech index mean only the page itself
+    is loaded into Python.
+    """
+    columns = [getattr(ProjectModel, f) for f in fields if f not in ("id", "position")]
+    stmt = (
+        select(ProjectModel.id, ProjectModel.position, *columns)
+        .order_by(ProjectModel.position.asc(), ProjectModel.id.asc())
+        .limit(limit + 1)
+    )
+    if after is not None:
+        position, last_id = after
+        stmt = stmt.where(or_(
+            ProjectModel.position > position,
+            and_(ProjectModel.position == position, ProjectModel.id > last_id)
+        ))
+    for tech in techs:
+        stmt = stmt.where(ProjectModel.id.in_(
+            select(ProjectTechModel.project_id).where(ProjectTechModel.name_key == tech.lower())
+        ))
+    rows = db.execute(stmt).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    projects = []
+    for row in rows:
+        values = row._mapping
+        item = {}
+        for field in fields:
+            value = values[getattr(ProjectModel, field)]
+            item[field] = json.loads(value) if field in ("tech", "links") else value
+        projects.append(item)
+    return {
+        "success": True,
+        "projects": projects,
+        "next_cursor": encode_cursor(rows[-1].position, rows[-1].id) if has_more else None,
+        "version": read_projects_version(db)
+    }
+
+# Project search
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
+SEARCH_MAX_TERMS = 8
+SEARCH_SNIPPET_WORDS = 16
+SEARCH_WEIGHTS = (10.0, 5.0, 1.0)  # title, tech, desc (SQLite bm25; Postgres uses setweight A/B/C)
+# Highlight markers the database wraps around matches; the text is
+# HTML-escaped afterwards and only these become <mark> tags
+MARK_OPEN, MARK_CLOSE = "\x02", "\x03"
+
+def search_terms(q: str) -> List[str]:
+    """Words of the query, lower-cased; each one is matched as a prefix"""
+    return re.findall(r"\w+", q.lower())[:SEARCH_MAX_TERMS]
+
+def render_highlight(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    return html.escape(value).replace(MARK_OPEN, "<mark>").replace(MARK_CLOSE, "</mark>")
+
+class SearchRow(NamedTuple):
+    id: int
+    tech: str
+    links: str
+    score: float
+    title: str
+    snippet: Optional[str]
+
+def like_snippet(value: Optional[str], marker: "re.Pattern") -> Optional[str]:
+    """About SEARCH_SNIPPET_WORDS words of `value` around the first match, like FTS5 snippet()"""
+    if value is None:
+        return None
+    words = value.split()
+    first = next((i for i, word in enumerate(words) if marker.search(word)), 0)
+    start = max(0, min(first - SEARCH_SNIPPET_WORDS // 2, len(words) - SEARCH_SNIPPET_WORDS))
+    end = start + SEARCH_SNIPPET_WORDS
+    return ("…" if start else "") + " ".join(words[start:end]) + ("…" if end < len(words) else "")
+
+def like_search_rows(db: Session, terms: List[str], limit: int, offset: int) -> List[SearchRow]:
+    """
+    Fallback when FTS5 is unavailable: every term must occur in title, tech
+    or desc, ranked by which columns it occurs in (SEARCH_WEIGHTS). Scans
+    the table, so it is only meant to keep search working.
+    """
+    columns = (ProjectModel.title, ProjectModel.tech, ProjectModel.desc)
+    # Terms are \w+ words, so "_" is the only LIKE wildcard they can contain
+    patterns = ["%" + term.replace("_", "\\_") + "%" for term in terms]
+    score = sum(
+        case((column.ilike(pattern, escape="\\"), weight), else_=0)
+        for pattern in patterns
+        for column, weight in zip(columns, SEARCH_WEIGHTS)
+    )
+    matches = and_(*(or_(*(column.ilike(pattern, escape="\\") for column in columns)) for pattern in patterns))
+    rows = (
+        db.query(ProjectModel.id, ProjectModel.title, ProjectModel.desc, ProjectModel.tech, ProjectModel.links, score.label("score"))
+        .filter(matches)
+        .order_by(score.desc(), ProjectModel.position, ProjectModel.id)
+        .limit(limit).offset(offset)
+        .all()
+    )
+    marker = re.compile("|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+
+    def mark(value: Optional[str]) -> Optional[str]:
+        return None if value is None else marker.sub(lambda m: MARK_OPEN + m.group(0) + MARK_CLOSE, value)
+
+    return [
+        SearchRow(row.id, row.tech, row.links, row.score, mark(row.title), mark(like_snippet(row.desc, marker)))
+        for row in rows
+    ]
+
+def search_projects(db: Session, terms: List[str], limit: int, offset: int) -> dict:
+    """
+    Ranked prefix search. All terms must match (AND); only the requested
+    page is highlighted, so snippet cost does not grow with the hit count.
+    """
+    params = {"limit": limit + 1, "offset": offset, "open": MARK_OPEN, "close": MARK_CLOSE}
+    if engine.dialect.name == "postgresql":
+        params["query"] = " & ".join(f"{term}:*" for term in terms)
+        params["title_opts"] = f'HighlightAll=true, StartSel="{MARK_OPEN}", StopSel="{MARK_CLOSE}"'
+        params["desc_opts"] = (
+            f'StartSel="{MARK_OPEN}", StopSel="{MARK_CLOSE}", '
+            f"MaxWords={SEARCH_SNIPPET_WORDS}, MinWords={SEARCH_SNIPPET_WORDS // 2}, MaxFragments=1"
+        )
+        rows = db.execute(text(f"""
+            WITH q AS (SELECT to_tsquery('simple', :query) AS query),
+            hits AS (
+                SELECT p.id, p.title, p."desc", p.tech, p.links, ts_rank({SEARCH_PG_DOCUMENT}, q.query) AS score
+                FROM projects p, q
+                WHERE ({SEARCH_PG_DOCUMENT}) @@ q.query
+                ORDER BY score DESC, p.position, p.id
+                LIMIT :limit OFFSET :offset
+            )
+            SELECT hits.id, hits.tech, hits.links, hits.score,
+                   ts_headline('simple', hits.title, q.query, :title_opts) AS title,
+                   ts_headline('simple', hits."desc", q.query, :desc_opts) AS snippet
+            FROM hits, q
+            ORDER BY hits.score DESC, hits.id
+        """), params).all()
+    elif search_fts_available:
+        params["match"] = " ".join(f'"{term}"*' for term in terms)
+        params["snippet_words"] = SEARCH_SNIPPET_WORDS
+        params.update(zip(("w_title", "w_tech", "w_desc"), SEARCH_WEIGHTS))
+        rows = db.execute(text(f"""
+            SELECT p.id, p.tech, p.links,
+                   -bm25({SEARCH_FTS_TABLE}, :w_title, :w_tech, :w_desc) AS score,
+                   highlight({SEARCH_FTS_TABLE}, 0, :open, :close) AS title,
+                   snippet({SEARCH_FTS_TABLE}, 2, :open, :close, '…', :snippet_words) AS snippet
+            FROM {SEARCH_FTS_TABLE}
+            JOIN projects p ON p.id = {SEARCH_FTS_TABLE}.rowid
+            WHERE {SEARCH_FTS_TABLE} MATCH :match
+            ORDER BY bm25({SEARCH_FTS_TABLE}, :w_title, :w_tech, :w_desc), p.position, p.id
+            LIMIT :limit OFFSET :offset
+        """), params).all()
+    else:
+        rows = like_search_rows(db, terms, limit + 1, offset)
+
+    has_more = len(rows) > limit
+    return {
+        "success": True,
+        "results": [
+            {
+                "id": row.id,
+                "title": render_highlight(row.title),
+                "snippet": render_highlight(row.snippet),
+                "tech": json.loads(row.tech),
+                "links": json.loads(row.links),
+                "score": round(float(row.score), 6),
+            }
+            for row in rows[:limit]
+        ],
+        "next_offset": offset + limit if has_more else None,
+    }
+
+# Optional static snapshot kept in sync with admin writes (see export_static_site.py)
+STATIC_EXPORT_DIR = os.getenv("STATIC_EXPORT_DIR")
+
+def run_static_export(groups: set):
+    """Incrementally re-export the artifacts affected by a write"""
+    import export_static_site
+    try:
+        # Pass this module explicitly so `python3 backend.py` isn't imported twice
+        summary = export_static_site.export_site(sys.modules[__name__], Path(STATIC_EXPORT_DIR), only=groups)
+        print(f"Static export: {summary['written']} artifacts rewritten ({', '.join(sorted(groups))})")
+    except Exception as e:
+        print(f"Static export failed: {e}")
+
+class StaticExportQueue:
+    """
+    Single-flight static exports. While one runs, further requests only add
+    their groups to a pending set, which the running call exports next, so
+    bursts of writes coalesce into at most one follow-up run.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: set = set()
+        self._running = False
+
+    def run(self, groups: set):
+        with self._lock:
+            self._pending |= groups
+            if self._running:
+                return
+            self._running = True
+        while True:
+            with self._lock:
+                groups, self._pending = self._pending, set()
+                if not groups:
+                    self._running = False
+                    return
+            run_static_export(groups)
+
+static_exports = StaticExportQueue()
+
+def schedule_static_export(background_tasks: BackgroundTasks, *groups: str):
+    if STATIC_EXPORT_DIR:
+        background_tasks.add_task(static_exports.run, set(groups))
+
+async def verify_session(session_token: str):
+    """Verify admin session token"""
+    try:
+        valid = await sessions.verify(session_token)
+    except Exception as e:
+        print(f"Error verifying session: {e}")
+        raise HTTPException(status_code=500, detail="Session store unavailable")
+    if valid:
+        return True
+    raise HTTPException(status_code=401, detail="Invalid or expired session")
+
+# Email configuration from environment variables
+RESEND_API_KEY = os.getenv("EMAIL_SECRET_KEY", "")
+RECIPIENT_EMAIL = os.getenv("RECIPIENT_EMAIL", "")
+RESEND_FROM_EMAIL = os.getenv("RESEND_FROM_EMAIL", "onboarding@resend.dev")  # Your verified domain email
+
+# Outbox worker tuning
+EMAIL_TRANSPORT = os.getenv("EMAIL_TRANSPORT", "resend")  # resend | stub
+EMAIL_WORKER_CONCURRENCY = int(os.getenv("EMAIL_WORKER_CONCURRENCY", "2"))
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "6"))
+EMAIL_BACKOFF_BASE_SECONDS = float(os.getenv("EMAIL_BACKOFF_BASE_SECONDS", "5"))
+EMAIL_BACKOFF_MAX_SECONDS = float(os.getenv("EMAIL_BACKOFF_MAX_SECONDS", "900"))
+EMAIL_POLL_SECONDS = float(os.getenv("EMAIL_POLL_SECONDS", "30"))
+EMAIL_LEASE_SECONDS = float(os.getenv("EMAIL_LEASE_SECONDS", "120"))
+EMAIL_DIGEST_SIZE = int(os.getenv("EMAIL_DIGEST_SIZE", "1"))  # >1 combines ready messages into one email
+EMAIL_RETENTION_SECONDS = float(os.getenv("EMAIL_RETENTION_SECONDS", str(7 * 24 * 3600)))  # Sent rows kept this long
+EMAIL_PRUNE_INTERVAL_SECONDS = 3600
+
+class EmailTransport:
+    """Sends one prepared email; implementations must be safe to call from a worker thread"""
+    name = "base"
+
+    def send(self, params: dict):
+        raise NotImplementedError
+
+class ResendTransport(EmailTransport):
+    name = "resend"
+
+    def send(self, params: dict):
+        if not RESEND_API_KEY or not RECIPIENT_EMAIL:
+            raise RuntimeError("Email configuration is missing. Please set EMAIL_SECRET_KEY and RECIPIENT_EMAIL environment variables.")
+        # Imported on first send so processes that never email skip the SDK import
+        import resend
+        resend.api_key = RESEND_API_KEY
+        return resend.Emails.send(params)
+
+class StubTransport(EmailTransport):
+    """Local transport for offline load tests: records sends, optional latency and failures"""
+    name = "stub"
+
+    keep = 100  # Most recent sends kept for inspection; long load tests must not grow memory
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.sent: "deque[dict]" = deque(maxlen=self.keep)
+        self.count = 0
+
+    def send(self, params: dict):
+        if self.latency:
+            time.sleep(self.latency)
+        if self.failure_rate and random.random() < self.failure_rate:
+            raise RuntimeError("Stub transport simulated failure")
+        self.sent.append(params)
+        self.count += 1
+        return {"id": f"stub-{self.count}"}
+
+def make_email_transport() -> EmailTransport:
+    if EMAIL_TRANSPORT == "stub":
+        return StubTransport(
+            latency=float(os.getenv("EMAIL_STUB_LATENCY", "0")),
+            failure_rate=float(os.getenv("EMAIL_STUB_FAILURE_RATE", "0"))
+        )
+    return ResendTransport()
+
+email_transport = make_email_transport()
+
+def render_contact_message(item: EmailOutboxModel) -> str:
+    return f"""
+                <h3>Contact Information:</h3>
+                <ul>
+                    <li><strong>Name:</strong> {html.escape(item.name)}</li>
+                    <li><strong>Email:</strong> {html.escape(item.email)}</li>
+                </ul>
+
+                <h3>Message:</h3>
+                <p>{html.escape(item.message).replace(chr(10), '<br>')}</p>
+                """
+
+def build_contact_email(items: List[EmailOutboxModel]) -> dict:
+    """Resend params for one submission, or a digest when several are batched"""
+    if len(items) == 1:
+        subject = f"New Contact Form Submission from {items[0].name}"
+        intro = "<p>You've received a new message from your portfolio website:</p>"
+    else:
+        subject = f"{len(items)} New Contact Form Submissions"
+        intro = f"<p>You've received {len(items)} new messages from your portfolio website:</p>"
+    body = "<hr>".join(render_contact_message(item) for item in items)
+    return {
+        "from": RESEND_FROM_EMAIL,
+        "to": [RECIPIENT_EMAIL],
+        "subject": subject,
+        "html": f"""
+                <h2>Contact Personal Website Submission</h2>
+                {intro}
+                {body}
+                <hr>
+                <p style="color: #666; font-size: 12px;">This email was sent from your portfolio contact form.</p>
+                """,
+    }
+
+def backoff_delay(attempts: int) -> float:
+    """Exponential backoff with jitter, capped at EMAIL_BACKOFF_MAX_SECONDS"""
+    delay = min(EMAIL_BACKOFF_BASE_SECONDS * (2 ** (attempts - 1)), EMAIL_BACKOFF_MAX_SECONDS)
+    return delay * random.uniform(0.8, 1.2)
+
+def enqueue_contact_message(db: Session, form) -> int:
+    """Append a submission to the outbox; the worker sends it"""
+    now = datetime.now(timezone.utc)
+    item = EmailOutboxModel(
+        name=form.name,
+        email=form.email,
+        message=form.message,
+        status="pending",
+        attempts=0,
+        next_attempt_at=now,
+        created_at=now
+    )
+    db.add(item)
+    db.commit()
+    return item.id
+
+def claim_outbox_batches(db: Session, limit: int) -> List[List[int]]:
+    """
+    Lease up to `limit` batches of due messages. The conditional UPDATE
+    makes claiming safe when several processes share the outbox.
+    """
+    now = datetime.now(timezone.utc)
+    due = (
+        db.query(EmailOutboxModel.id)
+        .filter(EmailOutboxModel.status == "pending")
+        .filter(EmailOutboxModel.next_attempt_at <= now)
+        .filter((EmailOutboxModel.locked_until.is_(None)) | (EmailOutboxModel.locked_until < now))
+        .order_by(EmailOutboxModel.id.asc())
+        .limit(limit * EMAIL_DIGEST_SIZE)
+        .all()
+    )
+    lease = now + timedelta(seconds=EMAIL_LEASE_SECONDS)
+    claimed = []
+    for (item_id,) in due:
+        updated = (
+            db.query(EmailOutboxModel)
+            .filter(EmailOutboxModel.id == item_id)
+            .filter((EmailOutboxModel.locked_until.is_(None)) | (EmailOutboxModel.locked_until < now))
+            .update({EmailOutboxModel.locked_until: lease}, synchronize_session=False)
+        )
+        if updated:
+            claimed.append(item_id)
+    db.commit()
+    return [claimed[i:i + EMAIL_DIGEST_SIZE] for i in range(0, len(claimed), EMAIL_DIGEST_SIZE)]
+
+def prepare_outbox_batch(db: Session, ids: List[int]) -> Optional[dict]:
+    """Email params for a leased batch, or None if its rows are gone"""
+    items = db.query(EmailOutboxModel).filter(EmailOutboxModel.id.in_(ids)).order_by(EmailOutboxModel.id.asc()).all()
+    return build_contact_email(items) if items else None
+
+def record_outbox_result(db: Session, ids: List[int], error: Optional[str]):
+    """Mark a batch sent, or schedule its retry, and release the lease"""
+    now = datetime.now(timezone.utc)
+    for item in db.query(EmailOutboxModel).filter(EmailOutboxModel.id.in_(ids)):
+        item.attempts += 1
+        item.locked_until = None
+        item.last_error = error
+        if error is None:
+            item.status = "sent"
+            item.sent_at = now
+        elif item.attempts >= EMAIL_MAX_ATTEMPTS:
+            item.status = "failed"
+        else:
+            item.next_attempt_at = now + timedelta(seconds=backoff_delay(item.attempts))
+    db.commit()
+
+def prune_outbox(db: Session) -> int:
+    """Delete sent messages older than EMAIL_RETENTION_SECONDS; failed ones stay for inspection"""
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=EMAIL_RETENTION_SECONDS)
+    deleted = (
+        db.query(EmailOutboxModel)
+        .filter(EmailOutboxModel.status == "sent")
+        .filter(EmailOutboxModel.sent_at < cutoff)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+async def deliver_outbox_batch(ids: List[int]):
+    """
+    Send one leased batch. The lease (claim_outbox_batches) is already
+    committed, so no session or transaction is held during the HTTP call;
+    the outcome is recorded in a fresh short session afterwards.
+    """
+    params = await run_db(prepare_outbox_batch, ids)
+    if params is None:
+        return
+    started = time.perf_counter()
+    try:
+        response = await asyncio.to_thread(email_transport.send, params)
+    except Exception as e:
+        metrics.observe_email(email_transport.name, "error", time.perf_counter() - started)
+        print(f"Outbox: send failed for {ids}: {e}")
+        error = str(e)
+    else:
+        metrics.observe_email(email_transport.name, "sent", time.perf_counter() - started)
+        print(f"Outbox: sent {len(ids)} message(s) via {email_transport.name}: {response}")
+        error = None
+    await run_db(record_outbox_result, ids, error)
+
+outbox_wakeup: Optional[asyncio.Event] = None
+
+def notify_email_worker():
+    if outbox_wakeup is not None:
+        outbox_wakeup.set()
+
+async def run_email_worker():
+    """Drain the outbox with bounded concurrency, waking on new submissions or every poll interval"""
+    global outbox_wakeup
+    outbox_wakeup = asyncio.Event()
+    semaphore = asyncio.Semaphore(EMAIL_WORKER_CONCURRENCY)
+
+    async def deliver(ids: List[int]):
+        async with semaphore:
+            await deliver_outbox_batch(ids)
+
+    next_prune = 0.0
+    while True:
+        try:
+            batches = await run_db(claim_outbox_batches, EMAIL_WORKER_CONCURRENCY)
+            if batches:
+                await asyncio.gather(*(deliver(ids) for ids in batches))
+                continue  # More may be due right away
+            if time.monotonic() >= next_prune:
+                next_prune = time.monotonic() + EMAIL_PRUNE_INTERVAL_SECONDS
+                pruned = await run_db(prune_outbox)
+                if pruned:
+                    print(f"Outbox: pruned {pruned} sent message(s)")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Outbox worker error: {e}")
+        outbox_wakeup.clear()
+        try:
+            await asyncio.wait_for(outbox_wakeup.wait(), timeout=EMAIL_POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+# ============================================
+# API ROUTES (must come before catch-all routes)
+# ============================================
+#health check
+@app.api_route("/api/health", methods=["GET", "HEAD"])
+async def health_check(require_ready: bool = Query(False)):
+    """
+    Health check endpoint for monitoring services (supports GET and HEAD).
+    Answers as soon as the process is up; `ready` turns true once startup
+    database work finishes. With ?require_ready=true it returns 503 until then.
+    """
+    body = {
+        "status": "healthy",
         "service": "Portfolio API",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now().isoformat(),
+        "ready": startup_state.ready,
+        "startup": {
+            "phase": startup_state.phase,
+            "error": startup_state.error,
+            "ready_after_seconds": startup_state.ready_after_seconds
+        }
     }
+    if require_ready and not startup_state.ready:
+        return JSONResponse(content=body, status_code=503)
+    return body
 
 # Admin Authentication
 @app.post("/api/admin/login")
@@ -225,17 +2201,23 @@ async def admin_login(credentials: LoginRequest):
     
     # Validate credentials
     if credentials.username == ADMIN_USERNAME and credentials.password == ADMIN_PASSWORD:
-        session_token = secrets.token_urlsafe(32)
-        active_sessions.add(session_token)
-        return {"success": True, "token": session_token}
+        try:
+            session_token = await sessions.create()
+        except Exception as e:
+            print(f"Error creating session: {e}")
+            raise HTTPException(status_code=500, detail="Session store unavailable")
+        return {"success": True, "token": session_token, "expires_in": SESSION_TTL_SECONDS}
     
     raise HTTPException(status_code=401, detail="Invalid username or password")
 
 @app.post("/api/admin/logout")
 async def admin_logout(session_token: str = Header(None, alias="X-Session-Token")):
     """Admin logout endpoint"""
-    if session_token and session_token in active_sessions:
-        active_sessions.remove(session_token)
+    if session_token:
+        try:
+            await sessions.revoke(session_token)
+        except Exception as e:
+            print(f"Error revoking session: {e}")
     return {"success": True}
 
 @app.get("/api/admin/verify")
@@ -243,38 +2225,84 @@ async def verify_admin(session_token: str = Header(None, alias="X-Session-Token"
     """Verify admin session"""
     if not session_token:
         raise HTTPException(status_code=401, detail="Session token required")
-    verify_session(session_token)
+    await verify_session(session_token)
     return {"success": True}
 
+@app.get("/api/admin/cache-stats")
+async def cache_stats(session_token: str = Header(None, alias="X-Session-Token")):
+    """Projects cache hit/miss/rebuild counters (admin only)"""
+    if not session_token:
+        raise HTTPException(status_code=401, detail="Session token required")
+    await verify_session(session_token)
+    return {"success": True, "projects": projects_cache.stats(), "static": static_files.stats()}
+
+@app.get("/api/admin/db-stats")
+async def db_stats(session_token: str = Header(None, alias="X-Session-Token")):
+    """Connection pool checkout/wait counters (admin only)"""
+    if not session_token:
+        raise HTTPException(status_code=401, detail="Session token required")
+    await verify_session(session_token)
+    return {"success": True, "dialect": engine.dialect.name, "pool": pool_metrics.stats()}
+
+@app.get("/api/admin/metrics")
+async def admin_metrics(session_token: str = Header(None, alias="X-Session-Token")):
+    """Request, DB query and email send metrics in Prometheus text format (admin only)"""
+    if not session_token:
+        raise HTTPException(status_code=401, detail="Session token required")
+    await verify_session(session_token)
+    pool = pool_metrics.stats()
+    projects = projects_cache.stats()
+    body = metrics.render({
+        "db_pool_checked_out": pool["checked_out"],
+        "db_pool_size": pool["pool_size"],
+        "db_pool_checkouts_total": pool["checkouts"],
+        "db_pool_timeouts_total": pool["timeouts"],
+        "db_pool_wait_seconds_total": pool["wait_seconds_total"],
+        "projects_cache_hits_total": projects.get("hits"),
+        "projects_cache_misses_total": projects.get("misses"),
+        "rate_limit_rejections_total": rate_limiter.rejections,
+        "cache_cross_process_invalidations_total": cache_validator.invalidations,
+        "change_feed_subscribers": change_feed.subscribers,
+        "change_feed_events_total": change_feed.seq,
+    })
+    return Response(content=body, media_type="text/plain; version=0.0.4; charset=utf-8", headers={"Cache-Control": "no-store"})
+
 # TEMPORARY: Fix sequence endpoint
 @app.post("/api/admin/fix-sequence")
-async def fix_sequence(session_token: str = Header(None, alias="X-Session-Token"), db: Session = Depends(get_db)):
+async def fix_sequence(session_token: str = Header(None, alias="X-Session-Token")):
     """
     TEMPORARY: Fix PostgreSQL sequence out of sync error.
     Run this once after migration if you get duplicate key errors.
     """
     if not session_token:
         raise HTTPException(status_code=401, detail="Session token required")
-    verify_session(session_token)
+    await verify_session(session_token)
     
     # Check if we are on Postgres
     if "sqlite" in str(engine.url):
         return {"success": False, "message": "This operation is only required for PostgreSQL (SQLite handles autocrement automatically)."}
 
-    try:
-        # 1. Get current max ID for reporting
-        result = db.execute(text("SELECT MAX(id) FROM projects"))
-        current_max = result.scalar() or 0
+    def reset_sequence(db: Session):
+        try:
+            # 1. Get current max ID for reporting
+            result = db.execute(text("SELECT MAX(id) FROM projects"))
+            current_max = result.scalar() or 0
 
-        # 2. Reset sequence
-        # Using user requested query: MAX(id) + 1
-        # This bumps the sequence past the current max to ensure no collisions
-        query = text("SELECT setval('projects_id_seq', (SELECT COALESCE(MAX(id), 0) + 1 FROM projects))")
-        seq_result = db.execute(query)
-        new_val = seq_result.scalar()
-        
-        db.commit()
-        
+            # 2. Reset sequence
+            # Using user requested query: MAX(id) + 1
+            # This bumps the sequence past the current max to ensure no collisions
+            query = text("SELECT setval('projects_id_seq', (SELECT COALESCE(MAX(id), 0) + 1 FROM projects))")
+            seq_result = db.execute(query)
+            new_val = seq_result.scalar()
+            
+            db.commit()
+            return current_max, new_val
+        except Exception:
+            db.rollback()
+            raise
+
+    try:
+        current_max, new_val = await run_db(reset_sequence)
         return {
             "success": True, 
             "current_max_id": current_max,
@@ -284,67 +2312,269 @@ async def fix_sequence(session_token: str = Header(None, alias="X-Session-Token"
         
     except Exception as e:
         print(f"Error resetting sequence: {e}")
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to reset sequence: {str(e)}")
 
 # Projects API
+async def get_projects_entry() -> CachedBody:
+    """Current projects cache entry; only a cold (or stale) cache rebuilds from the database"""
+    await cache_validator.check()
+    entry = projects_cache.get()
+    if entry is None:
+        entry = await run_db(projects_cache.rebuild)
+    return entry
+
 @app.get("/api/projects")
-async def get_all_projects(db: Session = Depends(get_db)):
-    """Get all projects"""
+async def get_all_projects(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=PROJECTS_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    tech: List[str] = Query([])
+):
+    """
+    Get projects. Without parameters the full list is served from the
+    in-process cache; `limit`/`cursor` paginate, `fields=` picks columns
+    and `tech=` (repeatable or comma-separated) keeps projects using all
+    of the given technologies.
+    """
+    if limit is None and cursor is None and fields is None and not tech:
+        try:
+            entry = await get_projects_entry()
+        except Exception as e:
+            print(f"Error getting projects: {e}")
+            raise HTTPException(status_code=500, detail="Database error")
+        return conditional_response(request, entry.body, "application/json", entry.etag, entry.last_modified, "api")
+
+    selected = list(PROJECT_FIELDS)
+    if fields is not None:
+        selected = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [f for f in selected if f not in PROJECT_FIELDS]
+        if unknown or not selected:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields requested")
+    techs = [t.strip() for value in tech for t in value.split(",") if t.strip()]
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
     try:
-        projects_orm = db.query(ProjectModel).order_by(ProjectModel.id.asc()).all()
-        
-        projects = []
-        for p in projects_orm:
-            projects.append({
-                "id": p.id,
-                "title": p.title,
-                "desc": p.desc,
-                "tech": json.loads(p.tech),
-                "links": json.loads(p.links)
-            })
-        return {"success": True, "projects": projects}
+        page = await run_db(query_projects, selected, techs, after, limit or PROJECTS_DEFAULT_LIMIT)
+    except Exception as e:
+        print(f"Error querying projects: {e}")
+        raise HTTPException(status_code=500, detail="Database error")
+    body = json.dumps(page, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return conditional_response(request, body, "application/json", make_etag(body), None, "api")
+
+@app.get("/api/projects/search")
+async def search_projects_route(
+    request: Request,
+    q: str = Query(..., max_length=200),
+    limit: int = Query(SEARCH_DEFAULT_LIMIT, ge=1, le=SEARCH_MAX_LIMIT),
+    offset: int = Query(0, ge=0)
+):
+    """
+    Full-text search over title, tech and description. Every word is a
+    prefix match, results are ranked (title > tech > description), and
+    `title`/`snippet` are HTML with matches wrapped in <mark>.
+    """
+    terms = search_terms(q)
+    if not terms:
+        raise HTTPException(status_code=400, detail="Search query has no words")
+
+    try:
+        page = await run_db(search_projects, terms, limit, offset)
     except Exception as e:
-        print(f"Error getting projects: {e}")
+        print(f"Error searching projects: {e}")
+        raise HTTPException(status_code=500, detail="Search failed")
+    page["query"] = q
+    body = json.dumps(page, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return conditional_response(request, body, "application/json", make_etag(body), None, "api")
+
+@app.get("/api/projects/{project_id:int}")
+async def get_project(project_id: int):
+    """Get a single project"""
+    def load(db: Session):
+        project = db.get(ProjectModel, project_id)
+        return project_to_dict(project) if project else None
+
+    try:
+        project = await run_db(load)
+    except Exception as e:
+        print(f"Error getting project: {e}")
         raise HTTPException(status_code=500, detail="Database error")
+    if project is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return {"success": True, "project": project}
 
 @app.post("/api/projects")
-async def create_project(project: Project, session_token: str = Header(None, alias="X-Session-Token"), db: Session = Depends(get_db)):
+async def create_project(project: Project, background_tasks: BackgroundTasks, session_token: str = Header(None, alias="X-Session-Token")):
     """Create a new project (admin only)"""
     if not session_token:
         raise HTTPException(status_code=401, detail="Session token required")
-    verify_session(session_token)
-    
-    try:
+    await verify_session(session_token)
+
+    def insert(db: Session) -> int:
         tech_str = json.dumps(project.tech)
         links_str = json.dumps(project.links)
+        version = bump_projects_version(db)
         
         new_project = ProjectModel(
             title=project.title,
             desc=project.desc,
             tech=tech_str,
-            links=links_str
+            links=links_str,
+            position=next_project_position(db),
+            updated_version=version
         )
         db.add(new_project)
+        db.flush()
+        replace_project_tech(db, new_project.id, project.tech)
+        index_project_search(db, [new_project.id])
         db.commit()
         db.refresh(new_project)
+        projects_cache.refresh_after_write(db)
+        return new_project.id, version
+    
+    try:
+        new_id, version = await run_db(insert)
+        change_feed.notify()
+        schedule_static_export(background_tasks, "projects")
         
         project_dict = project.model_dump()
-        project_dict['id'] = new_project.id
-        return {"success": True, "project": project_dict}
+        project_dict['id'] = new_id
+        return {"success": True, "project": project_dict, "version": version}
         
     except Exception as e:
         print(f"Error creating project: {e}")
         raise HTTPException(status_code=500, detail="Database insert failed")
 
+BATCH_MAX_OPERATIONS = 500
+
+def project_values(project: Project) -> dict:
+    return {
+        "title": project.title,
+        "desc": project.desc,
+        "tech": json.dumps(project.tech),
+        "links": json.dumps(project.links)
+    }
+
+def apply_project_batch(db: Session, batch: ProjectBatch) -> dict:
+    """
+    Apply a batch in one transaction: one existence check, then a bulk
+    statement per kind of change (delete, update, insert, tech rows,
+    positions) and a single commit. Any error rolls the whole batch back.
+    """
+    creates = [op for op in batch.operations if op.op == "create"]
+    updates = [op for op in batch.operations if op.op == "update"]
+    deletes = [op for op in batch.operations if op.op == "delete"]
+    if any(op.project is None for op in creates + updates) or any(op.id is None for op in updates + deletes):
+        raise HTTPException(status_code=400, detail="create/update need a project; update/delete need an id")
+    targeted = [op.id for op in updates + deletes]
+    if len(set(targeted)) != len(targeted):
+        raise HTTPException(status_code=400, detail="Each project may only be updated or deleted once per batch")
+    if targeted:
+        found = set(db.execute(select(ProjectModel.id).where(ProjectModel.id.in_(targeted))).scalars())
+        missing = sorted(set(targeted) - found)
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Projects not found: {missing}")
+
+    # Taken before any change: the version row lock serializes concurrent
+    # batches, so comparing the bumped value is race-free (a read before
+    # the lock would let two batches pass the same expected_version).
+    # Every row touched below is stamped with it for the change feed.
+    version = bump_projects_version(db)
+    if batch.expected_version is not None and version != batch.expected_version + 1:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Projects changed since they were loaded")
+
+    delete_ids = [op.id for op in deletes]
+    if delete_ids:
+        db.execute(delete_stmt(ProjectTechModel).where(ProjectTechModel.project_id.in_(delete_ids)))
+        db.execute(delete_stmt(ProjectModel).where(ProjectModel.id.in_(delete_ids)))
+        record_project_deletions(db, delete_ids, version)
+
+    if updates:
+        # ORM bulk UPDATE by primary key: one executemany
+        db.execute(update_stmt(ProjectModel), [
+            {"id": op.id, "updated_version": version, **project_values(op.project)} for op in updates
+        ])
+        db.execute(delete_stmt(ProjectTechModel).where(ProjectTechModel.project_id.in_([op.id for op in updates])))
+
+    created = {}
+    new_ids = []
+    if creates:
+        start = next_project_position(db)
+        new_ids = db.execute(
+            insert_stmt(ProjectModel).returning(ProjectModel.id, sort_by_parameter_order=True),
+            [{**project_values(op.project), "position": start + i, "updated_version": version} for i, op in enumerate(creates)]
+        ).scalars().all()
+        created = {op.ref: new_id for op, new_id in zip(creates, new_ids) if op.ref}
+
+    tech_rows = [
+        {"project_id": project_id, "position": i, "name": name, "name_key": name.strip().lower()}
+        for project_id, op in [(op.id, op) for op in updates] + list(zip(new_ids, creates))
+        for i, name in enumerate(op.project.tech)
+    ]
+    if tech_rows:
+        db.execute(insert_stmt(ProjectTechModel), tech_rows)
+    index_project_search(db, targeted + list(new_ids))
+
+    if batch.order is not None:
+        listed = []
+        for item in batch.order:
+            if isinstance(item, str):
+                if item not in created:
+                    raise HTTPException(status_code=400, detail=f"Unknown ref in order: {item}")
+                item = created[item]
+            listed.append(item)
+        current = db.execute(select(ProjectModel.id, ProjectModel.position).order_by(ProjectModel.position, ProjectModel.id)).all()
+        positions = dict(current)
+        unknown = [pid for pid in listed if pid not in positions]
+        if unknown or len(set(listed)) != len(listed):
+            raise HTTPException(status_code=400, detail=f"Order lists unknown or repeated projects: {unknown}")
+        # Listed projects first, the rest keep their relative order after them
+        listed_set = set(listed)
+        ordered = listed + [pid for pid, _ in current if pid not in listed_set]
+        changes = [{"id": pid, "position": n, "updated_version": version} for n, pid in enumerate(ordered, 1) if positions[pid] != n]
+        if changes:
+            db.execute(update_stmt(ProjectModel), changes)
+
+    db.commit()
+    projects_cache.refresh_after_write(db)
+    return {"success": True, "version": version, "created": created}
+
+@app.post("/api/projects/batch")
+async def batch_projects(batch: ProjectBatch, background_tasks: BackgroundTasks, session_token: str = Header(None, alias="X-Session-Token")):
+    """Create, update, delete and reorder projects in one transaction (admin only)"""
+    if not session_token:
+        raise HTTPException(status_code=401, detail="Session token required")
+    await verify_session(session_token)
+    if not batch.operations and batch.order is None:
+        raise HTTPException(status_code=400, detail="Empty batch")
+    if len(batch.operations) > BATCH_MAX_OPERATIONS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_OPERATIONS} operations per batch")
+
+    try:
+        result = await run_db(apply_project_batch, batch)
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Error applying project batch: {e}")
+        raise HTTPException(status_code=500, detail="Database batch failed")
+    change_feed.notify()
+    schedule_static_export(background_tasks, "projects")
+    return result
+
 @app.put("/api/projects/{project_id}")
-async def update_project(project_id: int, project: Project, session_token: str = Header(None, alias="X-Session-Token"), db: Session = Depends(get_db)):
+async def update_project(project_id: int, project: Project, background_tasks: BackgroundTasks, session_token: str = Header(None, alias="X-Session-Token")):
     """Update a project (admin only)"""
     if not session_token:
         raise HTTPException(status_code=401, detail="Session token required")
-    verify_session(session_token)
-    
-    try:
+    await verify_session(session_token)
+
+    def update(db: Session):
         existing_project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
         if not existing_project:
             raise HTTPException(status_code=404, detail="Project not found")
@@ -353,13 +2583,24 @@ async def update_project(project_id: int, project: Project, session_token: str =
         existing_project.desc = project.desc
         existing_project.tech = json.dumps(project.tech)
         existing_project.links = json.dumps(project.links)
+        version = bump_projects_version(db)
+        existing_project.updated_version = version
+        replace_project_tech(db, project_id, project.tech)
+        index_project_search(db, [project_id])
         
         db.commit()
         db.refresh(existing_project)
+        projects_cache.refresh_after_write(db)
+        return version
+    
+    try:
+        version = await run_db(update)
+        change_feed.notify()
+        schedule_static_export(background_tasks, "projects")
         
         project_dict = project.model_dump()
         project_dict['id'] = project_id
-        return {"success": True, "project": project_dict}
+        return {"success": True, "project": project_dict, "version": version}
         
     except HTTPException:
         raise
@@ -368,20 +2609,31 @@ async def update_project(project_id: int, project: Project, session_token: str =
         raise HTTPException(status_code=500, detail="Database update failed")
 
 @app.delete("/api/projects/{project_id}")
-async def delete_project(project_id: int, session_token: str = Header(None, alias="X-Session-Token"), db: Session = Depends(get_db)):
+async def delete_project(project_id: int, background_tasks: BackgroundTasks, session_token: str = Header(None, alias="X-Session-Token")):
     """Delete a project (admin only)"""
     if not session_token:
         raise HTTPException(status_code=401, detail="Session token required")
-    verify_session(session_token)
-    
-    try:
+    await verify_session(session_token)
+
+    def delete(db: Session):
         existing_project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
         if not existing_project:
             raise HTTPException(status_code=404, detail="Project not found")
             
+        db.query(ProjectTechModel).filter(ProjectTechModel.project_id == project_id).delete(synchronize_session=False)
         db.delete(existing_project)
+        index_project_search(db, [project_id])
+        version = bump_projects_version(db)
+        record_project_deletions(db, [project_id], version)
         db.commit()
-        return {"success": True}
+        projects_cache.refresh_after_write(db)
+        return version
+    
+    try:
+        version = await run_db(delete)
+        change_feed.notify()
+        schedule_static_export(background_tasks, "projects")
+        return {"success": True, "version": version}
         
     except HTTPException:
         raise
@@ -389,197 +2641,1165 @@ async def delete_project(project_id: int, session_token: str = Header(None, alia
         print(f"Error deleting project: {e}")
         raise HTTPException(status_code=500, detail="Database delete failed")
 
+# ============================================
+# CHANGE FEED
+# ============================================
+
+# Every project write stamps the rows it touches with the new
+# projects_version (deletions leave a tombstone), so "what changed since
+# version N" is one indexed query. Clients poll /api/projects/changes or
+# hold an SSE stream; either way a `reset` answer means "reload the list".
+CHANGES_MAX_ROWS = int(os.getenv("CHANGES_MAX_ROWS", "1000"))  # Larger deltas ask the client to reload instead
+# Tombstones older than this many versions are pruned; clients further behind get a reset
+CHANGES_RETENTION_VERSIONS = int(os.getenv("CHANGES_RETENTION_VERSIONS", "10000"))
+CHANGE_FEED_POLL_SECONDS = float(os.getenv("CHANGE_FEED_POLL_SECONDS", "2"))  # Picks up other workers' writes
+CHANGE_FEED_BACKLOG = 64  # Recent encoded events kept for subscribers that are a few behind
+SSE_KEEPALIVE_SECONDS = float(os.getenv("SSE_KEEPALIVE_SECONDS", "15"))
+SSE_MAX_STREAM_SECONDS = float(os.getenv("SSE_MAX_STREAM_SECONDS", "300"))  # Clients reconnect with Last-Event-ID
+SSE_RETRY_MS = 3000
+SSE_MAX_SUBSCRIBERS = int(os.getenv("SSE_MAX_SUBSCRIBERS", "1000"))  # Per process
+CHANGE_STREAM_PATH = "/api/projects/changes/stream"
+API_COMPRESSION_EXCLUDED_PATHS.add(CHANGE_STREAM_PATH)  # Events must not sit in a gzip buffer
+
+def query_project_changes(db: Session, since: int) -> dict:
+    """
+    Projects changed and ids deleted after version `since`. The version is
+    read first: writers serialize on the version row, so anything newer
+    that slips in is a complete later change and only moves the reported
+    version forward.
+    """
+    version = read_projects_version(db)
+    reset = {"success": True, "since": since, "version": version, "reset": True, "changed": [], "deleted": []}
+    if since > version:
+        return reset  # Client is ahead of this database (e.g. after a restore)
+    if since < version - CHANGES_RETENTION_VERSIONS:
+        return reset  # Deletions that old may have been pruned
+    rows = db.query(ProjectModel).filter(ProjectModel.updated_version > since).order_by(
+        ProjectModel.position.asc(), ProjectModel.id.asc()
+    ).limit(CHANGES_MAX_ROWS + 1).all()
+    if len(rows) > CHANGES_MAX_ROWS:
+        return reset
+    deleted = db.execute(
+        select(ProjectTombstoneModel.project_id, ProjectTombstoneModel.deleted_version)
+        .where(ProjectTombstoneModel.deleted_version > since)
+        .where(ProjectTombstoneModel.project_id.not_in(select(ProjectModel.id)))  # Reused ids count as changed
+    ).all()
+    version = max([version] + [p.updated_version for p in rows] + [v for _, v in deleted])
+    return {
+        "success": True,
+        "since": since,
+        "version": version,
+        "reset": False,
+        "changed": [{**project_to_dict(p), "position": p.position} for p in rows],
+        "deleted": [pid for pid, _ in deleted]
+    }
+
+def encode_sse(event: str, data: dict, event_id: Optional[int] = None) -> bytes:
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append("data: " + json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+def encode_delta(delta: dict) -> bytes:
+    return encode_sse("reset" if delta["reset"] else "changes", delta, delta["version"])
+
+class FeedEvent(NamedTuple):
+    seq: int
+    since: int
+    version: int
+    data: bytes
+
+class ChangeFeed:
+    """
+    Fans project deltas out to SSE subscribers. One publisher task per
+    process notices new versions (local writes call notify(); other
+    workers' writes are found by polling the version while anyone is
+    subscribed), queries each delta once and shares the encoded event.
+    Idle subscribers only await an asyncio.Event, so they hold no database
+    session and cost no queries.
+    """
+    def __init__(self, backlog: int):
+        self.events = deque(maxlen=backlog)
+        self.seq = 0
+        self.version: Optional[int] = None  # Version the last event brought subscribers to
+        self.subscribers = 0
+        self.closing = False
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._published: Optional[asyncio.Event] = None
+
+    def notify(self):
+        """Called on the event loop after a local project write commits"""
+        if self._wake is not None:
+            self._wake.set()
+
+    def close(self):
+        """Let open streams finish (app shutdown)"""
+        self.closing = True
+        if self._published is not None:
+            self._published.set()
+
+    def _ensure_publisher(self):
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            self._published = asyncio.Event()
+            self.version = None
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while self.subscribers and not self.closing:
+            try:
+                await self._publish()
+            except Exception as e:
+                print(f"Change feed error: {e}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), CHANGE_FEED_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def _publish(self):
+        current = await run_db(read_projects_version)
+        if self.version is None:
+            self.version = current
+            return
+        if current == self.version:
+            return
+        delta = await run_db(query_project_changes, self.version)
+        self.seq += 1
+        self.events.append(FeedEvent(self.seq, self.version, delta["version"], encode_delta(delta)))
+        self.version = delta["version"]
+        published, self._published = self._published, asyncio.Event()
+        published.set()
+
+    async def stream(self, since: Optional[int]):
+        """Async iterator of SSE bytes for one subscriber, starting after version `since`"""
+        self.subscribers += 1
+        self._ensure_publisher()
+        seen = self.seq
+        try:
+            yield f"retry: {SSE_RETRY_MS}\n\n".encode("ascii")
+            # Catch up from the client's version; after this a subscriber only
+            # queries again if it falls out of step with the shared events
+            if since is None:
+                cursor = await run_db(read_projects_version)
+                yield encode_sse("ready", {"version": cursor}, cursor)
+            else:
+                delta = await run_db(query_project_changes, since)
+                cursor = delta["version"]
+                yield encode_delta(delta) if delta["changed"] or delta["deleted"] or delta["reset"] else encode_sse("ready", {"version": cursor}, cursor)
+
+            deadline = time.monotonic() + SSE_MAX_STREAM_SECONDS
+            queried_at = None  # Feed seq of the last direct query; at most one per published event
+            while not self.closing and time.monotonic() < deadline:
+                published = self._published
+                pending = [e for e in self.events if e.seq > seen]
+                if pending and pending[0].seq == seen + 1 and pending[0].since <= cursor:
+                    for item in pending:
+                        yield item.data
+                    seen, cursor = pending[-1].seq, pending[-1].version
+                elif pending or (self.version is not None and cursor < self.version and queried_at != self.seq):
+                    # Fell behind the backlog, or joined while a change was being published
+                    seen = queried_at = self.seq
+                    delta = await run_db(query_project_changes, cursor)
+                    cursor = delta["version"]
+                    if delta["changed"] or delta["deleted"] or delta["reset"]:
+                        yield encode_delta(delta)
+                else:
+                    try:
+                        await asyncio.wait_for(published.wait(), SSE_KEEPALIVE_SECONDS)
+                    except asyncio.TimeoutError:
+                        yield b": keepalive\n\n"
+        finally:
+            self.subscribers -= 1
+
+change_feed = ChangeFeed(CHANGE_FEED_BACKLOG)
+
+@app.get("/api/projects/changes")
+async def get_project_changes(since: int = Query(..., ge=0)):
+    """
+    Projects changed (with their position) and ids deleted after version
+    `since`, plus the version to ask from next time. `reset: true` means
+    the delta is unavailable and the client should reload /api/projects.
+    """
+    try:
+        return await run_db(query_project_changes, since)
+    except Exception as e:
+        print(f"Error reading project changes: {e}")
+        raise HTTPException(status_code=500, detail="Database error")
+
+@app.get(CHANGE_STREAM_PATH)
+async def stream_project_changes(
+    since: Optional[int] = Query(None, ge=0),
+    last_event_id: Optional[str] = Header(None),
+    session_token: str = Header(None, alias="X-Session-Token")
+):
+    """
+    Server-Sent Events stream of project deltas (`changes` / `reset`
+    events, same payload as /api/projects/changes) for admin dashboards.
+    Reconnecting clients resume from Last-Event-ID or `since`.
+    """
+    if not session_token:
+        raise HTTPException(status_code=401, detail="Session token required")
+    await verify_session(session_token)
+    if last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+    if change_feed.subscribers >= SSE_MAX_SUBSCRIBERS:
+        raise HTTPException(status_code=503, detail="Too many change feed subscribers")
+    return StreamingResponse(
+        change_feed.stream(since),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"}
+    )
+
 # Resume API
+async def get_resume():
+    """Resume bytes and metadata; the database is read on first use and after another process changed it"""
+    try:
+        await cache_validator.check()
+        if resume_cache.loaded:
+            return resume_cache.current()
+        return await run_db(resume_cache.load_from)
+    except Exception as e:
+        print(f"Error fetching resume: {e}")
+        return None, None
+
 @app.get("/api/resume")
-async def get_resume_data(db: Session = Depends(get_db)):
-    """Get resume data"""
+async def get_resume_data():
+    """Get resume metadata (the PDF itself is served by /api/resume/AtharvaZ)"""
+    _, meta = await get_resume()
+    if meta:
+        public_meta = {k: v for k, v in meta.items() if k not in ("etag", "last_modified")}
+        return {"success": True, "data": {**public_meta, "url": "/api/resume/AtharvaZ"}}
+    return {"success": False, "message": "No resume uploaded"}
+
+RESUME_MAX_BYTES = int(os.getenv("RESUME_MAX_BYTES", str(10 * 1024 * 1024)))
+RESUME_UPLOAD_FIELD = "file"
+RESUME_SPOOL_BYTES = 1024 * 1024  # Larger uploads spill to a temp file
+PDF_SIGNATURE = b"%PDF-"
+
+class ResumeUploadError(Exception):
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+class ResumeUpload:
+    """
+    Incremental multipart receiver for the resume. Only the `file` part is
+    kept; its bytes are hashed and spooled as they arrive, so the size
+    limit and the PDF signature check fail the upload on the first
+    offending chunk instead of after the whole body is read.
+    """
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.file = tempfile.SpooledTemporaryFile(max_size=RESUME_SPOOL_BYTES)
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.head = b""
+        self.found = False
+        self._header_field = b""
+        self._header_value = b""
+        self._disposition = b""
+        self._in_file = False
+
+    def parser(self, boundary: bytes):
+        def on_header_field(data, start, end):
+            self._header_field += data[start:end]
+
+        def on_header_value(data, start, end):
+            self._header_value += data[start:end]
+
+        def on_header_end():
+            if self._header_field.lower() == b"content-disposition":
+                self._disposition = self._header_value
+            self._header_field = self._header_value = b""
+
+        def on_headers_finished():
+            _, options = parse_options_header(self._disposition)
+            self._in_file = options.get(b"name") == RESUME_UPLOAD_FIELD.encode() and not self.found
+            self.found = self.found or self._in_file
+            self._disposition = b""
+
+        def on_part_data(data, start, end):
+            if self._in_file:
+                self.write(data[start:end])
+
+        def on_part_end():
+            self._in_file = False
+
+        return MultipartParser(boundary, {
+            "on_header_field": on_header_field,
+            "on_header_value": on_header_value,
+            "on_header_end": on_header_end,
+            "on_headers_finished": on_headers_finished,
+            "on_part_data": on_part_data,
+            "on_part_end": on_part_end,
+        })
+
+    def write(self, chunk: bytes):
+        if len(self.head) < len(PDF_SIGNATURE):
+            self.head += chunk[:len(PDF_SIGNATURE) - len(self.head)]
+            if not PDF_SIGNATURE.startswith(self.head):
+                raise ResumeUploadError(400, "Uploaded file is not a PDF")
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise ResumeUploadError(413, f"Resume exceeds the {self.max_bytes} byte limit")
+        self.digest.update(chunk)
+        self.file.write(chunk)
+
+    def read_all(self) -> bytes:
+        self.file.seek(0)
+        return self.file.read()
+
+    def close(self):
+        self.file.close()
+
+async def receive_resume_upload(request: Request) -> ResumeUpload:
+    """Stream a multipart/form-data body into a ResumeUpload"""
+    content_type = request.headers.get("content-type", "")
+    media_type, _, params = content_type.partition(";")
+    if media_type.strip().lower() != "multipart/form-data":
+        raise ResumeUploadError(415, "Expected multipart/form-data with a 'file' field")
+    boundary = None
+    for param in params.split(";"):
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "boundary":
+            boundary = value.strip('"')
+    if not boundary:
+        raise ResumeUploadError(400, "Multipart boundary missing")
+
+    # Reject obviously oversized bodies before reading anything
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > RESUME_MAX_BYTES + 64 * 1024:
+        raise ResumeUploadError(413, f"Resume exceeds the {RESUME_MAX_BYTES} byte limit")
+
+    upload = ResumeUpload(RESUME_MAX_BYTES)
     try:
-        config = db.query(SiteConfigModel).filter(SiteConfigModel.key == "resume_pdf").first()
-        resume_data = config.value if config else None
-        
-        if resume_data:
-            return {"success": True, "data": resume_data}
-        return {"success": False, "message": "No resume uploaded"}
+        parser = upload.parser(boundary.encode("latin-1"))
+        async for chunk in request.stream():
+            parser.write(chunk)
+        parser.finalize()
+    except ResumeUploadError:
+        upload.close()
+        raise
     except Exception as e:
-        print(f"Error getting resume: {e}")
-        return {"success": False, "message": "Error fetching resume"}
+        upload.close()
+        raise ResumeUploadError(400, f"Malformed multipart body: {e}")
+    if not upload.found or upload.size == 0:
+        upload.close()
+        raise ResumeUploadError(400, "No resume file provided")
+    if upload.head != PDF_SIGNATURE:
+        upload.close()
+        raise ResumeUploadError(400, "Uploaded file is not a PDF")
+    return upload
 
 @app.post("/api/resume")
-async def upload_resume(resume: ResumeResponse, session_token: str = Header(None, alias="X-Session-Token"), db: Session = Depends(get_db)):
-    """Upload resume (admin only)"""
+async def upload_resume(request: Request, background_tasks: BackgroundTasks, session_token: str = Header(None, alias="X-Session-Token")):
+    """Upload resume as multipart/form-data field `file` (admin only)"""
     if not session_token:
         raise HTTPException(status_code=401, detail="Session token required")
-    verify_session(session_token)
-    
-    if not resume.data:
-         raise HTTPException(status_code=400, detail="No resume data provided")
-         
+    await verify_session(session_token)
+
     try:
-        config = db.query(SiteConfigModel).filter(SiteConfigModel.key == "resume_pdf").first()
-        if config:
-            config.value = resume.data
-        else:
-            new_config = SiteConfigModel(key="resume_pdf", value=resume.data)
-            db.add(new_config)
-            
-        db.commit()
-        return {"success": True, "message": "Resume uploaded successfully"}
+        upload = await receive_resume_upload(request)
+    except ResumeUploadError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+    sha256 = upload.digest.hexdigest()
+
+    def save(db: Session):
+        try:
+            stored = store_resume(db, upload.read_all(), sha256=sha256)
+            db.commit()
+            db.refresh(stored)
+            # Bytes and metadata are swapped in together under the cache lock
+            resume_cache.set(stored)
+        except Exception:
+            db.rollback()
+            raise
+
+    try:
+        await run_db(save)
+        schedule_static_export(background_tasks, "resume")
+        return {"success": True, "message": "Resume uploaded successfully", "size": upload.size, "sha256": sha256}
     except Exception as e:
          print(f"Error saving resume: {e}")
          raise HTTPException(status_code=500, detail="Database error")
+    finally:
+        upload.close()
 
-@app.get("/api/resume/AtharvaZ")
-async def view_resume(db: Session = Depends(get_db)):
-    """Serve resume PDF for viewing in browser"""
-    try:
-        config = db.query(SiteConfigModel).filter(SiteConfigModel.key == "resume_pdf").first()
-        resume_data = config.value if config else None
-    except Exception as e:
-        print(f"Error fetching resume for view: {e}")
-        resume_data = None
+@app.api_route("/api/resume/AtharvaZ", methods=["GET", "HEAD"])
+async def view_resume(request: Request):
+    """Serve resume PDF for viewing in browser (supports HEAD and byte ranges for PDF viewers)"""
+    pdf_bytes, meta = await get_resume()
         
-    if not resume_data:
+    if not pdf_bytes:
         return HTMLResponse(content="<h1>No resume uploaded</h1>", status_code=404)
-    
-    # Handle Data URI if present
-    pdf_b64 = resume_data
-    if "base64," in resume_data:
-        pdf_b64 = resume_data.split("base64,")[1]
-        
-    try:
-        # Decode base64 to bytes
-        pdf_bytes = base64.b64decode(pdf_b64)
-        
-        # Return as PDF with inline disposition
-        return Response(
-            content=pdf_bytes, 
-            media_type="application/pdf", 
-            headers={"Content-Disposition": "inline; filename=AtharvaZ.pdf"}
-        )
-    except Exception as e:
-        print(f"Error decoding PDF: {e}")
-        return HTMLResponse(content="<h1>Error loading resume</h1>", status_code=500)
+
+    # Return as PDF with inline disposition
+    return ranged_response(
+        request,
+        pdf_bytes,
+        meta["content_type"],
+        meta["etag"],
+        meta["last_modified"],
+        "resume",
+        headers={"Content-Disposition": "inline; filename=AtharvaZ.pdf"}
+    )
 
 # Contact Form API
 @app.post("/api/contact")
 async def submit_contact_form(form: ContactForm):
     """
-    Handle contact form submissions and send email notification using Resend
+    Queue a contact form submission; the outbox worker sends the email notification
     """
+    # Validate that email configuration is set
+    if isinstance(email_transport, ResendTransport) and (not RESEND_API_KEY or not RECIPIENT_EMAIL):
+        raise HTTPException(
+            status_code=500,
+            detail="Email configuration is missing. Please set EMAIL_SECRET_KEY and RECIPIENT_EMAIL environment variables."
+        )
+
     try:
-        # Validate that email configuration is set
-        if not RESEND_API_KEY or not RECIPIENT_EMAIL:
-            raise HTTPException(
-                status_code=500,
-                detail="Email configuration is missing. Please set EMAIL_SECRET_KEY and RECIPIENT_EMAIL environment variables."
-            )
+        await run_db(enqueue_contact_message, form)
+    except Exception as e:
+        print(f"Error queueing contact message: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"An error occurred: {str(e)}"
+        )
+    notify_email_worker()
+
+    return {
+        "success": True,
+        "message": "Your message has been sent successfully!"
+    }
+
+# ============================================
+# BACKUP AND RESTORE
+# ============================================
+
+# Online backups of the content (see backup.py). Backups are written to
+# BACKUP_DIR and restored from there by name; one operation at a time.
+# Kept outside BASE_DIR by default: everything under it is reachable through serve_static
+BACKUP_DIR = os.getenv("BACKUP_DIR", str(Path.home() / ".local" / "share" / "portfolio" / "backups"))
+backup_lock = asyncio.Lock()
+
+class RestoreRequest(BaseModel):
+    name: str
 
-        # Send email using Resend
+def backup_file(name: str) -> Path:
+    """A backup in BACKUP_DIR by bare file name (no paths)"""
+    if not name or name != Path(name).name or name.startswith("."):
+        raise HTTPException(status_code=400, detail="Invalid backup name")
+    path = Path(BACKUP_DIR) / name
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="Backup not found")
+    return path
+
+def reset_content_caches():
+    """Drop every in-process copy of database content after a restore"""
+    projects_cache.invalidate()
+    resume_cache.invalidate()
+    rendered_index.invalidate()
+    sessions.clear_local()
+
+@app.get("/api/admin/backups")
+async def list_backups(session_token: str = Header(None, alias="X-Session-Token")):
+    """List backups in BACKUP_DIR, newest first (admin only)"""
+    if not session_token:
+        raise HTTPException(status_code=401, detail="Session token required")
+    await verify_session(session_token)
+    directory = Path(BACKUP_DIR)
+    files = sorted(directory.glob("portfolio-*.gz"), key=lambda p: p.stat().st_mtime, reverse=True) if directory.is_dir() else []
+    return {
+        "success": True,
+        "backups": [{"name": p.name, "size": p.stat().st_size, "created": datetime.fromtimestamp(p.stat().st_mtime, timezone.utc).isoformat()} for p in files]
+    }
+
+@app.post("/api/admin/backups")
+async def create_backup_route(session_token: str = Header(None, alias="X-Session-Token")):
+    """Take an online backup while the site keeps serving (admin only)"""
+    if not session_token:
+        raise HTTPException(status_code=401, detail="Session token required")
+    await verify_session(session_token)
+    import backup
+
+    if backup_lock.locked():
+        raise HTTPException(status_code=409, detail="A backup or restore is already running")
+    async with backup_lock:
+        target = Path(BACKUP_DIR) / backup.default_backup_name(sys.modules[__name__])
         try:
-            if not RESEND_API_KEY:
-                raise HTTPException(
-                    status_code=500,
-                    detail="Resend API key not configured. Please set EMAIL_SECRET_KEY in .env"
-                )
-            
-            params = {
-                "from": RESEND_FROM_EMAIL,
-                "to": [RECIPIENT_EMAIL],
-                "subject": f"New Contact Form Submission from {form.name}",
-                "html": f"""
-                <h2>Contact Personal Website Submission</h2>
-                <p>You've received a new message from your portfolio website:</p>
+            stats = await run_blocking(backup.create_backup, sys.modules[__name__], target)
+        except Exception as e:
+            print(f"Backup failed: {e}")
+            raise HTTPException(status_code=500, detail="Backup failed")
+    return {"success": True, "name": target.name, **{k: v for k, v in stats.items() if k != "file"}}
 
-                <h3>Contact Information:</h3>
-                <ul>
-                    <li><strong>Name:</strong> {form.name}</li>
-                    <li><strong>Email:</strong> {form.email}</li>
-                </ul>
+@app.get("/api/admin/backups/{name}")
+async def download_backup(name: str, session_token: str = Header(None, alias="X-Session-Token")):
+    """Download a backup file (admin only)"""
+    if not session_token:
+        raise HTTPException(status_code=401, detail="Session token required")
+    await verify_session(session_token)
+    path = backup_file(name)
+    return FileResponse(path, media_type="application/gzip", filename=path.name, headers={"Cache-Control": "no-store"})
 
-                <h3>Message:</h3>
-                <p>{form.message.replace(chr(10), '<br>')}</p>
+@app.post("/api/admin/restore")
+async def restore_backup_route(restore: RestoreRequest, background_tasks: BackgroundTasks, session_token: str = Header(None, alias="X-Session-Token")):
+    """Replace the content with a backup from BACKUP_DIR in one transaction (admin only)"""
+    if not session_token:
+        raise HTTPException(status_code=401, detail="Session token required")
+    await verify_session(session_token)
+    import backup
 
-                <hr>
-                <p style="color: #666; font-size: 12px;">This email was sent from your portfolio contact form.</p>
-                """,
-            }
-            
-            print(f"Attempting to send email to: {RECIPIENT_EMAIL}")
-            email_response = resend.Emails.send(params)
-            print(f"Resend API Response: {email_response}")
+    path = backup_file(restore.name)
+    if backup_lock.locked():
+        raise HTTPException(status_code=409, detail="A backup or restore is already running")
+    async with backup_lock:
+        try:
+            stats = await run_blocking(backup.restore_backup, sys.modules[__name__], path)
+        except backup.BackupError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            print(f"Restore failed: {e}")
+            raise HTTPException(status_code=500, detail="Restore failed")
+        finally:
+            # Also after a failure: a partial SQLite step may have run before the error
+            reset_content_caches()
+    change_feed.notify()
+    schedule_static_export(background_tasks, "projects", "resume")
+    return {"success": True, **stats}
 
+# ============================================
+# STATIC FILE SERVING (must come after API routes)
+# ============================================
+
+_brotli = None
+
+def get_brotli():
+    """The optional brotli module, imported on first use (None if not installed)"""
+    global _brotli
+    if _brotli is None:
+        try:
+            import brotli
+            _brotli = brotli
+        except ImportError:  # .br variants are skipped without it
+            _brotli = False
+    return _brotli or None
+
+# Precompressed variants of text assets live outside the source tree
+STATIC_CACHE_DIR = Path(os.getenv("STATIC_CACHE_DIR", BASE_DIR / ".static_cache"))
+COMPRESSIBLE_EXTENSIONS = {".html", ".css", ".js", ".svg", ".json", ".txt"}
+PRECOMPRESS_MIN_SIZE = 256
+SKIP_DIRS = {"venv", ".venv", "node_modules", "__pycache__"}
+
+MEDIA_TYPES = {
+    ".css": "text/css",
+    ".js": "application/javascript",
+    ".html": "text/html",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".svg": "image/svg+xml",
+}
+
+def iter_text_assets():
+    """Yield compressible files under BASE_DIR, skipping hidden and tool directories"""
+    for root, dirs, files in os.walk(BASE_DIR):
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d not in SKIP_DIRS]
+        for name in files:
+            path = Path(root) / name
+            if path.suffix in COMPRESSIBLE_EXTENSIONS:
+                yield path
+
+def variant_path(file_path: Path, encoding: str) -> Path:
+    suffix = ".br" if encoding == "br" else ".gz"
+    return STATIC_CACHE_DIR / (str(file_path.relative_to(BASE_DIR)) + suffix)
+
+def precompress_file(path: Path) -> int:
+    """Write missing or stale compressed variants for one file; returns how many were written"""
+    st = path.stat()
+    if st.st_size < PRECOMPRESS_MIN_SIZE:
+        return 0
+    written = 0
+    data = None
+    for encoding in ("gzip", "br"):
+        if encoding == "br" and get_brotli() is None:
+            continue
+        target = variant_path(path, encoding)
+        if target.exists() and target.stat().st_mtime_ns >= st.st_mtime_ns:
+            continue
+        if data is None:
+            data = path.read_bytes()
+        if encoding == "br":
+            compressed = get_brotli().compress(data, quality=11)
+        else:
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        if len(compressed) >= len(data):
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Workers, and the background thread in StaticFileCache, may precompress concurrently
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.{secrets.token_hex(4)}.tmp")
+        tmp.write_bytes(compressed)
+        os.replace(tmp, target)
+        written += 1
+    return written
+
+def precompress_static_assets():
+    """
+    Write .gz (and .br when brotli is installed) variants of every text asset.
+    Variants that are newer than their source are left alone, so restarts
+    only recompress files that changed.
+    """
+    written = 0
+    for path in iter_text_assets():
+        try:
+            written += precompress_file(path)
+        except Exception as e:
+            print(f"Precompression failed for {path}: {e}")
+    print(f"Static precompression: {written} variants written to {STATIC_CACHE_DIR}")
+
+def parse_qvalues(header: str) -> dict:
+    """Parse an Accept-style header into {value: q}"""
+    result = {}
+    for part in header.split(","):
+        value, _, params = part.strip().partition(";")
+        if not value:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        result[value.strip().lower()] = q
+    return result
+
+def accepted_encodings(request: Request) -> dict:
+    """Parse Accept-Encoding into {coding: q}"""
+    return parse_qvalues(request.headers.get("accept-encoding", ""))
+
+def preferred_encodings(request: Request, available) -> list:
+    """Encodings from `available` the client accepts, best first"""
+    accepted = accepted_encodings(request)
+    usable = [c for c in available if accepted.get(c, 0.0) > 0]
+    # br beats gzip on equal q-values
+    return sorted(usable, key=lambda c: (-accepted[c], c != "br"))
+
+def pick_precompressed(request: Request, file_path: Path):
+    """Return (path, content_encoding) for the best precompressed variant, or (file_path, None)"""
+    if file_path.suffix not in COMPRESSIBLE_EXTENSIONS:
+        return file_path, None
+    source_mtime = file_path.stat().st_mtime_ns
+    for coding in preferred_encodings(request, ("br", "gzip")):
+        candidate = variant_path(file_path, coding)
+        try:
+            if candidate.stat().st_mtime_ns >= source_mtime:
+                return candidate, coding
+        except FileNotFoundError:
+            continue
+    return file_path, None
+
+# In-memory static file cache
+STATIC_MEMORY_BUDGET = int(os.getenv("STATIC_MEMORY_BUDGET", str(16 * 1024 * 1024)))
+STATIC_MEMORY_MAX_FILE = int(os.getenv("STATIC_MEMORY_MAX_FILE", str(512 * 1024)))
+STATIC_REVALIDATE_SECONDS = float(os.getenv("STATIC_REVALIDATE_SECONDS", "2"))
+
+class CachedFile:
+    """Identity bytes plus precompressed variants of one file, with validators"""
+    __slots__ = ("bodies", "etag", "last_modified", "mtime_ns", "size", "checked_at", "nbytes", "missing_variants")
+
+    def __init__(self, path: Path):
+        st = path.stat()
+        identity = path.read_bytes()
+        self.bodies = {None: identity}
+        self.missing_variants = False
+        if path.suffix in COMPRESSIBLE_EXTENSIONS:
+            # Only variants already on disk; compressing here would block the request
+            for coding in ("br", "gzip"):
+                candidate = variant_path(path, coding)
+                if candidate.exists() and candidate.stat().st_mtime_ns >= st.st_mtime_ns:
+                    self.bodies[coding] = candidate.read_bytes()
+                elif st.st_size >= PRECOMPRESS_MIN_SIZE and (coding == "gzip" or get_brotli() is not None):
+                    self.missing_variants = True
+        self.etag = make_etag(identity)
+        self.last_modified = st.st_mtime
+        self.mtime_ns = st.st_mtime_ns
+        self.size = st.st_size
+        self.checked_at = time.monotonic()
+        self.nbytes = sum(len(b) for b in self.bodies.values())
+
+class StaticFileCache:
+    """
+    LRU cache of small static files held in memory with their compressed
+    variants. Entries are revalidated against the file's mtime at most once
+    every STATIC_REVALIDATE_SECONDS, so edits on disk still show up without
+    a stat() per request.
+    """
+    def __init__(self, budget: int, max_file: int):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, CachedFile]" = OrderedDict()
+        self.budget = budget
+        self.max_file = max_file
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self._pending = set()
+        self._attempted = {}  # key -> mtime_ns the variants were last written for
+
+    def _store(self, key: str, entry: CachedFile):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.used -= old.nbytes
+            self._entries[key] = entry
+            self.used += entry.nbytes
+            while self.used > self.budget and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self.used -= evicted.nbytes
+
+    def get(self, path: Path) -> Optional[CachedFile]:
+        """Return the cached file, loading or reloading it as needed; None if too large"""
+        key = str(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        now = time.monotonic()
+        if entry is not None and now - entry.checked_at < STATIC_REVALIDATE_SECONDS:
+            self.hits += 1
+            return entry
+
+        st = path.stat()
+        if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            entry.checked_at = now
+            self.hits += 1
+            return entry
+        if st.st_size > self.max_file:
+            return None
+
+        self.misses += 1
+        entry = CachedFile(path)
+        self._store(key, entry)
+        if entry.missing_variants and self._attempted.get(key) != entry.mtime_ns:
+            self._precompress_later(key, path, entry.mtime_ns)
+        return entry
+
+    def _precompress_later(self, key: str, path: Path, mtime_ns: int):
+        """
+        Write the missing variants on a background thread, then drop the
+        entry so the next request loads them. Until then identity is served.
+        """
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+
+        def run():
+            try:
+                precompress_file(path)
+            except Exception as e:
+                print(f"Precompression failed for {path}: {e}")
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+                    self._attempted[key] = mtime_ns
+                    entry = self._entries.get(key)
+                    if entry is not None and entry.mtime_ns == mtime_ns:
+                        del self._entries[key]
+                        self.used -= entry.nbytes
+
+        threading.Thread(target=run, name="precompress", daemon=True).start()
+
+    def stats(self) -> dict:
+        with self._lock:
             return {
-                "success": True,
-                "message": "Your message has been sent successfully!"
+                "entries": len(self._entries),
+                "bytes": self.used,
+                "budget": self.budget,
+                "hits": self.hits,
+                "misses": self.misses
             }
+
+    def warm(self, paths):
+        for path in paths:
+            try:
+                if path.exists():
+                    self.get(path)
+            except Exception as e:
+                print(f"Static cache warm-up failed for {path}: {e}")
+
+static_files = StaticFileCache(STATIC_MEMORY_BUDGET, STATIC_MEMORY_MAX_FILE)
+
+def serve_bodies(request: Request, bodies: dict, etag: str, last_modified: float,
+                 media_type: Optional[str], cache_policy: str, vary: bool = True) -> Response:
+    """Serve in-memory content from {content_encoding or None: bytes}, negotiating the encoding"""
+    encoding = next(iter(preferred_encodings(request, [c for c in bodies if c])), None)
+    if encoding:
+        # Each representation needs its own strong validator
+        etag = f'{etag[:-1]}-{encoding}"'
+    headers = validator_headers(etag, last_modified, cache_policy)
+    if vary:
+        headers["Vary"] = "Accept-Encoding"
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=bodies[encoding], media_type=media_type, headers=headers)
+
+def compress_variants(data: bytes) -> dict:
+    """Identity, gzip and (optionally) brotli bodies for content rendered in-process"""
+    bodies = {None: data, "gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    brotli = get_brotli()
+    if brotli is not None:
+        bodies["br"] = brotli.compress(data, quality=11)
+    return bodies
+
+def serve_file(request: Request, file_path: Path, media_type: Optional[str], cache_policy: str) -> Response:
+    """Serve a file with validators, 304 handling and precompressed variants"""
+    vary = file_path.suffix in COMPRESSIBLE_EXTENSIONS
+    cached = static_files.get(file_path)
+    if cached is not None:
+        return serve_bodies(request, cached.bodies, cached.etag, cached.last_modified, media_type, cache_policy, vary)
+
+    # Too large for memory: stream from disk
+    validators = file_etags.get(file_path)
+    body_path, encoding = pick_precompressed(request, file_path)
+    etag = validators.etag
+    if encoding:
+        etag = f'{etag[:-1]}-{encoding}"'
+    headers = validator_headers(etag, validators.last_modified, cache_policy)
+    if vary:
+        headers["Vary"] = "Accept-Encoding"
+    if is_not_modified(request, etag, validators.last_modified):
+        return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return FileResponse(body_path, media_type=media_type, headers=headers)
+
+# Responsive image variants generated by optimize_images.py
+IMAGE_PIPELINE = os.getenv("IMAGE_PIPELINE", "true").lower() in ("1", "true", "yes")
+IMAGE_VARIANTS_DIR = Path(os.getenv("IMAGE_VARIANTS_DIR", STATIC_CACHE_DIR / "images"))
+IMAGE_FORMAT_PREFERENCE = (("avif", "image/avif"), ("webp", "image/webp"))  # png is the fallback
+
+class ImageVariants:
+    """The images.json manifest, re-read when it changes (checked every STATIC_REVALIDATE_SECONDS)"""
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._mtime_ns = None
+        self._checked_at = 0.0
+        self.images: dict = {}
+        self.version = ""
+
+    def refresh(self, force: bool = False):
+        now = time.monotonic()
+        if not force and now - self._checked_at < STATIC_REVALIDATE_SECONDS:
+            return
+        self._checked_at = now
+        manifest_path = self.directory / "images.json"
+        try:
+            mtime_ns = manifest_path.stat().st_mtime_ns
+            if mtime_ns == self._mtime_ns:
+                return
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                images = json.load(f).get("images", {})
+        except (FileNotFoundError, ValueError):
+            mtime_ns, images = None, {}
+        version = make_etag(json.dumps(sorted((k, v["sha256"]) for k, v in images.items())).encode("utf-8"))
+        with self._lock:
+            self._mtime_ns = mtime_ns
+            self.images = images
+            self.version = version
+
+    def pick(self, logical: str, accept: dict, width: Optional[int]) -> Optional[dict]:
+        """
+        Best format the client accepts, at the smallest width >= `width`.
+        Without a width only a native-size variant qualifies; None means
+        serve the original.
+        """
+        entry = self.images.get(logical)
+        if not entry:
+            return None
+        available = {v["format"] for v in entry["variants"]}
+        fmt = next((f for f, media_type in IMAGE_FORMAT_PREFERENCE if f in available and accept.get(media_type, 0.0) > 0), "png")
+        candidates = sorted((v for v in entry["variants"] if v["format"] == fmt), key=lambda v: v["width"])
+        if not candidates:
+            return None
+        if width:
+            return next((v for v in candidates if v["width"] >= width), candidates[-1])
+        return next((v for v in candidates if v["width"] == entry["width"]), None)
+
+    def bootstrap(self) -> dict:
+        """Per-image version and widths, inlined into the page so script.js can build srcsets"""
+        return {
+            logical: {"v": entry["sha256"][:8], "widths": sorted({v["width"] for v in entry["variants"] if not v.get("native")})}
+            for logical, entry in self.images.items()
+        }
+
+image_variants = ImageVariants(IMAGE_VARIANTS_DIR)
+
+def build_image_variants():
+    """Bring the image variants up to date (needs Pillow; originals are served without it)"""
+    if not IMAGE_PIPELINE:
+        return
+    try:
+        import optimize_images
+        optimize_images.build_variants(BASE_DIR, IMAGE_VARIANTS_DIR)
+    except ImportError:
+        print("Image variants: Pillow not installed; serving original images")
+    except Exception as e:
+        print(f"Image variants: generation failed: {e}")
+    image_variants.refresh(force=True)
+
+def serve_image_variant(request: Request, logical: str, original: Path) -> Optional[Response]:
+    """
+    Serve the best generated variant of an asset image, or the original
+    when none suits the client. Either way the response varies on Accept,
+    so shared caches keep one copy per format. None if the image has no
+    variants at all.
+    """
+    image_variants.refresh()
+    entry = image_variants.images.get(logical)
+    if entry is None:
+        return None
+    width = request.query_params.get("w")
+    variant = image_variants.pick(
+        logical,
+        parse_qvalues(request.headers.get("accept", "")),
+        int(width) if width and width.isdigit() else None
+    )
+    variant_file = IMAGE_VARIANTS_DIR / variant["file"] if variant is not None else None
+    if variant_file is None or not variant_file.exists():
+        response = serve_file(request, original, MEDIA_TYPES.get(original.suffix.lower()), "static")
+    else:
+        # ?v= pins the source version, so that URL's content never changes
+        version = request.query_params.get("v")
+        policy = "immutable" if version and entry["sha256"].startswith(version) else "static"
+        response = serve_file(request, variant_file, variant["media_type"], policy)
+    response.headers["Vary"] = "Accept"
+    return response
+
+async def prepare_static_assets():
+    try:
+        if os.getenv(SETUP_DONE_ENV) == "1":
+            # The supervisor already prepared the tree (see serve()); only load its manifest
+            image_variants.refresh(force=True)
+        else:
+            await asyncio.to_thread(precompress_static_assets)
+            await asyncio.to_thread(build_image_variants)
+        await asyncio.to_thread(static_files.warm, [BASE_DIR / "index.html", BASE_DIR / "admin.html"])
+    except Exception as e:
+        print(f"Startup: static asset preparation failed: {e}")
+
+async def retry_database_setup():
+    """Retry a failed database setup with exponential backoff; requests fail fast meanwhile"""
+    loop = asyncio.get_running_loop()
+    delay = STARTUP_RETRY_SECONDS
+    while not startup_state.ready:
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, STARTUP_RETRY_MAX_SECONDS)
+        try:
+            await loop.run_in_executor(db_executor, ensure_database_ready, True)
+            print(f"Startup: database ready after {startup_state.ready_after_seconds}s")
         except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to send email: {str(e)}"
-            )
+            print(f"Startup: database initialisation failed again: {e} (next attempt in {delay:.0f}s)")
 
-    except HTTPException:
-        raise
+async def run_startup_tasks():
+    """Background startup: database readiness first, then static asset preparation"""
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(db_executor, ensure_database_ready)
+        print(f"Startup: database ready after {startup_state.ready_after_seconds}s")
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"An error occurred: {str(e)}"
-        )
+        print(f"Startup: database initialisation failed: {e}")
+    await asyncio.gather(prepare_static_assets(), retry_database_setup())
 
-# ============================================
-# STATIC FILE SERVING (must come after API routes)
-# ============================================
+# Server-side rendering of the projects grid into index.html
+SSR_PROJECTS = os.getenv("SSR_PROJECTS", "true").lower() in ("1", "true", "yes")
+SSR_GRID_MARKER = '<div class="projects-grid">'
+SSR_PLACEHOLDER = "<!-- Projects will be injected via JS from script.js -->"
+SSR_SCRIPT_MARKER = '<script src="script.js"></script>'
+
+def has_project_link(url: Optional[str]) -> bool:
+    return bool(url) and url != "#"
+
+def render_project_card(project: dict) -> str:
+    """Render one project card with the same markup script.js builds"""
+    esc = html.escape
+    links = project.get("links") or {}
+    tech = "".join(f'<span class="tech-tag">{esc(t)}</span>' for t in project.get("tech", []))
+    link_html = ""
+    if has_project_link(links.get("github")):
+        link_html += (f'<a href="{esc(links["github"])}" class="project-link" target="_blank" rel="noopener noreferrer">'
+                      '<i class="fa-brands fa-github"></i> Code</a>')
+    if has_project_link(links.get("demo")):
+        link_html += (f'<a href="{esc(links["demo"])}" class="project-link" target="_blank" rel="noopener noreferrer">'
+                      '<i class="fa-solid fa-arrow-up-right-from-square"></i> Live Demo</a>')
+    return (
+        '<div class="project-card scroll-reveal">'
+        '<div class="project-info">'
+        f'<h3>{esc(project["title"])}</h3>'
+        f'<p>{esc(project["desc"])}</p>'
+        f'<div class="tech-stack">{tech}</div>'
+        f'<div class="project-links">{link_html}</div>'
+        '</div></div>'
+    )
+
+def render_index(template: str, projects_body: bytes, images: Optional[dict] = None) -> str:
+    """Inject rendered cards and inline JSON bootstraps of the project list (and image variants)"""
+    projects = json.loads(projects_body)["projects"]
+    cards = "".join(render_project_card(p) for p in projects)
+    page = template.replace(SSR_GRID_MARKER, '<div class="projects-grid" data-ssr="true">', 1)
+    page = page.replace(SSR_PLACEHOLDER, cards, 1)
+    # "</" must not appear inside an inline script
+    bootstrap = projects_body.decode("utf-8").replace("</", "<\\/")
+    scripts = f'<script id="projects-bootstrap" type="application/json">{bootstrap}</script>'
+    if images:
+        images_json = json.dumps(images).replace("</", "<\\/")
+        scripts += f'\n    <script id="image-variants" type="application/json">{images_json}</script>'
+    return page.replace(SSR_SCRIPT_MARKER, f"{scripts}\n    {SSR_SCRIPT_MARKER}", 1)
+
+class RenderedPage(NamedTuple):
+    key: tuple
+    bodies: dict
+    etag: str
+    last_modified: float
+
+class RenderedIndexCache:
+    """
+    index.html with the projects grid rendered in. The page (and its
+    compressed variants) is regenerated only when the template, the
+    projects cache version or the image variant manifest changes.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.page: Optional[RenderedPage] = None
+        self.renders = 0
+
+    async def get(self, template: CachedFile, projects: CachedBody) -> RenderedPage:
+        image_variants.refresh()
+        key = (template.etag, projects.etag, image_variants.version)
+        page = self.page
+        if page is not None and page.key == key:
+            return page
+        # gzip-9 and brotli-11 take tens of milliseconds; keep them off the event loop
+        return await asyncio.to_thread(self.render, key, template, projects)
+
+    def render(self, key: tuple, template: CachedFile, projects: CachedBody) -> RenderedPage:
+        rendered = render_index(template.bodies[None].decode("utf-8"), projects.body, image_variants.bootstrap()).encode("utf-8")
+        page = RenderedPage(key, compress_variants(rendered), make_etag(rendered),
+                            max(template.last_modified, projects.last_modified))
+        with self._lock:
+            self.page = page
+            self.renders += 1
+        return page
+
+    def invalidate(self):
+        with self._lock:
+            self.page = None
+
+rendered_index = RenderedIndexCache()
 
 # Serve index.html at root
 @app.get("/", response_class=HTMLResponse)
-async def read_root():
+async def read_root(request: Request):
     index_path = BASE_DIR / "index.html"
-    if not index_path.exists():
-        return HTMLResponse(content="<h1>Error</h1><p>index.html not found at: " + str(index_path) + "</p>", status_code=404)
-    
     try:
-        with open(index_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        return HTMLResponse(content=html_content, media_type="text/html")
+        if SSR_PROJECTS:
+            template = static_files.get(index_path)
+            if template is not None:
+                try:
+                    page = await rendered_index.get(template, await get_projects_entry())
+                    return serve_bodies(request, page.bodies, page.etag, page.last_modified, "text/html", "html")
+                except Exception as e:
+                    # Fall back to the plain page; script.js fetches the projects itself
+                    print(f"Error rendering projects into index.html: {e}")
+        # Served from the in-memory static cache; disk is only touched on revalidation
+        return serve_file(request, index_path, "text/html", "html")
+    except FileNotFoundError:
+        return HTMLResponse(content="<h1>Error</h1><p>index.html not found at: " + str(index_path) + "</p>", status_code=404)
     except Exception as e:
         return HTMLResponse(content=f"<h1>Error</h1><p>Failed to read index.html: {str(e)}</p>", status_code=500)
 
 # Serve admin.html
 @app.get("/admin", response_class=HTMLResponse)
-async def admin_page():
+async def admin_page(request: Request):
     admin_path = BASE_DIR / "admin.html"
     if admin_path.exists():
-        return FileResponse(admin_path, media_type="text/html")
+        return serve_file(request, admin_path, "text/html", "html")
     raise HTTPException(status_code=404, detail="Admin page not found")
 
 # Serve static files (CSS, JS, images) - catch-all route comes last
+def is_private_path(file_path: Path) -> bool:
+    """
+    Files under BASE_DIR that must never be served: the database and its
+    sidecars (WAL, locks, backups), dotfiles such as .env, and the
+    backup/static cache directories when they live inside BASE_DIR.
+    """
+    resolved = file_path.resolve()
+    relative = resolved.relative_to(BASE_DIR.resolve())
+    if any(part.startswith(".") for part in relative.parts) or ".db" in resolved.name:
+        return True
+    for private_dir in (Path(BACKUP_DIR), STATIC_CACHE_DIR):
+        if resolved.is_relative_to(private_dir.resolve()):
+            return True
+    return False
+
 @app.get("/{filename:path}")
-async def serve_static(filename: str):
+async def serve_static(filename: str, request: Request):
     """Serve static files like CSS, JS, images"""
     file_path = BASE_DIR / filename
     # Security: only serve files from the base directory
-    if not str(file_path).startswith(str(BASE_DIR)):
+    if not file_path.resolve().is_relative_to(BASE_DIR.resolve()):
         raise HTTPException(status_code=403, detail="Access denied")
+    if is_private_path(file_path):
+        raise HTTPException(status_code=404, detail="File not found")
     if file_path.exists() and file_path.is_file():
+        if IMAGE_PIPELINE and file_path.suffix.lower() in (".png", ".jpg", ".jpeg"):
+            response = serve_image_variant(request, filename, file_path)
+            if response is not None:
+                return response
         # Set proper content type based on file extension
-        media_type = None
-        if filename.endswith('.css'):
-            media_type = 'text/css'
-        elif filename.endswith('.js'):
-            media_type = 'application/javascript'
-        elif filename.endswith('.html'):
-            media_type = 'text/html'
-        elif filename.endswith('.png'):
-            media_type = 'image/png'
-        elif filename.endswith('.jpg') or filename.endswith('.jpeg'):
-            media_type = 'image/jpeg'
-        elif filename.endswith('.svg'):
-            media_type = 'image/svg+xml'
-        
-        return FileResponse(file_path, media_type=media_type)
+        media_type = MEDIA_TYPES.get(file_path.suffix.lower())
+        return serve_file(request, file_path, media_type, "static")
     raise HTTPException(status_code=404, detail="File not found")
 
-if __name__ == "__main__":
+# ============================================
+# ENTRY POINT
+# ============================================
+
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", "8000"))
+# Open SSE streams never finish on their own before SSE_MAX_STREAM_SECONDS;
+# past this grace period on shutdown they are cancelled (clients reconnect)
+GRACEFUL_SHUTDOWN_SECONDS = float(os.getenv("GRACEFUL_SHUTDOWN_SECONDS", "10"))
+
+def serve(workers: int = WEB_CONCURRENCY):
+    """
+    Run the API. With more than one worker, the supervisor creates the
+    schema, runs the auto-migration and precompresses static assets once
+    before spawning workers; each worker imports the app fresh, so it has
+    its own engine pool, DB thread pool and caches.
+    """
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    if workers <= 1:
+        uvicorn.run(app, host=HOST, port=PORT, timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_SECONDS)
+        return
+
+    ensure_database_ready()
+    precompress_static_assets()
+    build_image_variants()
+    engine.dispose()
+    os.environ[SETUP_DONE_ENV] = "1"
+    print(f"Starting {workers} workers on {HOST}:{PORT}")
+    uvicorn.run("backend:app", host=HOST, port=PORT, workers=workers, timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_SECONDS)
+
+if __name__ == "__main__":
+    serve()
 
@@ -0,0 +1,344 @@
+"""
+Online backup and restore of portfolio content.
+
+SQLite backups use the online backup API, copying BACKUP_PAGES_PER_STEP
+pages at a time and pausing between steps, so the app keeps reading and
+writing while the copy runs. The copy is then gzip-compressed in fixed-size
+chunks. Postgres backups are a logical dump of the content tables: one
+COPY per table inside a single REPEATABLE READ snapshot, streamed straight
+into gzip. Either way memory stays bounded, even for a large resume blob.
+
+A restore validates the backup first. It then swaps the data in as one
+transaction: SQLite attaches the validated file and replaces the content
+tables under BEGIN IMMEDIATE, and Postgres stages rows in temp tables
+before a quick TRUNCATE + INSERT. Admin sessions, rate limits and the email
+outbox on the live database are never touched. Afterwards the project list version moves past both the old and the
+restored value, so change-feed clients resync.
+
+The backend's /api/admin/backups and /api/admin/restore routes call these
+functions and reset the handling worker's caches at once; other workers
+(and servers running during a CLI restore) notice the new version within
+CACHE_VALIDATE_SECONDS.
+
+Usage:
+    python3 backup.py backup [output_file]
+    python3 backup.py restore <backup_file>
+"""
+import gzip
+import os
+import shutil
+import sqlite3
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+BACKUP_PAGES_PER_STEP = int(os.getenv("BACKUP_PAGES_PER_STEP", "256"))  # 1 MiB with 4 KiB pages
+BACKUP_STEP_PAUSE = float(os.getenv("BACKUP_STEP_PAUSE", "0.005"))  # Seconds between steps for other connections
+CHUNK_SIZE = 1024 * 1024
+SQLITE_MAGIC = b"SQLite format 3\x00"
+DUMP_HEADER = "-- portfolio backup"
+
+# Content restored from a backup, in foreign-key order. Anything else
+# (sessions, rate limits, outbox) belongs to the running deployment.
+CONTENT_TABLES = ["site_config", "projects", "project_tech", "project_tombstones", "resume"]
+
+
+class BackupError(Exception):
+    """The backup file is missing, unreadable or does not fit this database"""
+
+
+def throughput(label: str, size: int, started: float) -> dict:
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    return {"operation": label, "bytes": size, "seconds": round(elapsed, 3), "mib_per_second": round(size / elapsed / 2 ** 20, 2)}
+
+
+def default_backup_name(backend) -> str:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    suffix = "sql.gz" if backend.engine.dialect.name == "postgresql" else "db.gz"
+    return f"portfolio-{stamp}.{suffix}"
+
+
+def sqlite_path(backend) -> Path:
+    return Path(backend.engine.url.database)
+
+
+def table_columns(backend, name: str) -> list:
+    return [c.name for c in backend.Base.metadata.tables[name].columns]
+
+
+class CountingWriter:
+    """Binary file wrapper that counts the bytes written through it"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.count = 0
+
+    def write(self, data):
+        self.count += len(data)
+        return self.raw.write(data)
+
+
+# --------------------------------------------
+# Backup
+# --------------------------------------------
+
+def backup_sqlite(backend, output: Path, log=print) -> dict:
+    source = sqlite_path(backend)
+    snapshot = output.with_name(f"{output.name}.{os.getpid()}.db.tmp")
+    started = time.perf_counter()
+    src = sqlite3.connect(source, timeout=backend.SQLITE_BUSY_TIMEOUT_MS / 1000)
+    dst = sqlite3.connect(snapshot)
+    try:
+        # Each step holds the source's read lock only while copying its
+        # pages; the pause lets the app's connections in between
+        src.backup(dst, pages=BACKUP_PAGES_PER_STEP, progress=lambda status, remaining, total: time.sleep(BACKUP_STEP_PAUSE))
+        dst.execute("PRAGMA journal_mode=DELETE")  # Self-contained file, no -wal sidecar
+    finally:
+        dst.close()
+        src.close()
+    size = snapshot.stat().st_size
+    try:
+        with open(snapshot, "rb") as f, gzip.open(output, "wb", compresslevel=6) as gz:
+            shutil.copyfileobj(f, gz, CHUNK_SIZE)
+    finally:
+        snapshot.unlink(missing_ok=True)
+    return throughput("backup", size, started)
+
+
+def backup_postgres(backend, output: Path, log=print) -> dict:
+    started = time.perf_counter()
+    raw = backend.engine.raw_connection()
+    try:
+        raw.rollback()  # Start clean so the isolation level applies to the first statement
+        cursor = raw.cursor()
+        # One snapshot for every table; COPY only takes ACCESS SHARE locks
+        cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+        with gzip.open(output, "wb", compresslevel=6) as gz:
+            out = CountingWriter(gz)
+            out.write(f"{DUMP_HEADER} dialect=postgresql created={datetime.now(timezone.utc).isoformat()}\n".encode("utf-8"))
+            for name in CONTENT_TABLES:
+                columns = ", ".join(f'"{c}"' for c in table_columns(backend, name))
+                out.write(f"COPY {name} ({columns}) FROM stdin;\n".encode("utf-8"))
+                cursor.copy_expert(f"COPY {name} ({columns}) TO STDOUT", out)
+                out.write(b"\\.\n")
+        raw.rollback()
+    finally:
+        raw.close()
+    return throughput("backup", out.count, started)
+
+
+def create_backup(backend, output: Path, log=print) -> dict:
+    """Write a compressed backup of the live database to `output` (written atomically)"""
+    backend.ensure_database_ready()
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    partial = output.with_name(f"{output.name}.{os.getpid()}.partial")
+    try:
+        if backend.engine.dialect.name == "postgresql":
+            stats = backup_postgres(backend, partial, log)
+        else:
+            stats = backup_sqlite(backend, partial, log)
+        os.replace(partial, output)
+    finally:
+        partial.unlink(missing_ok=True)
+    stats["file"] = str(output)
+    stats["compressed_bytes"] = output.stat().st_size
+    log(f"Backup: {stats['bytes']} bytes in {stats['seconds']}s ({stats['mib_per_second']} MiB/s), "
+        f"{stats['compressed_bytes']} compressed -> {output}")
+    return stats
+
+
+# --------------------------------------------
+# Restore
+# --------------------------------------------
+
+def backup_kind(path: Path) -> str:
+    try:
+        with gzip.open(path, "rb") as gz:
+            head = gz.read(len(DUMP_HEADER))
+    except (OSError, EOFError) as e:
+        raise BackupError(f"Not a gzip-compressed backup: {e}")
+    if head.startswith(SQLITE_MAGIC):
+        return "sqlite"
+    if head == DUMP_HEADER.encode("utf-8"):
+        return "postgresql"
+    raise BackupError("Unrecognised backup format")
+
+
+class CopySection:
+    """File-like view of one COPY block in a dump, ending at its \\. line"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.done = False
+
+    def readline(self, size=-1):
+        if self.done:
+            return b""
+        line = self.stream.readline()
+        if line in (b"\\.\n", b""):
+            self.done = True
+            return b""
+        return line
+
+    def read(self, size=-1):
+        return self.readline()
+
+
+def read_previous_state(backend) -> tuple:
+    """Project list version and project ids before the restore"""
+    def read(db):
+        ids = set(db.execute(backend.select(backend.ProjectModel.id)).scalars())
+        return backend.read_projects_version(db), ids
+    return backend.with_session(read)
+
+
+def restore_sqlite(backend, path: Path, log=print) -> dict:
+    live_path = sqlite_path(backend)
+    staged = live_path.with_name(f"{live_path.name}.restore-{os.getpid()}.tmp")
+    started = time.perf_counter()
+    try:
+        with gzip.open(path, "rb") as gz, open(staged, "wb") as f:
+            shutil.copyfileobj(gz, f, CHUNK_SIZE)
+        size = staged.stat().st_size
+
+        conn = sqlite3.connect(staged)
+        try:
+            if conn.execute("PRAGMA quick_check").fetchone()[0] != "ok":
+                raise BackupError("Backup database failed its integrity check")
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            if not {"projects", "site_config"} <= tables:
+                raise BackupError("Backup has no portfolio tables")
+        finally:
+            conn.close()
+
+        # Replace the content tables inside one write transaction on the live
+        # file. Operational rows (sessions, rate limits, outbox) are never
+        # copied, so nothing written to them during the restore is lost, and
+        # readers keep their snapshot until the commit.
+        live = sqlite3.connect(live_path, timeout=backend.SQLITE_BUSY_TIMEOUT_MS / 1000, isolation_level=None)
+        try:
+            live.execute("ATTACH DATABASE ? AS restore", (str(staged),))
+            live.execute("BEGIN IMMEDIATE")
+            try:
+                for name in reversed(CONTENT_TABLES):
+                    live.execute(f"DELETE FROM main.{name}")
+                for name in CONTENT_TABLES:
+                    if name in tables:
+                        backup_cols = {row[1] for row in live.execute(f"PRAGMA restore.table_info({name})")}
+                        live_cols = [row[1] for row in live.execute(f"PRAGMA main.table_info({name})")]
+                        shared = ", ".join(f'"{c}"' for c in live_cols if c in backup_cols)
+                        live.execute(f"INSERT INTO main.{name} ({shared}) SELECT {shared} FROM restore.{name}")
+                live.execute("COMMIT")
+            except BaseException:
+                live.execute("ROLLBACK")
+                raise
+            live.execute("DETACH DATABASE restore")
+        finally:
+            live.close()
+    finally:
+        for leftover in (staged, staged.with_name(staged.name + "-wal"), staged.with_name(staged.name + "-shm")):
+            leftover.unlink(missing_ok=True)
+    return throughput("restore", size, started)
+
+
+def restore_postgres(backend, path: Path, log=print) -> dict:
+    started = time.perf_counter()
+    raw = backend.engine.raw_connection()
+    staged = []
+    try:
+        cursor = raw.cursor()
+        with gzip.open(path, "rb") as gz:
+            gz.readline()  # Header
+            while True:
+                line = gz.readline()
+                if not line:
+                    break
+                statement = line.decode("utf-8").strip()
+                if not statement:
+                    continue
+                if not statement.startswith("COPY ") or not statement.endswith("FROM stdin;"):
+                    raise BackupError(f"Unexpected line in dump: {statement[:60]}")
+                name, columns = statement[5:].split(" ", 1)
+                columns = columns[:-len(" FROM stdin;")]
+                if name not in CONTENT_TABLES:
+                    raise BackupError(f"Dump contains unknown table {name}")
+                # Stage outside the live tables: no locks on them while rows stream in
+                cursor.execute(f"CREATE TEMP TABLE restore_{name} (LIKE {name} INCLUDING DEFAULTS) ON COMMIT DROP")
+                cursor.copy_expert(f"COPY restore_{name} {columns} FROM STDIN", CopySection(gz))
+                staged.append((name, columns))
+            counted = gz.tell()
+        if "projects" not in {name for name, _ in staged}:
+            raise BackupError("Dump has no projects table")
+
+        # The swap: brief ACCESS EXCLUSIVE locks, committed together
+        cursor.execute(f"TRUNCATE {', '.join(CONTENT_TABLES)} CASCADE")
+        for name, columns in staged:
+            cursor.execute(f"INSERT INTO {name} {columns} SELECT {columns[1:-1]} FROM restore_{name}")
+        cursor.execute("SELECT setval('projects_id_seq', (SELECT COALESCE(MAX(id), 0) + 1 FROM projects), false)")
+        raw.commit()
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+    return throughput("restore", counted, started)
+
+
+def mark_restored(backend, previous_version: int, previous_ids: set):
+    """
+    Move the project list version past both the old and the restored one,
+    stamp every restored project with it and tombstone projects that
+    disappeared, so change-feed clients see the restore as one delta.
+    """
+    def stamp(db):
+        version = max(previous_version, backend.read_projects_version(db)) + 1
+        db.merge(backend.SiteConfigModel(key=backend.PROJECTS_VERSION_KEY, value=str(version)))
+        db.execute(backend.update_stmt(backend.ProjectModel).values(updated_version=version))
+        current = set(db.execute(backend.select(backend.ProjectModel.id)).scalars())
+        backend.record_project_deletions(db, sorted(previous_ids - current), version)
+        db.commit()
+        return version
+    return backend.with_session(stamp)
+
+
+def restore_backup(backend, path: Path, log=print) -> dict:
+    """Validate `path` and replace the live content with it"""
+    backend.ensure_database_ready()
+    path = Path(path)
+    if not path.is_file():
+        raise BackupError(f"Backup not found: {path}")
+    kind = backup_kind(path)
+    dialect = "postgresql" if backend.engine.dialect.name == "postgresql" else "sqlite"
+    if kind != dialect:
+        raise BackupError(f"{kind} backup cannot be restored into {dialect} (use migrate_sqlite_to_postgres.py)")
+
+    previous_version, previous_ids = read_previous_state(backend)
+    stats = restore_postgres(backend, path, log) if dialect == "postgresql" else restore_sqlite(backend, path, log)
+
+    # Backups from before a schema upgrade get the same treatment as an old database
+    backend.upgrade_schema()
+    backend.backfill_project_positions()
+    backend.sync_project_tech()
+    backend.sync_project_search()
+    stats["version"] = mark_restored(backend, previous_version, previous_ids)
+    log(f"Restore: {stats['bytes']} bytes in {stats['seconds']}s ({stats['mib_per_second']} MiB/s) from {path}")
+    return stats
+
+
+if __name__ == "__main__":
+    import backend
+
+    if len(sys.argv) < 2 or sys.argv[1] not in ("backup", "restore") or (sys.argv[1] == "restore" and len(sys.argv) < 3):
+        print(__doc__)
+        raise SystemExit(2)
+    try:
+        if sys.argv[1] == "backup":
+            target = Path(sys.argv[2]) if len(sys.argv) > 2 else Path(backend.BACKUP_DIR) / default_backup_name(backend)
+            create_backup(backend, target)
+        else:
+            restore_backup(backend, Path(sys.argv[2]))
+    except BackupError as e:
+        print(f"Error: {e}")
+        raise SystemExit(1)
@@ -0,0 +1,41 @@
+"""
+Helpers shared by the benchmark scripts: picking a free port, waiting for
+a started backend.py to finish its startup work, and latency percentiles.
+The scripts run as `python3 benchmarks/<script>.py`, so this directory is
+on sys.path and they import it as `_common`.
+"""
+import http.client
+import socket
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_until_ready(port: int, timeout: float = 30.0):
+    """Poll /api/health?require_ready=true until the database setup is done"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/api/health?require_ready=true")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.05)
+    raise RuntimeError(f"server on port {port} did not become ready")
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
@@ -0,0 +1,330 @@
+"""
+Reproducible benchmark suite for the portfolio API and static paths.
+
+Seeds a temporary SQLite database with --projects generated projects and
+the resume PDF from the repo's portfolio.db (or --resume-pdf), starts
+backend.py under uvicorn against it, then measures throughput and latency
+percentiles at each --concurrency level for:
+
+  index         GET /
+  projects      GET /api/projects
+  resume_meta   GET /api/resume
+  resume_pdf    GET /api/resume/AtharvaZ
+  static_png    GET /assets/*.png (rotating over every PNG)
+  crud          POST, PUT and DELETE /api/projects (one create/update/delete
+                cycle per iteration, reported per operation)
+
+Results are JSON (stdout, or --output) tagged with the git commit. Pass
+--compare to check against an earlier result: scenarios whose throughput
+dropped or p99 grew by more than --tolerance are listed and the exit code
+is 1.
+
+Usage:
+    python3 benchmarks/bench_api.py [--projects 50] [--concurrency 1 8 32] [--duration 5]
+    python3 benchmarks/bench_api.py --output after.json --compare before.json
+"""
+import argparse
+import base64
+import http.client
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from _common import REPO_DIR, free_port, percentile, wait_until_ready
+
+ADMIN_USERNAME = "bench"
+ADMIN_PASSWORD = "bench"
+READ_SCENARIOS = {
+    "index": ["/"],
+    "projects": ["/api/projects"],
+    "resume_meta": ["/api/resume"],
+    "resume_pdf": ["/api/resume/AtharvaZ"],
+    "static_png": [f"/assets/{p.name}" for p in sorted((REPO_DIR / "assets").glob("*.png"))],
+}
+TECH_POOL = ["Python", "FastAPI", "SQLAlchemy", "PostgreSQL", "React", "TypeScript", "Docker", "Redis", "Rust", "Go"]
+
+SEED_SNIPPET = """
+import json, sys
+import backend
+
+count, resume_path = int(sys.argv[1]), sys.argv[2]
+tech_pool = json.loads(sys.argv[3])
+backend.ensure_database_ready()
+db = backend.SessionLocal()
+try:
+    db.query(backend.ProjectModel).delete()
+    for i in range(count):
+        db.add(backend.ProjectModel(
+            title=f"Benchmark project {i}",
+            desc=("A generated project used to benchmark the portfolio API. " * 4).strip(),
+            tech=json.dumps([tech_pool[(i + k) % len(tech_pool)] for k in range(4)]),
+            links=json.dumps({"github": f"https://github.com/example/project-{i}", "demo": f"https://example.com/{i}"}),
+        ))
+    with open(resume_path, "rb") as f:
+        backend.store_resume(db, f.read())
+    db.commit()
+finally:
+    db.close()
+"""
+
+
+def git_commit() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def repo_resume_pdf() -> bytes:
+    """The resume stored in the repo's portfolio.db (binary table or legacy base64 row)"""
+    conn = sqlite3.connect(REPO_DIR / "portfolio.db")
+    try:
+        try:
+            row = conn.execute("SELECT data FROM resume WHERE id = 1").fetchone()
+            if row and row[0]:
+                return bytes(row[0])
+        except sqlite3.OperationalError:
+            pass
+        row = conn.execute("SELECT value FROM site_config WHERE key = 'resume_pdf'").fetchone()
+        if not row:
+            raise RuntimeError("portfolio.db has no resume; pass --resume-pdf")
+        value = row[0]
+        return base64.b64decode(value.split("base64,", 1)[1] if "base64," in value else value)
+    finally:
+        conn.close()
+
+
+def server_env(workdir: str) -> dict:
+    env = dict(
+        os.environ,
+        DB_PATH=os.path.join(workdir, "bench.db"),
+        ADMIN_USERNAME=ADMIN_USERNAME,
+        ADMIN_PASSWORD=ADMIN_PASSWORD,
+        EMAIL_TRANSPORT="stub",
+        STATIC_CACHE_DIR=os.path.join(workdir, "static_cache"),
+        STATIC_EXPORT_DIR="",
+    )
+    env.pop("DATABASE_URL", None)
+    return env
+
+
+def seed(workdir: str, projects: int, resume_pdf: bytes):
+    resume_path = os.path.join(workdir, "resume.pdf")
+    with open(resume_path, "wb") as f:
+        f.write(resume_pdf)
+    subprocess.run(
+        [sys.executable, "-c", SEED_SNIPPET, str(projects), resume_path, json.dumps(TECH_POOL)],
+        cwd=REPO_DIR, env=server_env(workdir), stdout=subprocess.DEVNULL, check=True,
+    )
+
+
+def summarize(latencies_ms, errors: int, seconds: float) -> dict:
+    return {
+        "requests": len(latencies_ms),
+        "errors": errors,
+        "requests_per_sec": round(len(latencies_ms) / seconds, 1),
+        "p50_ms": round(percentile(latencies_ms, 50), 3),
+        "p90_ms": round(percentile(latencies_ms, 90), 3),
+        "p99_ms": round(percentile(latencies_ms, 99), 3),
+        "max_ms": round(max(latencies_ms), 3) if latencies_ms else 0.0,
+    }
+
+
+def timed(conn, method, path, body=None, headers=None):
+    start = time.perf_counter()
+    conn.request(method, path, body=body, headers=headers or {})
+    response = conn.getresponse()
+    data = response.read()
+    return (time.perf_counter() - start) * 1000, response.status, data
+
+
+def run_clients(port: int, concurrency: int, seconds: float, iteration) -> dict:
+    """Run `concurrency` keep-alive clients calling iteration(conn, record) until time is up"""
+    stop = threading.Event()
+    samples = {}
+    errors = {}
+    lock = threading.Lock()
+
+    def client():
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        local, local_errors = {}, {}
+
+        def record(name, elapsed_ms, ok):
+            local.setdefault(name, []).append(elapsed_ms)
+            if not ok:
+                local_errors[name] = local_errors.get(name, 0) + 1
+
+        counter = 0
+        while not stop.is_set():
+            try:
+                iteration(conn, record, counter)
+            except (OSError, http.client.HTTPException):
+                local_errors["connection"] = local_errors.get("connection", 0) + 1
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+            counter += 1
+        conn.close()
+        with lock:
+            for name, values in local.items():
+                samples.setdefault(name, []).extend(values)
+            for name, count in local_errors.items():
+                errors[name] = errors.get(name, 0) + count
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+    return {name: summarize(values, errors.get(name, 0), elapsed) for name, values in samples.items()}
+
+
+def read_iteration(paths):
+    headers = {"Accept-Encoding": "gzip, br"}
+
+    def iteration(conn, record, counter):
+        elapsed, status, _ = timed(conn, "GET", paths[counter % len(paths)], headers=headers)
+        record("GET", elapsed, status == 200)
+    return iteration
+
+
+def crud_iteration(token: str):
+    headers = {"Content-Type": "application/json", "X-Session-Token": token}
+
+    def iteration(conn, record, counter):
+        project = {
+            "title": f"CRUD benchmark {counter}",
+            "desc": "Created by the benchmark suite.",
+            "tech": TECH_POOL[:3],
+            "links": {"github": "https://github.com/example/crud"},
+        }
+        elapsed, status, body = timed(conn, "POST", "/api/projects", json.dumps(project), headers)
+        record("create", elapsed, status == 200)
+        if status != 200:
+            return
+        project_id = json.loads(body)["project"]["id"]
+        project["desc"] = "Updated by the benchmark suite."
+        elapsed, status, _ = timed(conn, "PUT", f"/api/projects/{project_id}", json.dumps(project), headers)
+        record("update", elapsed, status == 200)
+        elapsed, status, _ = timed(conn, "DELETE", f"/api/projects/{project_id}", headers=headers)
+        record("delete", elapsed, status == 200)
+    return iteration
+
+
+def login(port: int) -> str:
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    _, status, body = timed(conn, "POST", "/api/admin/login",
+                            json.dumps({"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD}),
+                            {"Content-Type": "application/json"})
+    if status != 200:
+        raise RuntimeError(f"login failed with {status}")
+    return json.loads(body)["token"]
+
+
+def run_suite(args, resume_pdf: bytes) -> dict:
+    workdir = tempfile.mkdtemp(prefix="bench-api-")
+    port = free_port()
+    server = None
+    try:
+        seed(workdir, args.projects, resume_pdf)
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "backend:app", "--port", str(port), "--log-level", "warning"],
+            cwd=REPO_DIR, env=server_env(workdir), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        wait_until_ready(port)
+        token = login(port)
+
+        results = {}
+        for name, paths in READ_SCENARIOS.items():
+            if not paths:
+                continue
+            for concurrency in args.concurrency:
+                run_clients(port, concurrency, args.warmup, read_iteration(paths))
+                stats = run_clients(port, concurrency, args.duration, read_iteration(paths))
+                results.setdefault(name, {})[str(concurrency)] = stats["GET"]
+        for concurrency in args.concurrency:
+            stats = run_clients(port, concurrency, args.duration, crud_iteration(token))
+            for operation in ("create", "update", "delete"):
+                if operation in stats:
+                    results.setdefault(f"crud_{operation}", {})[str(concurrency)] = stats[operation]
+        return results
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """Scenario/concurrency pairs whose throughput fell or p99 rose beyond tolerance"""
+    regressions = []
+    for scenario, levels in current["results"].items():
+        for concurrency, stats in levels.items():
+            before = baseline.get("results", {}).get(scenario, {}).get(concurrency)
+            if not before:
+                continue
+            if stats["requests_per_sec"] < before["requests_per_sec"] * (1 - tolerance):
+                regressions.append({"scenario": scenario, "concurrency": concurrency, "metric": "requests_per_sec",
+                                    "before": before["requests_per_sec"], "after": stats["requests_per_sec"]})
+            if stats["p99_ms"] > before["p99_ms"] * (1 + tolerance):
+                regressions.append({"scenario": scenario, "concurrency": concurrency, "metric": "p99_ms",
+                                    "before": before["p99_ms"], "after": stats["p99_ms"]})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=50)
+    parser.add_argument("--resume-pdf", help="PDF to seed instead of the resume in portfolio.db")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--duration", type=float, default=5.0, help="measured seconds per scenario and level")
+    parser.add_argument("--warmup", type=float, default=1.0, help="unmeasured seconds before each read scenario")
+    parser.add_argument("--output", help="write the JSON result here as well as to stdout")
+    parser.add_argument("--compare", help="earlier JSON result to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed relative change before flagging")
+    args = parser.parse_args()
+
+    resume_pdf = Path(args.resume_pdf).read_bytes() if args.resume_pdf else repo_resume_pdf()
+    result = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "config": {
+            "projects": args.projects,
+            "resume_bytes": len(resume_pdf),
+            "concurrency": args.concurrency,
+            "duration_seconds": args.duration,
+        },
+        "results": run_suite(args, resume_pdf),
+    }
+
+    exit_code = 0
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        result["baseline_commit"] = baseline.get("commit")
+        result["regressions"] = compare(result, baseline, args.tolerance)
+        exit_code = 1 if result["regressions"] else 0
+
+    output = json.dumps(result, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    raise SystemExit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Compare event-loop latency with SQLAlchemy work run inline vs on the DB
+thread pool (DB_THREADPOOL_SIZE=0 vs >0).
+
+Starts backend.py under uvicorn against a temporary copy of portfolio.db,
+then runs concurrent readers of /api/projects and /api/resume/AtharvaZ while
+a writer keeps updating a project (each write commits and rebuilds the
+projects cache on the database). Prints requests/sec and latency
+percentiles per mode as JSON.
+
+Usage:
+    python3 benchmarks/bench_db_offload.py [--seconds 10] [--readers 16]
+"""
+import argparse
+import http.client
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from _common import REPO_DIR, free_port, percentile, wait_until_ready
+
+READ_PATHS = ["/api/projects", "/api/resume/AtharvaZ"]
+ADMIN_USERNAME = "bench"
+ADMIN_PASSWORD = "bench"
+
+
+def request(conn, method, path, body=None, headers=None):
+    conn.request(method, path, body=body, headers=headers or {})
+    response = conn.getresponse()
+    response.read()
+    return response.status
+
+
+def run_mode(threadpool_size: int, seconds: float, readers: int) -> dict:
+    workdir = tempfile.mkdtemp(prefix="bench-db-")
+    db_path = os.path.join(workdir, "portfolio.db")
+    shutil.copy(REPO_DIR / "portfolio.db", db_path)
+    port = free_port()
+    env = dict(
+        os.environ,
+        DB_PATH=db_path,
+        DB_THREADPOOL_SIZE=str(threadpool_size),
+        ADMIN_USERNAME=ADMIN_USERNAME,
+        ADMIN_PASSWORD=ADMIN_PASSWORD,
+        EMAIL_TRANSPORT="stub",
+        STATIC_CACHE_DIR=os.path.join(workdir, "static_cache"),
+    )
+    env.pop("DATABASE_URL", None)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend:app", "--port", str(port), "--log-level", "warning"],
+        cwd=REPO_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_ready(port)
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        conn.request("POST", "/api/admin/login", body=json.dumps({"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD}),
+                     headers={"Content-Type": "application/json"})
+        token = json.loads(conn.getresponse().read())["token"]
+        conn.request("GET", "/api/projects")
+        project = json.loads(conn.getresponse().read())["projects"][0]
+
+        stop = threading.Event()
+        latencies = []
+        errors = [0]
+        lock = threading.Lock()
+
+        def reader(index: int):
+            c = http.client.HTTPConnection("127.0.0.1", port)
+            path = READ_PATHS[index % len(READ_PATHS)]
+            local = []
+            while not stop.is_set():
+                start = time.perf_counter()
+                status = request(c, "GET", path)
+                local.append((time.perf_counter() - start) * 1000)
+                if status != 200:
+                    errors[0] += 1
+            with lock:
+                latencies.extend(local)
+
+        writes = [0]
+
+        def writer():
+            c = http.client.HTTPConnection("127.0.0.1", port)
+            headers = {"Content-Type": "application/json", "X-Session-Token": token}
+            while not stop.is_set():
+                payload = dict(project, desc=f"{project['desc']} {writes[0]}")
+                request(c, "PUT", f"/api/projects/{project['id']}", json.dumps(payload), headers)
+                writes[0] += 1
+
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+        threads.append(threading.Thread(target=writer))
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+
+        return {
+            "db_threadpool_size": threadpool_size,
+            "reads": len(latencies),
+            "writes": writes[0],
+            "errors": errors[0],
+            "reads_per_sec": round(len(latencies) / seconds, 1),
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+        }
+    finally:
+        server.terminate()
+        server.wait()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--threadpool-size", type=int, default=8, help="pool size for the offloaded run")
+    args = parser.parse_args()
+
+    results = {
+        "inline": run_mode(0, args.seconds, args.readers),
+        "offloaded": run_mode(args.threadpool_size, args.seconds, args.readers),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
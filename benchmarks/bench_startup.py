@@ -0,0 +1,117 @@
+"""
+Cold-start benchmark for backend.py.
+
+For each run, against a fresh copy of portfolio.db and an empty static
+cache, measures:
+  - import_seconds: time to `import backend` in a new interpreter
+  - first_health_seconds: process spawn -> first 200 from /api/health
+  - ready_seconds: process spawn -> /api/health reports ready=true
+
+Prints the per-run numbers and medians as JSON so cold starts can be
+tracked across commits.
+
+Usage:
+    python3 benchmarks/bench_startup.py [--runs 5]
+"""
+import argparse
+import http.client
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from _common import REPO_DIR, free_port
+
+IMPORT_SNIPPET = "import time; t = time.perf_counter(); import backend; print(time.perf_counter() - t)"
+
+
+def fresh_env(workdir: str) -> dict:
+    db_path = os.path.join(workdir, "portfolio.db")
+    shutil.copy(REPO_DIR / "portfolio.db", db_path)
+    env = dict(
+        os.environ,
+        DB_PATH=db_path,
+        STATIC_CACHE_DIR=os.path.join(workdir, "static_cache"),
+        EMAIL_TRANSPORT="stub",
+    )
+    env.pop("DATABASE_URL", None)
+    return env
+
+
+def get_health(port: int):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+    conn.request("GET", "/api/health")
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def measure_import(workdir: str) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=REPO_DIR, env=fresh_env(workdir), capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def measure_server(workdir: str, timeout: float = 60.0) -> dict:
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend:app", "--port", str(port), "--log-level", "warning"],
+        cwd=REPO_DIR, env=fresh_env(workdir), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    first_health = None
+    ready = None
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                status, body = get_health(port)
+            except OSError:
+                time.sleep(0.005)
+                continue
+            now = time.perf_counter() - started
+            if status == 200 and first_health is None:
+                first_health = now
+            if body.get("ready"):
+                ready = now
+                break
+            time.sleep(0.005)
+    finally:
+        server.terminate()
+        server.wait()
+    return {"first_health_seconds": first_health, "ready_seconds": ready}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = []
+    for _ in range(args.runs):
+        workdir = tempfile.mkdtemp(prefix="bench-startup-")
+        try:
+            result = {"import_seconds": measure_import(workdir)}
+            shutil.rmtree(workdir)
+            workdir = tempfile.mkdtemp(prefix="bench-startup-")
+            result.update(measure_server(workdir))
+            runs.append(result)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    def median(key):
+        values = [r[key] for r in runs if r[key] is not None]
+        return round(statistics.median(values), 4) if values else None
+
+    print(json.dumps({
+        "runs": runs,
+        "median": {key: median(key) for key in ("import_seconds", "first_health_seconds", "ready_seconds")},
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
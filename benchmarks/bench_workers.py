@@ -0,0 +1,133 @@
+"""
+Multi-worker scaling benchmark for backend.py.
+
+Starts `python3 backend.py` with WEB_CONCURRENCY set to each worker count,
+against a fresh copy of portfolio.db, then drives /api/projects and a
+static asset with keep-alive clients spread over several client processes
+(so the load generator is not the bottleneck). Reports requests/sec per
+worker count and scaling efficiency relative to one worker, as JSON.
+
+Scaling is bounded by the cores available: with C cores, expect roughly
+linear gains up to about C / 2 workers when the clients share the machine.
+
+Usage:
+    python3 benchmarks/bench_workers.py [--workers 1 2 4] [--duration 5] [--clients 8]
+"""
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from _common import REPO_DIR, free_port, wait_until_ready
+
+TARGETS = {
+    "projects": "/api/projects",
+    "static": "/styles.css",
+}
+
+
+def start_server(workdir: str, workers: int, port: int) -> subprocess.Popen:
+    db_path = os.path.join(workdir, "portfolio.db")
+    shutil.copy(REPO_DIR / "portfolio.db", db_path)
+    env = dict(
+        os.environ,
+        DB_PATH=db_path,
+        STATIC_CACHE_DIR=os.path.join(workdir, "static_cache"),
+        EMAIL_TRANSPORT="stub",
+        WEB_CONCURRENCY=str(workers),
+        HOST="127.0.0.1",
+        PORT=str(port),
+    )
+    env.pop("DATABASE_URL", None)
+    return subprocess.Popen(
+        [sys.executable, "backend.py"],
+        cwd=REPO_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def client_loop(port: int, path: str, duration: float, results):
+    """One keep-alive client hammering `path` until the deadline"""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    completed = errors = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        try:
+            conn.request("GET", path, headers={"Accept-Encoding": "gzip"})
+            response = conn.getresponse()
+            response.read()
+            if response.status == 200:
+                completed += 1
+            else:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn.close()
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    conn.close()
+    results.put((completed, errors))
+
+
+def drive(port: int, path: str, duration: float, clients: int) -> dict:
+    results = multiprocessing.Queue()
+    procs = [
+        multiprocessing.Process(target=client_loop, args=(port, path, duration, results))
+        for _ in range(clients)
+    ]
+    for p in procs:
+        p.start()
+    totals = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    completed = sum(c for c, _ in totals)
+    errors = sum(e for _, e in totals)
+    return {"requests_per_second": round(completed / duration, 1), "errors": errors}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--clients", type=int, default=8)
+    args = parser.parse_args()
+
+    runs = {}
+    for workers in args.workers:
+        workdir = tempfile.mkdtemp(prefix="bench-workers-")
+        port = free_port()
+        server = start_server(workdir, workers, port)
+        try:
+            wait_until_ready(port, timeout=60.0)
+            runs[workers] = {
+                name: drive(port, path, args.duration, args.clients)
+                for name, path in TARGETS.items()
+            }
+        finally:
+            server.terminate()
+            server.wait()
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    baseline = runs[min(runs)]
+    scaling = {
+        workers: {
+            name: round(result[name]["requests_per_second"] / baseline[name]["requests_per_second"], 2)
+            for name in TARGETS
+        }
+        for workers, result in runs.items()
+    }
+    print(json.dumps({
+        "cpu_count": os.cpu_count(),
+        "clients": args.clients,
+        "duration_seconds": args.duration,
+        "runs": runs,
+        "speedup_vs_min_workers": scaling,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
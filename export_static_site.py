@@ -0,0 +1,218 @@
+"""
+Export the portfolio as a static snapshot for CDN / object storage hosting.
+
+Renders /, /admin, the /api/projects JSON, the resume PDF and all assets into
+an output directory. Assets get content-hashed filenames, text artifacts get
+.gz and .br variants, and manifest.json describes every artifact (file,
+hash, size, content type, cache policy, encodings).
+
+Usage:
+    python3 export_static_site.py [output_dir]
+
+Re-running only rewrites artifacts whose content changed. The backend calls
+export_site() with `only=` after admin writes when STATIC_EXPORT_DIR is set.
+"""
+import hashlib
+import json
+import os
+import secrets
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+DEFAULT_OUTPUT_DIR = "dist"
+MANIFEST_NAME = "manifest.json"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Artifact groups the backend can ask to refresh after a write
+EXPORT_GROUPS = {
+    "projects": {"index.html", "api/projects"},
+    "resume": {"api/resume/AtharvaZ"},
+}
+
+TEXT_TYPES = {"text/html", "text/css", "application/javascript", "application/json", "image/svg+xml"}
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hashed_name(logical: str, digest: str) -> str:
+    """styles.css -> styles.1a2b3c4d.css"""
+    path = Path(logical)
+    return str(path.with_name(f"{path.stem}.{digest[:8]}{path.suffix}"))
+
+
+def rewrite_references(text: str, asset_paths: dict) -> str:
+    """Point quoted references to exported assets at their hashed, absolute paths"""
+    for logical, exported in asset_paths.items():
+        text = text.replace(f'"{logical}"', f'"/{exported}"')
+    return text
+
+
+def iter_asset_sources(base_dir: Path):
+    """Top-level CSS/JS files and everything under assets/, binary files first"""
+    images = sorted(p for p in (base_dir / "assets").rglob("*") if p.is_file())
+    text = sorted(p for p in base_dir.iterdir() if p.is_file() and p.suffix in (".css", ".js"))
+    return images + text
+
+
+def load_manifest(output_dir: Path) -> dict:
+    try:
+        with open(output_dir / MANIFEST_NAME, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"artifacts": {}}
+
+
+def write_atomic(path: Path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{secrets.token_hex(4)}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+class SiteExporter:
+    """Builds artifacts from a loaded backend module and writes the changed ones"""
+
+    def __init__(self, backend, output_dir: Path):
+        self.backend = backend
+        self.output_dir = output_dir
+        self.manifest = load_manifest(output_dir)
+        self.artifacts = self.manifest.setdefault("artifacts", {})
+        self.written = 0
+        self.unchanged = 0
+
+    def asset_paths(self) -> dict:
+        """Logical asset name -> exported (hashed) file, from the manifest"""
+        return {
+            logical: meta["path"] for logical, meta in self.artifacts.items()
+            if meta.get("hashed")
+        }
+
+    def emit(self, logical: str, data: bytes, content_type: str, cache_control: str, hashed: bool = False):
+        digest = content_hash(data)
+        previous = self.artifacts.get(logical)
+        if previous and previous["sha256"] == digest and (self.output_dir / previous["path"]).exists():
+            self.unchanged += 1
+            return
+
+        exported = hashed_name(logical, digest) if hashed else logical
+        target = self.output_dir / exported
+        write_atomic(target, data)
+        encodings = []
+        if content_type in TEXT_TYPES:
+            for encoding, body in self.backend.compress_variants(data).items():
+                if encoding is None or len(body) >= len(data):
+                    continue
+                suffix = ".br" if encoding == "br" else ".gz"
+                write_atomic(target.with_name(target.name + suffix), body)
+                encodings.append(encoding)
+
+        self.artifacts[logical] = {
+            "path": exported,
+            "sha256": digest,
+            "size": len(data),
+            "content_type": content_type,
+            "cache_control": cache_control,
+            "encodings": encodings,
+            "hashed": hashed,
+        }
+        self.written += 1
+
+    def export_assets(self):
+        base_dir = self.backend.BASE_DIR
+        for source in iter_asset_sources(base_dir):
+            logical = source.relative_to(base_dir).as_posix()
+            media_type = self.backend.MEDIA_TYPES.get(source.suffix.lower(), "application/octet-stream")
+            data = source.read_bytes()
+            if media_type in TEXT_TYPES:
+                data = rewrite_references(data.decode("utf-8"), self.asset_paths()).encode("utf-8")
+            self.emit(logical, data, media_type, IMMUTABLE_CACHE_CONTROL, hashed=True)
+
+    def export_projects(self):
+        backend = self.backend
+        projects = backend.projects_cache.current()
+        self.emit("api/projects", projects.body, "application/json", backend.CACHE_CONTROL_POLICIES["api"])
+
+        template = (backend.BASE_DIR / "index.html").read_text(encoding="utf-8")
+        page = backend.render_index(template, projects.body) if backend.SSR_PROJECTS else template
+        page = rewrite_references(page, self.asset_paths())
+        self.emit("index.html", page.encode("utf-8"), "text/html", backend.CACHE_CONTROL_POLICIES["html"])
+
+    def export_admin(self):
+        template = (self.backend.BASE_DIR / "admin.html").read_text(encoding="utf-8")
+        page = rewrite_references(template, self.asset_paths())
+        self.emit("admin/index.html", page.encode("utf-8"), "text/html", self.backend.CACHE_CONTROL_POLICIES["html"])
+
+    def export_resume(self):
+        pdf_bytes, meta = self.backend.get_resume_from_db()
+        if not pdf_bytes:
+            return
+        self.emit("api/resume/AtharvaZ", pdf_bytes, meta["content_type"], self.backend.CACHE_CONTROL_POLICIES["resume"])
+
+    def save_manifest(self):
+        self.manifest["generated_at"] = datetime.now(timezone.utc).isoformat()
+        data = json.dumps(self.manifest, indent=2, sort_keys=True).encode("utf-8")
+        write_atomic(self.output_dir / MANIFEST_NAME, data)
+
+
+@contextmanager
+def export_lock(output_dir: Path):
+    """
+    Serialize exports into one directory across processes (workers, the
+    CLI), so runs never interleave their writes or overwrite each other's
+    manifest. The lock file sits next to the directory, not inside it.
+    """
+    try:
+        import fcntl
+    except ImportError:  # Windows: single-process development only
+        yield
+        return
+    output_dir.parent.mkdir(parents=True, exist_ok=True)
+    with open(f"{output_dir}.lock", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def export_site(backend, output_dir: Path, only=None) -> dict:
+    """
+    Export the site into output_dir. `only` is an optional set of group
+    names from EXPORT_GROUPS; when given, just those artifacts are rebuilt.
+    Returns a summary of what was written.
+    """
+    output_dir = Path(output_dir)
+    with export_lock(output_dir):
+        return export_locked(backend, output_dir, only)
+
+
+def export_locked(backend, output_dir: Path, only=None) -> dict:
+    exporter = SiteExporter(backend, output_dir)
+    wanted = None
+    if only:
+        wanted = set().union(*(EXPORT_GROUPS[group] for group in only))
+
+    # Assets first so pages can reference their hashed names
+    if wanted is None:
+        exporter.export_assets()
+    if wanted is None or wanted & EXPORT_GROUPS["projects"]:
+        exporter.export_projects()
+    if wanted is None:
+        exporter.export_admin()
+    if wanted is None or wanted & EXPORT_GROUPS["resume"]:
+        exporter.export_resume()
+
+    exporter.save_manifest()
+    return {"written": exporter.written, "unchanged": exporter.unchanged, "output_dir": str(exporter.output_dir)}
+
+
+if __name__ == "__main__":
+    import backend
+
+    output = Path(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_OUTPUT_DIR)
+    summary = export_site(backend, output)
+    print(f"Static export: {summary['written']} artifacts written, {summary['unchanged']} unchanged -> {summary['output_dir']}")
@@ -1,8 +1,9 @@
 import sqlite3
 import os
+import time
+import argparse
 import psycopg2
-from psycopg2.extras import DictCursor
-import json
+from psycopg2.extras import execute_values
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -12,89 +13,238 @@ load_dotenv()
 # Configuration
 SQLITE_DB_PATH = Path("portfolio.db")
 DATABASE_URL = os.getenv("DATABASE_URL")
+CHUNK_SIZE = int(os.getenv("MIGRATION_CHUNK_SIZE", "500"))
 
-def migrate():
+CHECKPOINT_TABLE = "migration_checkpoints"
+
+# Tables copied in order. Each is streamed by its primary key so an
+# interrupted run can pick up after the last committed chunk.
+TABLES = [
+    {
+        "name": "projects",
+        "key": "id",
+        "columns": ["id", "title", "desc", "tech", "links", "position", "updated_version"],
+        "conflict": "(id) DO NOTHING",
+        # Older databases predate display ordering / the change feed; the app backfills them
+        "optional_columns": {"position", "updated_version"},
+    },
+    {
+        "name": "site_config",
+        "key": "key",
+        "columns": ["key", "value"],
+        "conflict": "(key) DO UPDATE SET value = EXCLUDED.value",
+    },
+    {
+        # Only present once the app has converted the legacy base64
+        # site_config row; otherwise the app converts the copied row on
+        # its next startup
+        "name": "resume",
+        "key": "id",
+        "columns": ["id", "filename", "content_type", "data", "size", "sha256", "uploaded_at"],
+        "conflict": "(id) DO NOTHING",
+        "binary": {"data"},
+        "optional": True,
+    },
+]
+
+
+def sqlite_table_exists(sqlite_conn, name):
+    row = sqlite_conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (name,)).fetchone()
+    return row is not None
+
+
+def sqlite_columns(sqlite_conn, name):
+    return {row[1] for row in sqlite_conn.execute(f"PRAGMA table_info({name})")}
+
+
+def ensure_checkpoint_table(pg_cursor):
+    pg_cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} (
+            table_name TEXT PRIMARY KEY,
+            last_key TEXT,
+            rows_copied INTEGER NOT NULL DEFAULT 0,
+            completed BOOLEAN NOT NULL DEFAULT FALSE,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        )
+    """)
+
+
+def load_checkpoints(pg_cursor):
+    pg_cursor.execute(f"SELECT table_name, last_key, rows_copied, completed FROM {CHECKPOINT_TABLE}")
+    return {row[0]: {"last_key": row[1], "rows_copied": row[2], "completed": row[3]} for row in pg_cursor.fetchall()}
+
+
+def start_fresh_run(pg_cursor):
+    """Clear target tables and checkpoints before a full copy"""
+    print("Clearing target tables (site_config, projects, resume)...")
+    # CASCADE also clears project_tech, which the app rebuilds from projects.tech on startup
+    pg_cursor.execute("TRUNCATE TABLE site_config, projects, resume RESTART IDENTITY CASCADE;")
+    pg_cursor.execute(f"DELETE FROM {CHECKPOINT_TABLE}")
+    for table in TABLES:
+        pg_cursor.execute(
+            f"INSERT INTO {CHECKPOINT_TABLE} (table_name) VALUES (%s)",
+            (table["name"],)
+        )
+
+
+def copy_table(sqlite_conn, pg_conn, table, checkpoint, chunk_size):
+    """Stream one table in key order, committing each chunk with its checkpoint"""
+    name, key = table["name"], table["key"]
+    optional = table.get("optional_columns", set())
+    present = sqlite_columns(sqlite_conn, name)
+    columns = [c for c in table["columns"] if c in present or c not in optional]
+    binary = table.get("binary", set())
+    quoted = ", ".join(f'"{c}"' for c in columns)
+
+    select_sql = f'SELECT {quoted} FROM {name}'
+    params = ()
+    if checkpoint["last_key"] is not None:
+        select_sql += f' WHERE "{key}" > ?'
+        last_key = checkpoint["last_key"]
+        params = (int(last_key) if key == "id" else last_key,)
+    select_sql += f' ORDER BY "{key}"'
+
+    insert_sql = f'INSERT INTO {name} ({quoted}) VALUES %s ON CONFLICT {table["conflict"]}'
+    key_index = columns.index(key)
+    copied = checkpoint["rows_copied"]
+    started = time.perf_counter()
+    this_run = 0
+
+    sqlite_cursor = sqlite_conn.execute(select_sql, params)
+    with pg_conn.cursor() as pg_cursor:
+        while True:
+            rows = sqlite_cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            values = [
+                tuple(psycopg2.Binary(v) if c in binary and v is not None else v for c, v in zip(columns, row))
+                for row in rows
+            ]
+            execute_values(pg_cursor, insert_sql, values, page_size=chunk_size)
+            copied += len(rows)
+            this_run += len(rows)
+            pg_cursor.execute(
+                f"UPDATE {CHECKPOINT_TABLE} SET last_key = %s, rows_copied = %s, updated_at = NOW() WHERE table_name = %s",
+                (str(rows[-1][key_index]), copied, name)
+            )
+            pg_conn.commit()
+
+        pg_cursor.execute(
+            f"UPDATE {CHECKPOINT_TABLE} SET completed = TRUE, updated_at = NOW() WHERE table_name = %s",
+            (name,)
+        )
+        pg_conn.commit()
+
+    elapsed = time.perf_counter() - started
+    rate = this_run / elapsed if elapsed > 0 else 0.0
+    print(f"Migrated {this_run} {name} rows ({copied} total) in {elapsed:.2f}s ({rate:.0f} rows/sec).")
+    return this_run
+
+
+def reset_project_sequence(pg_conn):
+    """Move projects_id_seq past the copied ids so new inserts don't collide"""
+    with pg_conn.cursor() as pg_cursor:
+        pg_cursor.execute("SELECT setval('projects_id_seq', (SELECT COALESCE(MAX(id), 0) + 1 FROM projects), false)")
+        value = pg_cursor.fetchone()[0]
+    pg_conn.commit()
+    print(f"Reset projects_id_seq; next id is {value}.")
+
+
+def migrate(sqlite_path=None, database_url=None, chunk_size=CHUNK_SIZE, restart=False):
+    """
+    Copy portfolio data from SQLite into PostgreSQL.
+
+    Rows are streamed in chunks of `chunk_size` and bulk inserted; every
+    chunk is committed together with a checkpoint, so rerunning after a
+    failure resumes where it stopped. A run that finished cleanly (or
+    `restart=True`) starts over from empty tables. Returns True on success.
+    """
+    sqlite_path = Path(sqlite_path or SQLITE_DB_PATH)
+    database_url = database_url or DATABASE_URL
     print("Starting migration from SQLite to PostgreSQL...")
 
     # 1. Validate Configuration
-    if not SQLITE_DB_PATH.exists():
-        print(f"Error: SQLite database not found at {SQLITE_DB_PATH}")
-        return
+    if not sqlite_path.exists():
+        print(f"Error: SQLite database not found at {sqlite_path}")
+        return False
 
-    if not DATABASE_URL or not DATABASE_URL.startswith(("postgres://", "postgresql://")):
+    if not database_url or not database_url.startswith(("postgres://", "postgresql://")):
         print("Error: DATABASE_URL not set or not a PostgreSQL URL.")
         print("Please set DATABASE_URL in your .env file or environment.")
-        return
+        return False
 
     # Fix postgres:// schema if needed
-    pg_url = DATABASE_URL.replace("postgres://", "postgresql://", 1)
+    pg_url = database_url.replace("postgres://", "postgresql://", 1)
 
+    sqlite_conn = None
+    pg_conn = None
     try:
         # 2. Connect to SQLite
-        print(f"Connecting to SQLite: {SQLITE_DB_PATH}")
-        sqlite_conn = sqlite3.connect(SQLITE_DB_PATH)
-        sqlite_conn.row_factory = sqlite3.Row
-        sqlite_cursor = sqlite_conn.cursor()
+        print(f"Connecting to SQLite: {sqlite_path}")
+        sqlite_conn = sqlite3.connect(sqlite_path)
 
         # 3. Connect to PostgreSQL
+        # Note: We assume tables are created by the backend app (SQLAlchemy) already.
         print("Connecting to PostgreSQL...")
         pg_conn = psycopg2.connect(pg_url)
-        pg_cursor = pg_conn.cursor()
 
-        # 4. Clear existing data in Postgres (Optional, but good for idempotency if tables exist)
-        # Note: We assume tables are created by the backend app (SQLAlchemy) already.
-        # If not, we might fail. The user instructions imply running migration to transfer data.
-        # Usually, one would run the app once to create schema, then migrate data.
-        print("Clearing target tables (site_config, projects)...")
-        pg_cursor.execute("TRUNCATE TABLE site_config, projects RESTART IDENTITY;")
-
-        # 5. Migrate Projects
-        print("Migrating projects...")
-        sqlite_cursor.execute("SELECT id, title, desc, tech, links FROM projects")
-        projects = sqlite_cursor.fetchall()
-        
-        for p in projects:
-            # We insert with specific ID to preserve relationships/URLs
-            pg_cursor.execute(
-                """
-                INSERT INTO projects (id, title, "desc", tech, links) 
-                VALUES (%s, %s, %s, %s, %s)
-                """,
-                (p['id'], p['title'], p['desc'], p['tech'], p['links'])
-            )
-        
-        print(f"Migrated {len(projects)} projects.")
+        # 4. Fresh run or resume from checkpoints
+        with pg_conn.cursor() as pg_cursor:
+            ensure_checkpoint_table(pg_cursor)
+            checkpoints = load_checkpoints(pg_cursor)
+            resuming = bool(checkpoints) and not all(c["completed"] for c in checkpoints.values()) and not restart
+            if resuming:
+                print("Resuming previous migration from checkpoints...")
+            else:
+                start_fresh_run(pg_cursor)
+                checkpoints = load_checkpoints(pg_cursor)
+        pg_conn.commit()
 
-        # 6. Migrate Site Config (Resume etc)
-        print("Migrating site configuration...")
-        sqlite_cursor.execute("SELECT key, value FROM site_config")
-        configs = sqlite_cursor.fetchall()
+        # 5. Stream each table
+        started = time.perf_counter()
+        total = 0
+        for table in TABLES:
+            checkpoint = checkpoints.get(table["name"], {"last_key": None, "rows_copied": 0, "completed": False})
+            if checkpoint["completed"]:
+                print(f"Skipping {table['name']}: already migrated.")
+                continue
+            if table.get("optional") and not sqlite_table_exists(sqlite_conn, table["name"]):
+                with pg_conn.cursor() as pg_cursor:
+                    pg_cursor.execute(
+                        f"UPDATE {CHECKPOINT_TABLE} SET completed = TRUE, updated_at = NOW() WHERE table_name = %s",
+                        (table["name"],)
+                    )
+                pg_conn.commit()
+                continue
+            print(f"Migrating {table['name']}...")
+            total += copy_table(sqlite_conn, pg_conn, table, checkpoint, chunk_size)
 
-        for c in configs:
-            pg_cursor.execute(
-                """
-                INSERT INTO site_config (key, value) 
-                VALUES (%s, %s)
-                ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value
-                """,
-                (c['key'], c['value'])
-            )
-            
-        print(f"Migrated {len(configs)} config items.")
+        # 6. Fix the id sequence (replaces the manual /api/admin/fix-sequence call)
+        reset_project_sequence(pg_conn)
 
-        # 7. Commit and Close
-        pg_conn.commit()
-        print("Migration committed successfully!")
+        elapsed = time.perf_counter() - started
+        rate = total / elapsed if elapsed > 0 else 0.0
+        print(f"Migration committed successfully! {total} rows in {elapsed:.2f}s ({rate:.0f} rows/sec).")
+        return True
 
     except Exception as e:
         print(f"Migration failed: {e}")
-        if 'pg_conn' in locals() and pg_conn:
+        print("Committed chunks are checkpointed; rerun to resume.")
+        if pg_conn:
             pg_conn.rollback()
+        return False
     finally:
-        if 'sqlite_conn' in locals() and sqlite_conn:
+        if sqlite_conn:
             sqlite_conn.close()
-        if 'pg_conn' in locals() and pg_conn:
+        if pg_conn:
             pg_conn.close()
 
+
 if __name__ == "__main__":
-    migrate()
+    parser = argparse.ArgumentParser(description="Copy portfolio data from SQLite to PostgreSQL")
+    parser.add_argument("--sqlite-path", default=str(SQLITE_DB_PATH))
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--restart", action="store_true", help="ignore checkpoints and copy everything again")
+    args = parser.parse_args()
+    ok = migrate(args.sqlite_path, chunk_size=args.chunk_size, restart=args.restart)
+    raise SystemExit(0 if ok else 1)
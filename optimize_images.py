@@ -0,0 +1,144 @@
+"""
+Responsive image variants for assets/.
+
+For every PNG/JPEG under assets/, writes AVIF, WebP and PNG copies at each
+of IMAGE_WIDTHS (never upscaled), plus AVIF and WebP at the native width for
+requests without ?w=, into the output directory, and describes them in
+images.json. Sources whose hash and settings match the manifest are
+skipped, so reruns only re-encode images that changed. The backend serves
+these from serve_static, picking the format from the Accept header.
+
+Requires Pillow. AVIF needs Pillow >= 11.3 (or pillow-avif-plugin); any
+format the installed Pillow cannot encode is skipped.
+
+Usage:
+    python3 optimize_images.py [output_dir]
+"""
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+MANIFEST_NAME = "images.json"
+SOURCE_EXTENSIONS = {".png", ".jpg", ".jpeg"}
+
+# Tech-stack icons render at 2.5-5rem (40-80px), so cover 1x-3x densities
+IMAGE_WIDTHS = tuple(int(w) for w in os.getenv("IMAGE_WIDTHS", "80,160,240").split(","))
+
+# Best first; the backend offers them in this order
+FORMATS = {
+    "avif": {"media_type": "image/avif", "pillow": "AVIF", "options": {"quality": 60, "speed": 6}},
+    "webp": {"media_type": "image/webp", "pillow": "WEBP", "options": {"quality": 80, "method": 6}},
+    "png": {"media_type": "image/png", "pillow": "PNG", "options": {"optimize": True}},
+}
+
+
+def supported_formats() -> list:
+    from PIL import features
+    checks = {"avif": "avif", "webp": "webp"}
+    return [name for name in FORMATS if name not in checks or features.check(checks[name])]
+
+
+def source_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def load_manifest(output_dir: Path) -> dict:
+    try:
+        with open(output_dir / MANIFEST_NAME, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {"images": {}}
+
+
+def write_atomic(path: Path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def encode(image, fmt: str) -> bytes:
+    from io import BytesIO
+    buffer = BytesIO()
+    spec = FORMATS[fmt]
+    image.save(buffer, spec["pillow"], **spec["options"])
+    return buffer.getvalue()
+
+
+def build_image(source: Path, logical: str, digest: str, output_dir: Path, formats: list) -> dict:
+    from PIL import Image
+
+    with Image.open(source) as original:
+        original.load()
+        width, height = original.size
+        if original.mode not in ("RGB", "RGBA"):
+            original = original.convert("RGBA")
+        widths = sorted({min(w, width) for w in IMAGE_WIDTHS})
+        # Full-size conversions only; the original already covers PNG/JPEG at native width
+        native = [] if width in widths else [width]
+        variants = []
+        for target_width in widths + native:
+            target_height = max(1, round(height * target_width / width))
+            resized = original if target_width == width else original.resize((target_width, target_height), Image.LANCZOS)
+            for fmt in formats:
+                if target_width in native and fmt == "png":
+                    continue
+                data = encode(resized, fmt)
+                name = f"{Path(logical).stem}.{target_width}.{hashlib.sha256(data).hexdigest()[:8]}.{fmt}"
+                write_atomic(output_dir / name, data)
+                variants.append({
+                    "format": fmt,
+                    "media_type": FORMATS[fmt]["media_type"],
+                    "width": target_width,
+                    "height": target_height,
+                    "file": name,
+                    "size": len(data),
+                    "native": target_width in native,
+                })
+    return {"sha256": digest, "width": width, "height": height, "variants": variants}
+
+
+def build_variants(base_dir: Path, output_dir: Path, log=print) -> dict:
+    """
+    Bring output_dir up to date with base_dir/assets and return the
+    manifest. Files from replaced variants are removed.
+    """
+    output_dir = Path(output_dir)
+    manifest = load_manifest(output_dir)
+    formats = supported_formats()
+    settings = {"widths": list(IMAGE_WIDTHS), "formats": formats, "native": True}
+    previous = manifest.get("images", {}) if manifest.get("settings") == settings else {}
+
+    images = {}
+    encoded = 0
+    for source in sorted((Path(base_dir) / "assets").rglob("*")):
+        if not source.is_file() or source.suffix.lower() not in SOURCE_EXTENSIONS:
+            continue
+        logical = source.relative_to(base_dir).as_posix()
+        digest = source_hash(source)
+        entry = previous.get(logical)
+        if entry and entry["sha256"] == digest and all((output_dir / v["file"]).exists() for v in entry["variants"]):
+            images[logical] = entry
+            continue
+        images[logical] = build_image(source, logical, digest, output_dir, formats)
+        encoded += 1
+
+    manifest = {"settings": settings, "images": images}
+    write_atomic(output_dir / MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"))
+
+    keep = {v["file"] for entry in images.values() for v in entry["variants"]} | {MANIFEST_NAME}
+    for stale in output_dir.iterdir():
+        if stale.is_file() and stale.name not in keep and not stale.name.endswith(".tmp"):
+            stale.unlink(missing_ok=True)
+
+    log(f"Image variants: {encoded} of {len(images)} images encoded ({', '.join(formats)}) in {output_dir}")
+    return manifest
+
+
+if __name__ == "__main__":
+    base = Path(__file__).parent
+    default_output = os.getenv("IMAGE_VARIANTS_DIR", str(base / ".static_cache" / "images"))
+    output = Path(sys.argv[1] if len(sys.argv) > 1 else default_output)
+    build_variants(base, output)
@@ -195,6 +195,18 @@ document.addEventListener("DOMContentLoaded", async () => {
     : window.location.origin + "/api";
 
   const getProjects = async () => {
+    // Server-rendered pages inline the project list, saving a round-trip
+    const bootstrap = document.getElementById("projects-bootstrap");
+    if (bootstrap) {
+      try {
+        const data = JSON.parse(bootstrap.textContent);
+        if (data.success) {
+          return data.projects;
+        }
+      } catch (error) {
+        console.error("Error parsing projects bootstrap:", error);
+      }
+    }
     try {
       const response = await fetch(`${API_URL}/projects`);
       const data = await response.json();
@@ -215,6 +227,11 @@ document.addEventListener("DOMContentLoaded", async () => {
       return;
     }
 
+    // Cards are already in the HTML and observed by the scroll-reveal loop above
+    if (projectsContainer.dataset.ssr === "true") {
+      return;
+    }
+
     projectsContainer.innerHTML = "";
     const projects = await getProjects();
     console.log("Loaded projects:", projects);
@@ -319,6 +336,27 @@ document.addEventListener("DOMContentLoaded", async () => {
     ]
   };
 
+  // Versioned, width-specific URLs for images the server has variants of
+  // (the server picks AVIF/WebP/PNG from the Accept header)
+  const imageVariants = (() => {
+    const manifest = document.getElementById("image-variants");
+    if (!manifest) return {};
+    try {
+      return JSON.parse(manifest.textContent);
+    } catch (error) {
+      console.error("Error parsing image variants:", error);
+      return {};
+    }
+  })();
+
+  const imageSourceAttrs = (src, displaySize) => {
+    const entry = imageVariants[src];
+    if (!entry) return `src="${src}"`;
+    const url = (width) => `${src}?w=${width}&v=${entry.v}`;
+    const srcset = entry.widths.map((width) => `${url(width)} ${width}w`).join(", ");
+    return `src="${url(entry.widths[entry.widths.length - 1])}" srcset="${srcset}" sizes="${displaySize}"`;
+  };
+
   const skillsContainer = document.getElementById("skills-wrapper");
   if (skillsContainer) {
     // Clear existing content
@@ -345,7 +383,8 @@ document.addEventListener("DOMContentLoaded", async () => {
         if (skill.img) {
           const enlargedClass = skill.enlarged ? "enlarged-icon" : "";
           const extraLargeClass = skill.extraLarge ? "extra-enlarged-icon" : "";
-          iconContent = `<img src="${skill.img}" alt="${skill.name}" class="skill-icon-img ${enlargedClass} ${extraLargeClass}" />`;
+          const displaySize = skill.extraLarge ? "5rem" : skill.enlarged ? "3.5rem" : "2.5rem";
+          iconContent = `<img ${imageSourceAttrs(skill.img, displaySize)} alt="${skill.name}" class="skill-icon-img ${enlargedClass} ${extraLargeClass}" loading="lazy" decoding="async" />`;
         } else {
           iconContent = `<i class="${skill.icon}"></i>`;
         }
@@ -0,0 +1,72 @@
+"""Concurrency of POST /api/projects/batch against a throwaway copy of portfolio.db"""
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+_workdir = tempfile.TemporaryDirectory(prefix="portfolio-test-")
+shutil.copy(REPO_DIR / "portfolio.db", os.path.join(_workdir.name, "portfolio.db"))
+os.environ["DB_PATH"] = os.path.join(_workdir.name, "portfolio.db")
+os.environ["SETUP_LOCK_PATH"] = os.path.join(_workdir.name, "setup.lock")
+os.environ.pop("DATABASE_URL", None)
+sys.path.insert(0, str(REPO_DIR))
+
+import backend  # noqa: E402
+from fastapi import HTTPException  # noqa: E402
+
+
+def teardown_module():
+    backend.engine.dispose()
+    _workdir.cleanup()
+
+
+def make_batch(expected_version: int, title: str) -> "backend.ProjectBatch":
+    return backend.ProjectBatch(
+        operations=[{"op": "create", "project": {"title": title, "desc": "d", "tech": ["Python"], "links": {}}}],
+        expected_version=expected_version,
+    )
+
+
+def apply_in_thread(batch, outcome: dict) -> threading.Thread:
+    def run():
+        try:
+            outcome["result"] = backend.with_session(backend.apply_project_batch, batch)
+        except HTTPException as e:
+            outcome["status"] = e.status_code
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_expected_version_is_checked_under_the_version_lock():
+    expected = backend.with_session(backend.read_projects_version)
+
+    # A competing writer bumps the version but has not committed yet
+    competitor = backend.SessionLocal()
+    backend.bump_projects_version(competitor)
+    outcome = {}
+    thread = apply_in_thread(make_batch(expected, "Loses the race"), outcome)
+    time.sleep(0.3)  # Let the batch block on the version row
+    competitor.commit()
+    competitor.close()
+    thread.join(10)
+
+    assert outcome == {"status": 409}
+    titles = backend.with_session(lambda db: [p.title for p in db.query(backend.ProjectModel)])
+    assert "Loses the race" not in titles
+
+
+def test_only_one_of_two_concurrent_batches_commits():
+    expected = backend.with_session(backend.read_projects_version)
+    outcomes = [{}, {}]
+    threads = [apply_in_thread(make_batch(expected, f"Concurrent {i}"), outcomes[i]) for i in range(2)]
+    for thread in threads:
+        thread.join(10)
+
+    assert sorted("result" in o for o in outcomes) == [False, True]
+    assert [o["status"] for o in outcomes if "status" in o] == [409]
+    assert backend.with_session(backend.read_projects_version) == expected + 1